@@ -0,0 +1,414 @@
+"""Asynchronous App Store Connect API client."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from typing import Any, TypeVar
+
+from slowlane.asc.client import (
+    MAX_PAGE_SIZE,
+    QUOTA_PROBE_PARAMS,
+    beta_tester_invite_payload,
+    page_size_for,
+    response_cache_for,
+)
+from slowlane.asc.jsonapi import IncludedResolver, query_params, resolve_document
+from slowlane.auth.jwt_auth import JWTAuth
+from slowlane.auth.middleware import AsyncAuthMiddleware
+from slowlane.auth.session_auth import SessionAuth
+from slowlane.core.concurrency import (
+    DEFAULT_INITIAL_LIMIT,
+    AsyncAdaptiveLimiter,
+    async_bulk_map,
+)
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.http import AsyncAppleHTTPClient
+from slowlane.core.memcache import CacheStats
+from slowlane.core.prefetch import async_read_ahead
+from slowlane.core.ratelimit import (
+    RATE_LIMIT_HEADER,
+    RateLimitStatus,
+    get_rate_limiter,
+    parse_rate_limit_header,
+)
+from slowlane.core.singleflight import SingleFlightStats
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncAppStoreConnectClient:
+    """Async twin of :class:`~slowlane.asc.client.AppStoreConnectClient`.
+
+    Every API method is a coroutine, so callers can ``asyncio.gather`` many
+    lookups over the same pooled connections.
+    """
+
+    BASE_URL = "https://api.appstoreconnect.apple.com/v1"
+
+    def __init__(
+        self,
+        jwt_auth: JWTAuth | None = None,
+        session_auth: SessionAuth | None = None,
+        config: SlowlaneConfig | None = None,
+        prefetch_pages: int = 0,
+        background_token_refresh: bool = False,
+    ) -> None:
+        """Initialize client with authentication.
+
+        Args:
+            jwt_auth: JWT authentication (preferred for API)
+            session_auth: Session cookie authentication (fallback)
+            config: Configuration for HTTP client
+            prefetch_pages: Pages to fetch ahead while listings are consumed
+            background_token_refresh: Mint JWTs on a background thread so
+                concurrent workers never wait on signing
+        """
+        self._jwt_auth = jwt_auth
+        self._session_auth = session_auth
+        self._config = config or SlowlaneConfig.load()
+        self._prefetch_pages = prefetch_pages
+
+        http_config = self._config.http
+        # Apple meters requests per API key, so clients sharing a key share a budget
+        rate_limiter = None
+        if jwt_auth:
+            rate_limiter = get_rate_limiter(jwt_auth.key_id, shared=http_config.shared_quota)
+        # Adaptive in-flight window for this client's event loop
+        concurrency = None
+        if http_config.adaptive_concurrency:
+            max_limit = http_config.max_concurrency
+            concurrency = AsyncAdaptiveLimiter(
+                initial=min(DEFAULT_INITIAL_LIMIT, max_limit), max_limit=max_limit
+            )
+        # The middleware attaches a current JWT to every request and renews it on 401
+        self._http = AsyncAuthMiddleware(
+            AsyncAppleHTTPClient(
+                config=http_config,
+                rate_limiter=rate_limiter,
+                memory_cache=response_cache_for(http_config),
+                concurrency=concurrency,
+            ),
+            jwt_auth,
+        )
+
+        # Set up auth
+        self._background_token_refresh = bool(jwt_auth and background_token_refresh)
+        if jwt_auth:
+            if self._background_token_refresh:
+                jwt_auth.start_background_refresh()
+        elif session_auth:
+            self._http.set_cookies(session_auth.cookies)
+
+    async def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make GET request to API."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        return await self._http.get_json(url, params=params)
+
+    async def _post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Make POST request to API."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        return await self._http.post_json(url, data)
+
+    async def _fetch_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        page_size: int,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Request pages one after another, following ``links.next``."""
+        params = dict(params or {})
+        params["limit"] = min(page_size, MAX_PAGE_SIZE)
+
+        next_url: str | None = f"{self.BASE_URL}/{endpoint}"
+
+        while next_url:
+            response = await self._http.get_json(
+                next_url, params=params if next_url.startswith(self.BASE_URL) else None
+            )
+
+            yield response
+
+            # Get next page URL
+            links = response.get("links", {})
+            next_url = links.get("next")
+            params = {}  # Params are included in next URL
+
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield raw response documents page by page, following ``links.next``.
+
+        With ``prefetch`` > 0 a background task keeps up to that many pages
+        fetched ahead of the caller.
+        """
+        depth = self._prefetch_pages if prefetch is None else prefetch
+        return async_read_ahead(self._fetch_pages(endpoint, params, page_size), depth)
+
+    async def iter_resources(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int | None = None,
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """Yield resources one at a time as each page arrives, with no upper limit.
+
+        Resources side-loaded through ``include`` are attached to their
+        parents' relationships using a per-page identity map.
+        """
+        pages = self.iter_pages(endpoint, params=params, page_size=page_size, prefetch=prefetch)
+        async with aclosing(pages):
+            async for page in pages:
+                resolver = IncludedResolver(page.get("included"))
+                for item in page.get("data", []):
+                    yield resolver.resolve(item)
+
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        limit: int | None = 50,
+    ) -> list[dict[str, Any]]:
+        """Fetch up to ``limit`` results (all of them when ``limit`` is None)."""
+        results: list[dict[str, Any]] = []
+        if limit is not None and limit <= 0:
+            return results
+
+        pages = self.iter_resources(endpoint, params=params, page_size=page_size_for(limit))
+        async with aclosing(pages):
+            async for item in pages:
+                results.append(item)
+                if limit is not None and len(results) >= limit:
+                    break
+
+        return results
+
+    async def _get_resource(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """GET a resource (or collection) with included resources attached."""
+        response = await self._get(endpoint, params=params or None)
+        return resolve_document(response)
+
+    # Apps
+    async def list_apps(
+        self,
+        limit: int | None = 50,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List apps for the team (all of them when ``limit`` is None)."""
+        params = query_params(fields, include, include_limits)
+        return await self._paginate("apps", params=params, limit=limit)
+
+    async def get_app(
+        self,
+        app_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
+        """Get a specific app by ID."""
+        params = query_params(fields, include, include_limits)
+        return await self._get_resource(f"apps/{app_id}", params) or {}
+
+    async def get_app_by_bundle_id(
+        self,
+        bundle_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any] | None:
+        """Find an app by bundle ID."""
+        data = await self._get_resource(
+            "apps",
+            params={
+                "filter[bundleId]": bundle_id,
+                **query_params(fields, include, include_limits),
+            },
+        )
+        return data[0] if data else None
+
+    # Builds
+    async def list_builds(
+        self,
+        app_id: str | None = None,
+        limit: int | None = 25,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List builds, optionally filtered by app."""
+        params = query_params(fields, include, include_limits)
+        if app_id:
+            params["filter[app]"] = app_id
+
+        return await self._paginate("builds", params=params, limit=limit)
+
+    async def get_build(
+        self,
+        build_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
+        """Get a specific build by ID."""
+        params = query_params(fields, include, include_limits)
+        return await self._get_resource(f"builds/{build_id}", params) or {}
+
+    async def get_latest_build(
+        self,
+        app_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get the most recent build for an app."""
+        builds = await self.list_builds(
+            app_id=app_id, limit=1, fields=fields, include=include, include_limits=include_limits
+        )
+        return builds[0] if builds else None
+
+    # TestFlight
+    async def list_beta_testers(
+        self,
+        app_id: str | None = None,
+        limit: int | None = 50,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List beta testers."""
+        params = query_params(fields, include, include_limits)
+        if app_id:
+            params["filter[apps]"] = app_id
+
+        return await self._paginate("betaTesters", params=params, limit=limit)
+
+    async def get_beta_tester(
+        self,
+        tester_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
+        """Get a specific beta tester."""
+        params = query_params(fields, include, include_limits)
+        return await self._get_resource(f"betaTesters/{tester_id}", params) or {}
+
+    async def list_beta_groups(
+        self,
+        app_id: str | None = None,
+        limit: int | None = 100,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List beta groups."""
+        params = query_params(fields, include, include_limits)
+        if app_id:
+            params["filter[app]"] = app_id
+
+        return await self._paginate("betaGroups", params=params, limit=limit)
+
+    async def get_beta_group(
+        self,
+        group_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
+        """Get a specific beta group."""
+        params = query_params(fields, include, include_limits)
+        return await self._get_resource(f"betaGroups/{group_id}", params) or {}
+
+    async def invite_beta_tester(
+        self,
+        email: str,
+        group_id: str,
+        first_name: str | None = None,
+        last_name: str | None = None,
+    ) -> dict[str, Any]:
+        """Invite a tester to a beta group."""
+        data = beta_tester_invite_payload(email, group_id, first_name, last_name)
+
+        response = await self._post("betaTesters", data)
+        tester: dict[str, Any] = response.get("data", {})
+        return tester
+
+    async def add_tester_to_group(self, tester_id: str, group_id: str) -> None:
+        """Add an existing tester to a beta group."""
+        data = {"data": [{"type": "betaTesters", "id": tester_id}]}
+        await self._http.post(
+            f"{self.BASE_URL}/betaGroups/{group_id}/relationships/betaTesters",
+            json=data,
+        )
+
+    # Bundle IDs
+    async def list_bundle_ids(
+        self,
+        limit: int | None = 50,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List registered bundle IDs."""
+        params = query_params(fields, include, include_limits)
+        return await self._paginate("bundleIds", params=params, limit=limit)
+
+    async def get_bundle_id(
+        self,
+        bundle_id_resource_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
+        """Get a specific bundle ID resource."""
+        params = query_params(fields, include, include_limits)
+        return await self._get_resource(f"bundleIds/{bundle_id_resource_id}", params) or {}
+
+    # Quota
+
+    async def get_rate_limit(self) -> RateLimitStatus | None:
+        """Read the API key's hourly budget from one minimal request."""
+        response = await self._http.get(f"{self.BASE_URL}/apps", params=QUOTA_PROBE_PARAMS)
+        return parse_rate_limit_header(response.headers.get(RATE_LIMIT_HEADER))
+
+    async def map_concurrent(self, fn: Callable[[T], Awaitable[R]], items: Iterable[T]) -> list[R]:
+        """Await ``fn`` over ``items`` concurrently, returning results in input order.
+
+        Requests made by ``fn`` through this client are paced by the adaptive
+        concurrency window, so throughput settles at what Apple accepts.
+        """
+        return await async_bulk_map(fn, items, workers=self._config.http.max_concurrency)
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit, miss and eviction counters of the in-memory cache, if enabled."""
+        return self._http.memory_cache_stats
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        """Counters for GETs that shared an identical in-flight request."""
+        return self._http.coalescing_stats
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        if self._background_token_refresh and self._jwt_auth:
+            self._jwt_auth.stop_background_refresh()
+        await self._http.close()
+
+    async def __aenter__(self) -> AsyncAppStoreConnectClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
@@ -2,12 +2,94 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, TypeVar
 
+from slowlane.asc.jsonapi import IncludedResolver, query_params, resolve_document
 from slowlane.auth.jwt_auth import JWTAuth
+from slowlane.auth.middleware import AuthMiddleware
 from slowlane.auth.session_auth import SessionAuth
-from slowlane.core.config import SlowlaneConfig
+from slowlane.core.concurrency import bulk_map, get_concurrency_limiter
+from slowlane.core.config import HttpConfig, SlowlaneConfig
 from slowlane.core.http import AppleHTTPClient
+from slowlane.core.memcache import CacheStats, ResponseCache
+from slowlane.core.prefetch import read_ahead
+from slowlane.core.ratelimit import (
+    RATE_LIMIT_HEADER,
+    RateLimitStatus,
+    get_rate_limiter,
+    parse_rate_limit_header,
+)
+from slowlane.core.singleflight import SingleFlightStats
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Largest page the API will return
+MAX_PAGE_SIZE = 200
+
+# Default in-memory cache lifetimes (seconds) per resource type; rarely
+# changing resources live longer, anything unlisted is not cached.
+CACHE_TTLS: dict[str, int] = {
+    "apps": 300,
+    "bundleIds": 300,
+    "betaGroups": 60,
+    "builds": 30,
+    "betaTesters": 30,
+}
+
+# Cheapest request that still returns the X-Rate-Limit header
+QUOTA_PROBE_PARAMS: dict[str, Any] = {"limit": 1, "fields[apps]": "name"}
+
+
+def response_cache_for(http_config: HttpConfig | None) -> ResponseCache | None:
+    """Build the in-memory response cache configured for ASC clients, if enabled."""
+    if http_config is None or not http_config.memory_cache:
+        return None
+    return ResponseCache(
+        ttls={**CACHE_TTLS, **http_config.memory_cache_ttls},
+        max_entries=http_config.memory_cache_size,
+    )
+
+
+def page_size_for(limit: int | None) -> int:
+    """Page size to request for a listing capped at ``limit`` items."""
+    return MAX_PAGE_SIZE if limit is None else min(limit, MAX_PAGE_SIZE)
+
+
+def _collect(items: Iterable[dict[str, Any]], limit: int | None) -> list[dict[str, Any]]:
+    """Materialize up to ``limit`` items (all of them when ``limit`` is None)."""
+    return list(items if limit is None else islice(items, limit))
+
+
+def beta_tester_invite_payload(
+    email: str,
+    group_id: str,
+    first_name: str | None = None,
+    last_name: str | None = None,
+) -> dict[str, Any]:
+    """Build the JSON:API body for inviting a tester to a beta group."""
+    data: dict[str, Any] = {
+        "data": {
+            "type": "betaTesters",
+            "attributes": {
+                "email": email,
+            },
+            "relationships": {
+                "betaGroups": {
+                    "data": [{"type": "betaGroups", "id": group_id}]
+                }
+            },
+        }
+    }
+
+    if first_name:
+        data["data"]["attributes"]["firstName"] = first_name
+    if last_name:
+        data["data"]["attributes"]["lastName"] = last_name
+
+    return data
 
 
 class AppStoreConnectClient:
@@ -20,6 +102,8 @@ def __init__(
         jwt_auth: JWTAuth | None = None,
         session_auth: SessionAuth | None = None,
         config: SlowlaneConfig | None = None,
+        prefetch_pages: int = 0,
+        background_token_refresh: bool = False,
     ) -> None:
         """Initialize client with authentication.
 
@@ -27,133 +111,348 @@ def __init__(
             jwt_auth: JWT authentication (preferred for API)
             session_auth: Session cookie authentication (fallback)
             config: Configuration for HTTP client
+            prefetch_pages: Pages to fetch ahead while listings are consumed
+            background_token_refresh: Mint JWTs on a background thread so
+                concurrent workers never wait on signing
         """
         self._jwt_auth = jwt_auth
         self._session_auth = session_auth
         self._config = config or SlowlaneConfig.load()
+        self._prefetch_pages = prefetch_pages
 
-        http_config = self._config.http if self._config else None
-        self._http = AppleHTTPClient(config=http_config)
+        http_config = self._config.http
+        # Apple meters requests per API key, so clients sharing a key share a budget
+        rate_limiter = None
+        if jwt_auth:
+            rate_limiter = get_rate_limiter(jwt_auth.key_id, shared=http_config.shared_quota)
+        # Adaptive in-flight window, shared by every client using the same key
+        concurrency = None
+        if http_config.adaptive_concurrency:
+            identity = jwt_auth.key_id if jwt_auth else "session"
+            concurrency = get_concurrency_limiter(identity, http_config.max_concurrency)
+        # The middleware attaches a current JWT to every request and renews it on 401
+        self._http = AuthMiddleware(
+            AppleHTTPClient(
+                config=http_config,
+                rate_limiter=rate_limiter,
+                memory_cache=response_cache_for(http_config),
+                concurrency=concurrency,
+            ),
+            jwt_auth,
+        )
 
         # Set up auth
+        self._background_token_refresh = bool(jwt_auth and background_token_refresh)
         if jwt_auth:
-            self._http.set_jwt_token(jwt_auth.get_token())
+            if self._background_token_refresh:
+                jwt_auth.start_background_refresh()
         elif session_auth:
             self._http.set_cookies(session_auth.cookies)
 
-    def _refresh_token_if_needed(self) -> None:
-        """Refresh JWT token if using JWT auth."""
-        if self._jwt_auth:
-            self._http.set_jwt_token(self._jwt_auth.get_token())
-
     def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make GET request to API."""
-        self._refresh_token_if_needed()
         url = f"{self.BASE_URL}/{endpoint}"
         return self._http.get_json(url, params=params)
 
     def _post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """Make POST request to API."""
-        self._refresh_token_if_needed()
         url = f"{self.BASE_URL}/{endpoint}"
         return self._http.post_json(url, data)
 
-    def _paginate(
+    def _fetch_pages(
         self,
         endpoint: str,
-        params: dict[str, Any] | None = None,
-        limit: int = 50,
-    ) -> list[dict[str, Any]]:
-        """Fetch all pages of results."""
-        params = params or {}
-        params["limit"] = min(limit, 200)  # API max is 200
+        params: dict[str, Any] | None,
+        page_size: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Request pages one after another, following ``links.next``."""
+        params = dict(params or {})
+        params["limit"] = min(page_size, MAX_PAGE_SIZE)
 
-        all_data: list[dict[str, Any]] = []
         next_url: str | None = f"{self.BASE_URL}/{endpoint}"
 
-        while next_url and len(all_data) < limit:
-            self._refresh_token_if_needed()
-            response = self._http.get_json(next_url, params=params if next_url.startswith(self.BASE_URL) else None)
+        while next_url:
+            response = self._http.get_json(
+                next_url, params=params if next_url.startswith(self.BASE_URL) else None
+            )
 
-            data = response.get("data", [])
-            all_data.extend(data)
+            yield response
 
             # Get next page URL
             links = response.get("links", {})
             next_url = links.get("next")
             params = {}  # Params are included in next URL
 
-        return all_data[:limit]
+    def iter_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield raw response documents page by page, following ``links.next``.
+
+        Without read-ahead each page is requested only when the previous one
+        has been consumed. With ``prefetch`` > 0 a background thread keeps up
+        to that many pages fetched ahead of the caller.
+
+        Args:
+            endpoint: API path relative to ``BASE_URL``
+            params: Query parameters for the first page
+            page_size: Items per page (capped at the API maximum)
+            prefetch: Pages to read ahead (defaults to the client setting)
+        """
+        depth = self._prefetch_pages if prefetch is None else prefetch
+        return read_ahead(self._fetch_pages(endpoint, params, page_size), depth)
+
+    def iter_resources(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        prefetch: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield resources one at a time as each page arrives, with no upper limit.
+
+        Resources side-loaded through ``include`` are attached to their
+        parents' relationships using a per-page identity map.
+        """
+        pages = self.iter_pages(endpoint, params=params, page_size=page_size, prefetch=prefetch)
+        for page in pages:
+            data = page.get("data", [])
+            if page.get("included"):
+                resolver = IncludedResolver(page["included"])
+                for item in data:
+                    yield resolver.resolve(item)
+            else:
+                yield from data
+
+    def _paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        limit: int | None = 50,
+    ) -> list[dict[str, Any]]:
+        """Fetch up to ``limit`` results (all of them when ``limit`` is None)."""
+        return _collect(
+            self.iter_resources(endpoint, params=params, page_size=page_size_for(limit)),
+            limit,
+        )
+
+    def _get_resource(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """GET a resource (or collection) with included resources attached."""
+        response = self._get(endpoint, params=params or None)
+        return resolve_document(response)
 
     # Apps
-    def list_apps(self, limit: int = 50) -> list[dict[str, Any]]:
-        """List all apps for the team."""
-        return self._paginate("apps", limit=limit)
+    def iter_apps(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream all apps for the team."""
+        params = query_params(fields, include, include_limits)
+        return self.iter_resources("apps", params=params, page_size=page_size)
+
+    def list_apps(
+        self,
+        limit: int | None = 50,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List apps for the team (all of them when ``limit`` is None)."""
+        apps = self.iter_apps(
+            page_size=page_size_for(limit),
+            fields=fields,
+            include=include,
+            include_limits=include_limits,
+        )
+        return _collect(apps, limit)
 
-    def get_app(self, app_id: str) -> dict[str, Any]:
+    def get_app(
+        self,
+        app_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Get a specific app by ID."""
-        response = self._get(f"apps/{app_id}")
-        return response.get("data", {})
+        params = query_params(fields, include, include_limits)
+        return self._get_resource(f"apps/{app_id}", params) or {}
 
-    def get_app_by_bundle_id(self, bundle_id: str) -> dict[str, Any] | None:
+    def get_app_by_bundle_id(
+        self,
+        bundle_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any] | None:
         """Find an app by bundle ID."""
-        response = self._get("apps", params={"filter[bundleId]": bundle_id})
-        data = response.get("data", [])
+        data = self._get_resource(
+            "apps",
+            params={
+                "filter[bundleId]": bundle_id,
+                **query_params(fields, include, include_limits),
+            },
+        )
         return data[0] if data else None
 
     # Builds
-    def list_builds(
+    def iter_builds(
         self,
         app_id: str | None = None,
-        limit: int = 25,
-    ) -> list[dict[str, Any]]:
-        """List builds, optionally filtered by app."""
-        params: dict[str, Any] = {}
+        page_size: int = MAX_PAGE_SIZE,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+        sort: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream builds, optionally filtered by app and ordered by ``sort``."""
+        params = query_params(fields, include, include_limits)
         if app_id:
             params["filter[app]"] = app_id
+        if sort:
+            params["sort"] = sort
+
+        return self.iter_resources("builds", params=params, page_size=page_size)
 
-        return self._paginate("builds", params=params, limit=limit)
+    def list_builds(
+        self,
+        app_id: str | None = None,
+        limit: int | None = 25,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List builds, optionally filtered by app."""
+        builds = self.iter_builds(
+            app_id=app_id, page_size=page_size_for(limit),
+            fields=fields,
+            include=include,
+            include_limits=include_limits,
+        )
+        return _collect(builds, limit)
 
-    def get_build(self, build_id: str) -> dict[str, Any]:
+    def get_build(
+        self,
+        build_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Get a specific build by ID."""
-        response = self._get(f"builds/{build_id}")
-        return response.get("data", {})
+        params = query_params(fields, include, include_limits)
+        return self._get_resource(f"builds/{build_id}", params) or {}
 
-    def get_latest_build(self, app_id: str) -> dict[str, Any] | None:
+    def get_latest_build(
+        self,
+        app_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any] | None:
         """Get the most recent build for an app."""
-        builds = self.list_builds(app_id=app_id, limit=1)
+        builds = self.list_builds(
+            app_id=app_id, limit=1, fields=fields, include=include, include_limits=include_limits
+        )
         return builds[0] if builds else None
 
     # TestFlight
-    def list_beta_testers(
+    def iter_beta_testers(
         self,
         app_id: str | None = None,
-        limit: int = 50,
-    ) -> list[dict[str, Any]]:
-        """List beta testers."""
-        params: dict[str, Any] = {}
+        page_size: int = MAX_PAGE_SIZE,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+        group_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream beta testers, optionally filtered by app or beta group."""
+        params = query_params(fields, include, include_limits)
         if app_id:
             params["filter[apps]"] = app_id
+        if group_id:
+            params["filter[betaGroups]"] = group_id
 
-        return self._paginate("betaTesters", params=params, limit=limit)
+        return self.iter_resources("betaTesters", params=params, page_size=page_size)
 
-    def get_beta_tester(self, tester_id: str) -> dict[str, Any]:
+    def list_beta_testers(
+        self,
+        app_id: str | None = None,
+        limit: int | None = 50,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List beta testers."""
+        testers = self.iter_beta_testers(
+            app_id=app_id, page_size=page_size_for(limit),
+            fields=fields,
+            include=include,
+            include_limits=include_limits,
+        )
+        return _collect(testers, limit)
+
+    def get_beta_tester(
+        self,
+        tester_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Get a specific beta tester."""
-        response = self._get(f"betaTesters/{tester_id}")
-        return response.get("data", {})
+        params = query_params(fields, include, include_limits)
+        return self._get_resource(f"betaTesters/{tester_id}", params) or {}
 
-    def list_beta_groups(self, app_id: str | None = None) -> list[dict[str, Any]]:
-        """List beta groups."""
-        params: dict[str, Any] = {}
+    def iter_beta_groups(
+        self,
+        app_id: str | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream beta groups, optionally filtered by app."""
+        params = query_params(fields, include, include_limits)
         if app_id:
             params["filter[app]"] = app_id
 
-        return self._paginate("betaGroups", params=params, limit=100)
+        return self.iter_resources("betaGroups", params=params, page_size=page_size)
+
+    def list_beta_groups(
+        self,
+        app_id: str | None = None,
+        limit: int | None = 100,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """List beta groups."""
+        groups = self.iter_beta_groups(
+            app_id=app_id, page_size=page_size_for(limit),
+            fields=fields,
+            include=include,
+            include_limits=include_limits,
+        )
+        return _collect(groups, limit)
 
-    def get_beta_group(self, group_id: str) -> dict[str, Any]:
+    def get_beta_group(
+        self,
+        group_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Get a specific beta group."""
-        response = self._get(f"betaGroups/{group_id}")
-        return response.get("data", {})
+        params = query_params(fields, include, include_limits)
+        return self._get_resource(f"betaGroups/{group_id}", params) or {}
 
     def invite_beta_tester(
         self,
@@ -163,24 +462,7 @@ def invite_beta_tester(
         last_name: str | None = None,
     ) -> dict[str, Any]:
         """Invite a tester to a beta group."""
-        data = {
-            "data": {
-                "type": "betaTesters",
-                "attributes": {
-                    "email": email,
-                },
-                "relationships": {
-                    "betaGroups": {
-                        "data": [{"type": "betaGroups", "id": group_id}]
-                    }
-                },
-            }
-        }
-
-        if first_name:
-            data["data"]["attributes"]["firstName"] = first_name
-        if last_name:
-            data["data"]["attributes"]["lastName"] = last_name
+        data = beta_tester_invite_payload(email, group_id, first_name, last_name)
 
         response = self._post("betaTesters", data)
         return response.get("data", {})
@@ -196,17 +478,73 @@ def add_tester_to_group(self, tester_id: str, group_id: str) -> None:
         )
 
     # Bundle IDs
-    def list_bundle_ids(self, limit: int = 50) -> list[dict[str, Any]]:
+    def iter_bundle_ids(
+        self,
+        page_size: int = MAX_PAGE_SIZE,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream registered bundle IDs."""
+        params = query_params(fields, include, include_limits)
+        return self.iter_resources("bundleIds", params=params, page_size=page_size)
+
+    def list_bundle_ids(
+        self,
+        limit: int | None = 50,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> list[dict[str, Any]]:
         """List registered bundle IDs."""
-        return self._paginate("bundleIds", limit=limit)
+        bundle_ids = self.iter_bundle_ids(
+            page_size=page_size_for(limit),
+            fields=fields,
+            include=include,
+            include_limits=include_limits,
+        )
+        return _collect(bundle_ids, limit)
 
-    def get_bundle_id(self, bundle_id_resource_id: str) -> dict[str, Any]:
+    def get_bundle_id(
+        self,
+        bundle_id_resource_id: str,
+        fields: dict[str, list[str]] | None = None,
+        include: list[str] | None = None,
+        include_limits: dict[str, int] | None = None,
+    ) -> dict[str, Any]:
         """Get a specific bundle ID resource."""
-        response = self._get(f"bundleIds/{bundle_id_resource_id}")
-        return response.get("data", {})
+        params = query_params(fields, include, include_limits)
+        return self._get_resource(f"bundleIds/{bundle_id_resource_id}", params) or {}
+
+    # Quota
+
+    def get_rate_limit(self) -> RateLimitStatus | None:
+        """Read the API key's hourly budget from one minimal request."""
+        response = self._http.get(f"{self.BASE_URL}/apps", params=QUOTA_PROBE_PARAMS)
+        return parse_rate_limit_header(response.headers.get(RATE_LIMIT_HEADER))
+
+    def map_concurrent(self, fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Run ``fn`` over ``items`` on worker threads, yielding results in input order.
+
+        Requests made by ``fn`` through this client are paced by the adaptive
+        concurrency window, so throughput settles at what Apple accepts.
+        """
+        return bulk_map(fn, items, workers=self._config.http.max_concurrency)
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit, miss and eviction counters of the in-memory cache, if enabled."""
+        return self._http.memory_cache_stats
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        """Counters for GETs that shared an identical in-flight request."""
+        return self._http.coalescing_stats
 
     def close(self) -> None:
         """Close the HTTP client."""
+        if self._background_token_refresh and self._jwt_auth:
+            self._jwt_auth.stop_background_refresh()
         self._http.close()
 
     def __enter__(self) -> AppStoreConnectClient:
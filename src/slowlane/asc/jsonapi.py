@@ -0,0 +1,110 @@
+"""JSON:API query building and compound-document resolution for App Store Connect."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# How many relationship hops to expand when attaching included resources.
+# Bounded so that cyclic relationships (build -> app -> builds) terminate.
+DEFAULT_RESOLVE_DEPTH = 2
+
+
+def query_params(
+    fields: Mapping[str, Iterable[str]] | None = None,
+    include: Iterable[str] | None = None,
+    include_limits: Mapping[str, int] | None = None,
+) -> dict[str, Any]:
+    """Build sparse-fieldset, include and relationship-limit query parameters.
+
+    Args:
+        fields: Attributes to return per resource type, e.g. ``{"builds": ["version"]}``
+        include: Relationships to side-load in the ``included`` array
+        include_limits: Max related items per included relationship
+
+    Returns:
+        Query parameters in JSON:API bracket notation
+    """
+    params: dict[str, Any] = {}
+
+    for resource_type, names in (fields or {}).items():
+        params[f"fields[{resource_type}]"] = ",".join(names)
+
+    if include:
+        params["include"] = ",".join(include)
+
+    for relationship, limit in (include_limits or {}).items():
+        params[f"limit[{relationship}]"] = limit
+
+    return params
+
+
+class IncludedResolver:
+    """Attach ``included`` resources to the relationships that reference them.
+
+    Each response gets its own identity map keyed by ``(type, id)``, so a
+    resource referenced from many parents is looked up once. Resolution
+    replaces relationship linkage (``{"type", "id"}``) with the full included
+    resource, itself expanded up to the requested depth; linkage without a
+    matching included resource is left as-is. Input documents are not mutated.
+    """
+
+    def __init__(self, included: Iterable[dict[str, Any]] | None) -> None:
+        self._identity_map: dict[tuple[str, str], dict[str, Any]] = {
+            (resource.get("type", ""), resource.get("id", "")): resource
+            for resource in included or []
+        }
+
+    def __len__(self) -> int:
+        return len(self._identity_map)
+
+    def lookup(self, resource_type: str, resource_id: str) -> dict[str, Any] | None:
+        """Find an included resource by type and ID."""
+        return self._identity_map.get((resource_type, resource_id))
+
+    def resolve(
+        self, resource: dict[str, Any], depth: int = DEFAULT_RESOLVE_DEPTH
+    ) -> dict[str, Any]:
+        """Return ``resource`` with its relationships expanded into included resources."""
+        relationships = resource.get("relationships")
+        if not self._identity_map or depth <= 0 or not relationships:
+            return resource
+
+        resolved_relationships: dict[str, Any] = {}
+        for name, relationship in relationships.items():
+            if not isinstance(relationship, dict) or "data" not in relationship:
+                resolved_relationships[name] = relationship
+                continue
+
+            linkage = relationship["data"]
+            if isinstance(linkage, list):
+                data: Any = [self._resolve_linkage(item, depth) for item in linkage]
+            elif isinstance(linkage, dict):
+                data = self._resolve_linkage(linkage, depth)
+            else:
+                data = linkage
+
+            resolved_relationships[name] = {**relationship, "data": data}
+
+        return {**resource, "relationships": resolved_relationships}
+
+    def _resolve_linkage(self, linkage: dict[str, Any], depth: int) -> dict[str, Any]:
+        """Expand one resource identifier into its included resource."""
+        included = self.lookup(linkage.get("type", ""), linkage.get("id", ""))
+        if included is None:
+            return linkage
+        return self.resolve(included, depth - 1)
+
+
+def resolve_document(document: dict[str, Any]) -> Any:
+    """Return the document's primary ``data`` with included resources attached."""
+    data = document.get("data")
+    resolver = IncludedResolver(document.get("included"))
+    if not len(resolver):
+        return data
+
+    if isinstance(data, list):
+        return [resolver.resolve(item) for item in data]
+    if isinstance(data, dict):
+        return resolver.resolve(data)
+    return data
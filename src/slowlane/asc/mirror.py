@@ -0,0 +1,417 @@
+"""Local SQLite mirror of App Store Connect resources.
+
+``slowlane asc sync`` copies apps, bundle IDs, beta groups, beta testers and
+builds into an indexed database so that repeated questions (which builds
+exist, who is in which group, which app owns a bundle ID) are answered
+locally instead of paging through the API again. Relationships are kept as
+``links`` rows, so resources can be found by the app or group they belong to.
+
+Builds are listed newest first, so after the first sync only builds at or
+above a high-water mark are fetched again. The other types have no date to
+sort by and are re-read in full, with rows that disappeared swept away.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from slowlane.core.config import get_data_dir
+
+if TYPE_CHECKING:
+    from slowlane.asc.client import AppStoreConnectClient
+
+# Seconds to wait for another process to release the database write lock
+LOCK_TIMEOUT = 30.0
+
+# Resources written per transaction (one API page)
+BATCH_SIZE = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    lookup TEXT,
+    sort_key TEXT NOT NULL,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (type, id)
+);
+CREATE INDEX IF NOT EXISTS resources_by_sort_key ON resources (type, sort_key);
+CREATE INDEX IF NOT EXISTS resources_by_lookup ON resources (type, lookup);
+CREATE TABLE IF NOT EXISTS links (
+    type TEXT NOT NULL,
+    id TEXT NOT NULL,
+    relationship TEXT NOT NULL,
+    target TEXT NOT NULL,
+    PRIMARY KEY (type, id, relationship, target)
+);
+CREATE INDEX IF NOT EXISTS links_by_target ON links (relationship, target, type);
+CREATE TABLE IF NOT EXISTS sync_state (
+    type TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    high_water TEXT,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (type, scope)
+);
+"""
+
+
+def get_mirror_path() -> Path:
+    """Get the mirror database path, overridable with ``SLOWLANE_MIRROR_DB``."""
+    if override := os.environ.get("SLOWLANE_MIRROR_DB"):
+        return Path(override).expanduser()
+    return get_data_dir() / "asc-mirror.db"
+
+
+def _attribute(resource: dict[str, Any], name: str) -> Any:
+    return resource.get("attributes", {}).get(name)
+
+
+def _utc(value: Any) -> str:
+    """Normalize an ISO 8601 timestamp to UTC so keys compare as strings."""
+    if not value:
+        return ""
+    try:
+        return datetime.fromisoformat(str(value)).astimezone(UTC).isoformat()
+    except ValueError:
+        return str(value)
+
+
+@dataclass(frozen=True)
+class MirrorSpec:
+    """How one resource type is fetched, indexed and refreshed."""
+
+    fetch: Callable[[AppStoreConnectClient, str | None], Iterator[dict[str, Any]]]
+    sort_attribute: str
+    lookup_attribute: str | None = None
+    # Relationship that ties the resource to an app (enables --app scoping)
+    app_relationship: str | None = None
+    # Listed newest first by a timestamp: refresh incrementally
+    newest_first: bool = False
+    # Resources that may still change, so the high-water mark must not pass them
+    unsettled: Callable[[dict[str, Any]], bool] | None = None
+
+    def sort_key(self, resource: dict[str, Any]) -> str:
+        """The value rows are ordered (and high-water marks kept) by."""
+        value = _attribute(resource, self.sort_attribute)
+        if self.newest_first:
+            return _utc(value)
+        return "" if value is None else str(value)
+
+
+MIRROR_SPECS: dict[str, MirrorSpec] = {
+    "apps": MirrorSpec(
+        fetch=lambda client, app_id: client.iter_apps(),
+        sort_attribute="name",
+        lookup_attribute="bundleId",
+    ),
+    "bundleIds": MirrorSpec(
+        fetch=lambda client, app_id: client.iter_bundle_ids(include=["app"]),
+        sort_attribute="identifier",
+        lookup_attribute="identifier",
+    ),
+    "betaGroups": MirrorSpec(
+        fetch=lambda client, app_id: client.iter_beta_groups(
+            app_id=app_id, include=["app"], fields={"apps": ["bundleId"]}
+        ),
+        sort_attribute="name",
+        app_relationship="app",
+    ),
+    "betaTesters": MirrorSpec(
+        fetch=lambda client, app_id: client.iter_beta_testers(
+            app_id=app_id,
+            include=["apps", "betaGroups"],
+            fields={"apps": ["bundleId"], "betaGroups": ["name"]},
+            include_limits={"apps": 50, "betaGroups": 50},
+        ),
+        sort_attribute="email",
+        lookup_attribute="email",
+        app_relationship="apps",
+    ),
+    "builds": MirrorSpec(
+        fetch=lambda client, app_id: client.iter_builds(
+            app_id=app_id, include=["app"], fields={"apps": ["bundleId"]}, sort="-uploadedDate"
+        ),
+        sort_attribute="uploadedDate",
+        app_relationship="app",
+        newest_first=True,
+        unsettled=lambda build: _attribute(build, "processingState") == "PROCESSING",
+    ),
+}
+
+
+def _linkage(resource: dict[str, Any]) -> dict[str, list[dict[str, str]] | dict[str, str]]:
+    """Relationship linkage (``{"type", "id"}``) of a resource, included data dropped."""
+    linkage: dict[str, list[dict[str, str]] | dict[str, str]] = {}
+    for name, relationship in (resource.get("relationships") or {}).items():
+        data = relationship.get("data") if isinstance(relationship, dict) else None
+        if isinstance(data, list):
+            linkage[name] = [
+                {"type": item.get("type", ""), "id": item.get("id", "")} for item in data
+            ]
+        elif isinstance(data, dict):
+            linkage[name] = {"type": data.get("type", ""), "id": data.get("id", "")}
+    return linkage
+
+
+@dataclass
+class SyncResult:
+    """Outcome of syncing one resource type."""
+
+    resource_type: str
+    fetched: int
+    removed: int
+    incremental: bool
+    high_water: str | None = None
+
+
+class ResourceMirror:
+    """SQLite mirror of App Store Connect resources.
+
+    Each operation opens its own connection, so one instance can be shared
+    by threads and several processes can use the same file; writes happen
+    in short ``BEGIN IMMEDIATE`` transactions, one per page of resources.
+    """
+
+    def __init__(self, path: Path | None = None, clock: Callable[[], float] = time.time) -> None:
+        self._path = path or get_mirror_path()
+        self._clock = clock
+
+    @property
+    def path(self) -> Path:
+        """Mirror database path."""
+        return self._path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode so transactions are controlled explicitly
+        conn = sqlite3.connect(self._path, timeout=LOCK_TIMEOUT, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self, conn: sqlite3.Connection) -> Iterator[None]:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _store(
+        self,
+        conn: sqlite3.Connection,
+        resource_type: str,
+        resources: list[dict[str, Any]],
+        synced_at: float,
+    ) -> None:
+        spec = MIRROR_SPECS[resource_type]
+        rows = []
+        links = []
+        for resource in resources:
+            linkage = _linkage(resource)
+            record = {
+                "type": resource.get("type", resource_type),
+                "id": resource["id"],
+                "attributes": resource.get("attributes", {}),
+            }
+            if linkage:
+                record["relationships"] = {name: {"data": data} for name, data in linkage.items()}
+            lookup = _attribute(resource, spec.lookup_attribute) if spec.lookup_attribute else None
+            rows.append(
+                (
+                    resource_type,
+                    resource["id"],
+                    lookup,
+                    spec.sort_key(resource),
+                    json.dumps(record, default=str),
+                    synced_at,
+                )
+            )
+            for name, data in linkage.items():
+                for item in data if isinstance(data, list) else [data]:
+                    links.append((resource_type, resource["id"], name, item["id"]))
+
+        with self._transaction(conn):
+            conn.executemany(
+                "DELETE FROM links WHERE type = ? AND id = ?",
+                [(resource_type, row[1]) for row in rows],
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO resources "
+                "(type, id, lookup, sort_key, data, synced_at) VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO links (type, id, relationship, target) VALUES (?, ?, ?, ?)",
+                links,
+            )
+
+    def _sweep(
+        self,
+        conn: sqlite3.Connection,
+        resource_type: str,
+        app_id: str | None,
+        started: float,
+    ) -> int:
+        """Drop what a full listing no longer returned."""
+        spec = MIRROR_SPECS[resource_type]
+        stale = "SELECT id FROM resources WHERE type = ? AND synced_at < ?"
+        with self._transaction(conn):
+            if app_id and spec.app_relationship:
+                # Only this app was listed: unlink the rest from it, keep them otherwise
+                cursor = conn.execute(
+                    "DELETE FROM links WHERE type = ? AND relationship = ? AND target = ? "
+                    f"AND id IN ({stale})",
+                    (resource_type, spec.app_relationship, app_id, resource_type, started),
+                )
+            else:
+                conn.execute(
+                    f"DELETE FROM links WHERE type = ? AND id IN ({stale})",
+                    (resource_type, resource_type, started),
+                )
+                cursor = conn.execute(
+                    "DELETE FROM resources WHERE type = ? AND synced_at < ?",
+                    (resource_type, started),
+                )
+        return cursor.rowcount
+
+    def sync(
+        self,
+        client: AppStoreConnectClient,
+        resource_type: str,
+        app_id: str | None = None,
+        full: bool = False,
+    ) -> SyncResult:
+        """Refresh one resource type from the API.
+
+        Newest-first types stop at the stored high-water mark unless ``full``
+        is set; the mark is then moved to the newest resource seen, or held at
+        the oldest one still ``unsettled`` (e.g. a build that is processing)
+        so that it is fetched again next time. Full listings sweep rows that
+        were not returned.
+
+        Args:
+            client: Client to list resources with
+            resource_type: One of :data:`MIRROR_SPECS`
+            app_id: Only sync resources of this app (types with an app relationship)
+            full: Ignore the high-water mark and re-read everything
+        """
+        spec = MIRROR_SPECS[resource_type]
+        app_id = app_id if spec.app_relationship else None
+        scope = app_id or ""
+        started = self._clock()
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT high_water FROM sync_state WHERE type = ? AND scope = ?",
+                (resource_type, scope),
+            ).fetchone()
+            high_water: str | None = row[0] if row and spec.newest_first and not full else None
+            incremental = bool(high_water)
+
+            fetched = 0
+            newest: str | None = None
+            oldest_unsettled: str | None = None
+            batch: list[dict[str, Any]] = []
+            for resource in spec.fetch(client, app_id):
+                key = spec.sort_key(resource)
+                if incremental and key < (high_water or ""):
+                    break
+                if newest is None or key > newest:
+                    newest = key
+                unsettled = spec.unsettled is not None and spec.unsettled(resource)
+                if unsettled and (oldest_unsettled is None or key < oldest_unsettled):
+                    oldest_unsettled = key
+                batch.append(resource)
+                fetched += 1
+                if len(batch) >= BATCH_SIZE:
+                    self._store(conn, resource_type, batch, started)
+                    batch = []
+            if batch:
+                self._store(conn, resource_type, batch, started)
+
+            removed = 0 if incremental else self._sweep(conn, resource_type, app_id, started)
+
+            if spec.newest_first:
+                high_water = oldest_unsettled or newest or high_water
+            conn.execute(
+                "INSERT OR REPLACE INTO sync_state (type, scope, high_water, synced_at) "
+                "VALUES (?, ?, ?, ?)",
+                (resource_type, scope, high_water, started),
+            )
+
+        return SyncResult(resource_type, fetched, removed, incremental, high_water)
+
+    def synced_at(self, resource_type: str, app_id: str | None = None) -> float | None:
+        """When the mirror last covered ``resource_type``, or None if it never has.
+
+        Without ``app_id`` only an unscoped sync counts, since a sync with
+        ``--app`` stores just that app's resources. A read scoped to an app
+        is also covered by a sync of that app.
+        """
+        if not self._path.exists():
+            return None
+        scope = app_id if app_id and MIRROR_SPECS[resource_type].app_relationship else ""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT MAX(synced_at) FROM sync_state WHERE type = ? AND scope IN ('', ?)",
+                (resource_type, scope),
+            ).fetchone()
+        return row[0] if row else None
+
+    def iter_resources(
+        self,
+        resource_type: str,
+        app_id: str | None = None,
+        page_size: int = BATCH_SIZE,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream mirrored resources in the order the API would list them.
+
+        Builds come newest first; other types are ordered by name, email or
+        identifier. With ``app_id``, only resources linked to that app.
+        """
+        spec = MIRROR_SPECS[resource_type]
+        order = "DESC" if spec.newest_first else "ASC"
+        if app_id and spec.app_relationship:
+            query = (
+                "SELECT r.data FROM resources r JOIN links l ON l.type = r.type AND l.id = r.id "
+                "WHERE r.type = ? AND l.relationship = ? AND l.target = ? "
+                f"ORDER BY r.sort_key {order}, r.id"
+            )
+            params: tuple[Any, ...] = (resource_type, spec.app_relationship, app_id)
+        else:
+            query = f"SELECT data FROM resources WHERE type = ? ORDER BY sort_key {order}, id"
+            params = (resource_type,)
+
+        with self._connect() as conn:
+            cursor = conn.execute(query, params)
+            while rows := cursor.fetchmany(page_size):
+                for (data,) in rows:
+                    yield json.loads(data)
+
+    def list_resources(
+        self,
+        resource_type: str,
+        app_id: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List up to ``limit`` mirrored resources (all of them when ``limit`` is None)."""
+        resources: Iterable[dict[str, Any]] = self.iter_resources(resource_type, app_id)
+        return list(resources if limit is None else islice(resources, limit))
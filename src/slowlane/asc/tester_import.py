@@ -0,0 +1,245 @@
+"""Bulk TestFlight tester import from CSV or NDJSON files.
+
+Rows are streamed from the file, checked against the group's existing
+testers (fetched once and kept as a set of email hashes), and invited on a
+bounded thread pool. Progress is checkpointed to the data directory, so
+an interrupted import resumes after the last finished row.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from slowlane.core.concurrency import bulk_map
+from slowlane.core.config import get_data_dir
+from slowlane.core.errors import AuthExpiredError, SlowlaneError
+
+if TYPE_CHECKING:
+    from slowlane.asc.client import AppStoreConnectClient
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Finished rows between progress checkpoints
+CHECKPOINT_EVERY = 50
+
+# Accepted column / key spellings, normalized (lowercase, no "_", "-" or spaces)
+_COLUMNS = {
+    "email": "email",
+    "emailaddress": "email",
+    "firstname": "first_name",
+    "lastname": "last_name",
+}
+
+
+def email_key(email: str) -> bytes:
+    """Compact, case-insensitive hash of an email address for dedupe sets."""
+    return hashlib.sha256(email.strip().lower().encode()).digest()[:16]
+
+
+@dataclass
+class ImportRow:
+    """One tester read from an import file."""
+
+    index: int
+    email: str = ""
+    first_name: str | None = None
+    last_name: str | None = None
+    error: str | None = None
+
+
+def _row(index: int, values: dict[str, Any]) -> ImportRow:
+    fields: dict[str, str] = {}
+    for key, value in values.items():
+        name = _COLUMNS.get(str(key).lower().replace("_", "").replace("-", "").replace(" ", ""))
+        if name and value is not None and str(value).strip():
+            fields[name] = str(value).strip()
+
+    email = fields.get("email", "")
+    if "@" not in email:
+        return ImportRow(index, email, error=f"Invalid or missing email: {email!r}")
+    return ImportRow(index, email, fields.get("first_name"), fields.get("last_name"))
+
+
+def read_tester_rows(lines: Iterable[str], format: str) -> Iterator[ImportRow]:
+    """Stream tester rows from CSV (with a header) or NDJSON lines.
+
+    Recognized fields are ``email``, ``first_name`` and ``last_name`` (also
+    ``firstName``, ``First Name`` and so on). Rows are numbered from 1 in
+    file order; unusable rows carry an ``error`` instead of raising.
+    """
+    if format == "csv":
+        for index, values in enumerate(csv.DictReader(lines), start=1):
+            yield _row(index, values)
+        return
+
+    index = 0
+    for line in lines:
+        if not line.strip():
+            continue
+        index += 1
+        try:
+            values = json.loads(line)
+        except ValueError as e:
+            yield ImportRow(index, error=f"Invalid JSON: {e}")
+            continue
+        if not isinstance(values, dict):
+            yield ImportRow(index, error="Record must be a JSON object")
+            continue
+        yield _row(index, values)
+
+
+def import_format_for(path: Path) -> str:
+    """Guess the import format from a file name (CSV unless .ndjson/.jsonl/.json)."""
+    return "ndjson" if path.suffix.lower() in (".ndjson", ".jsonl", ".json") else "csv"
+
+
+@dataclass
+class ImportProgress:
+    """Checkpoint of an import: every row up to ``row`` has been handled."""
+
+    path: Path
+    source_size: int
+    row: int = 0
+
+    @classmethod
+    def for_source(
+        cls, source: Path, group_id: str, directory: Path | None = None
+    ) -> ImportProgress:
+        """Load the checkpoint for importing ``source`` into ``group_id``.
+
+        A checkpoint written for a file of a different size is ignored, so an
+        edited file is imported from the start (existing testers are skipped).
+        """
+        name = hashlib.sha256(f"{source.resolve()}\0{group_id}".encode()).hexdigest()[:16]
+        path = (directory or get_data_dir() / "imports") / f"testers-{name}.json"
+        size = source.stat().st_size
+        progress = cls(path=path, source_size=size)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return progress
+        if data.get("source_size") == size:
+            progress.row = int(data.get("row", 0))
+        return progress
+
+    def save(self) -> None:
+        """Write the checkpoint atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.path.with_suffix(".tmp")
+        temp.write_text(json.dumps({"source_size": self.source_size, "row": self.row}))
+        os.replace(temp, self.path)
+
+    def clear(self) -> None:
+        """Forget the checkpoint once the import has finished."""
+        self.path.unlink(missing_ok=True)
+
+
+@dataclass
+class InviteOutcome:
+    """What happened to one row."""
+
+    index: int
+    email: str
+    status: str  # invited, existing, duplicate, invalid, failed, pending (dry run)
+    tester_id: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class ImportSummary:
+    """Counts of row outcomes for one import run."""
+
+    resumed_after: int = 0
+    existing_testers: int = 0
+    counts: dict[str, int] = field(default_factory=dict)
+    failures: list[InviteOutcome] = field(default_factory=list)
+
+
+def existing_tester_keys(client: AppStoreConnectClient, group_id: str) -> set[bytes]:
+    """Email hashes of every tester already in the group (one paged listing)."""
+    testers = client.iter_beta_testers(group_id=group_id, fields={"betaTesters": ["email"]})
+    return {
+        email_key(email)
+        for tester in testers
+        if (email := tester.get("attributes", {}).get("email"))
+    }
+
+
+def import_testers(
+    client: AppStoreConnectClient,
+    rows: Iterable[ImportRow],
+    group_id: str,
+    progress: ImportProgress,
+    workers: int,
+    emit: Callable[[InviteOutcome], None] | None = None,
+    dry_run: bool = False,
+) -> ImportSummary:
+    """Invite every new tester in ``rows`` to a beta group.
+
+    Rows at or before ``progress.row`` are skipped. The remaining rows are
+    deduplicated in file order against the group's testers and earlier rows,
+    then invited on up to ``workers`` threads. Outcomes are handed to
+    ``emit`` in file order, and the checkpoint advances with them. A failed
+    invite is reported and the import continues; expired authentication
+    stops the import with the checkpoint saved.
+    """
+    summary = ImportSummary(resumed_after=progress.row)
+    existing = existing_tester_keys(client, group_id)
+    seen = set(existing)
+    summary.existing_testers = len(existing)
+
+    def classify(pending: Iterable[ImportRow]) -> Iterator[tuple[ImportRow, str | None]]:
+        for row in pending:
+            if row.index <= summary.resumed_after:
+                continue
+            if row.error:
+                yield row, "invalid"
+                continue
+            key = email_key(row.email)
+            if key in seen:
+                yield row, "existing" if key in existing else "duplicate"
+                continue
+            seen.add(key)
+            yield row, "pending" if dry_run else None
+
+    def handle(item: tuple[ImportRow, str | None]) -> InviteOutcome:
+        row, status = item
+        if status is not None:
+            return InviteOutcome(row.index, row.email, status, error=row.error)
+        try:
+            tester = client.invite_beta_tester(
+                email=row.email,
+                group_id=group_id,
+                first_name=row.first_name,
+                last_name=row.last_name,
+            )
+        except AuthExpiredError:
+            raise
+        except SlowlaneError as e:
+            return InviteOutcome(row.index, row.email, "failed", error=str(e))
+        return InviteOutcome(row.index, row.email, "invited", tester_id=tester.get("id"))
+
+    finished = 0
+    try:
+        for outcome in bulk_map(handle, classify(rows), workers):
+            summary.counts[outcome.status] = summary.counts.get(outcome.status, 0) + 1
+            if outcome.status in ("failed", "invalid"):
+                summary.failures.append(outcome)
+            if emit:
+                emit(outcome)
+            if not dry_run:
+                progress.row = outcome.index
+                finished += 1
+                if finished % CHECKPOINT_EVERY == 0:
+                    progress.save()
+    finally:
+        if not dry_run and finished:
+            progress.save()
+    return summary
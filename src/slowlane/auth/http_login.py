@@ -0,0 +1,345 @@
+"""Browser-free Apple ID login: SRP handshake against idmsa plus 2FA over HTTP."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import secrets
+import struct
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+
+import httpx
+
+from slowlane.core.errors import SessionError
+from slowlane.core.secrets import SessionData, hash_email
+
+# RFC 5054 2048-bit group, the one idmsa uses for its SRP-6a exchange
+SRP_N = int(
+    "AC6BDB41324A9A9BF166DE5E1389582FAF72B6651987EE07FC3192943DB56050A37329CBB4A099ED"
+    "8193E0757767A13DD52312AB4B03310DCD7F48A9DA04FD50E8083969EDB767B0CF6095179A163AB3"
+    "661A05FBD5FAAAE82918A9962F0B93B855F97993EC975EEAA80D740ADBF4FF747359D041D5C33EA7"
+    "1D281E446B14773BCA97B43A23FB801676BD207A436C6481F1D2B9078717461A5B9D32E688F87748"
+    "544523B524B0D57D5EA77A2775D2ECFA032CFBDBF52FB3786160279004E57AE6AF874E7303CE5329"
+    "9CCC041C7BC308D82A5698F3A8D0C38271AE35F8E9DBFBB694B5C803D89F7AE435DE236D525F5475"
+    "9B65E372FCD68EF20FA7111F9E4AFF73",
+    16,
+)
+SRP_G = 2
+
+# Code provider: receives a prompt describing where the code was sent
+CodeProvider = Callable[[str], str]
+
+
+def _to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8 or 1, "big")
+
+
+def _pad(value: int) -> bytes:
+    return value.to_bytes((SRP_N.bit_length() + 7) // 8, "big")
+
+
+def _sha256(*parts: bytes) -> bytes:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return digest.digest()
+
+
+def derive_password_key(password: str, salt: bytes, iterations: int, protocol: str) -> bytes:
+    """Stretch the password the way idmsa expects for the ``s2k`` protocols."""
+    hashed = hashlib.sha256(password.encode()).digest()
+    if protocol == "s2k_fo":
+        hashed = hashed.hex().encode()
+    return hashlib.pbkdf2_hmac("sha256", hashed, salt, iterations, 32)
+
+
+class SRPClient:
+    """Client side of SRP-6a as spoken by idmsa (SHA-256, no username in ``x``)."""
+
+    def __init__(self, account_name: str, private: int | None = None) -> None:
+        self._account_name = account_name
+        self._a = private if private is not None else secrets.randbits(256)
+        self.public = pow(SRP_G, self._a, SRP_N)
+        self.key: bytes | None = None
+        self._m1: bytes | None = None
+
+    def process_challenge(self, salt: bytes, server_public: int, password_key: bytes) -> bytes:
+        """Compute the client proof ``M1`` for the server's challenge."""
+        if server_public % SRP_N == 0:
+            raise SessionError("Apple sent an invalid SRP challenge")
+        # The salt enters the hashes as an integer, without leading zero bytes
+        salt = _to_bytes(int.from_bytes(salt, "big"))
+
+        k = int.from_bytes(_sha256(_to_bytes(SRP_N), _pad(SRP_G)), "big")
+        u = int.from_bytes(_sha256(_pad(self.public), _pad(server_public)), "big")
+        x = int.from_bytes(_sha256(salt, _sha256(b":", password_key)), "big")
+
+        base = (server_public - k * pow(SRP_G, x, SRP_N)) % SRP_N
+        shared = pow(base, self._a + u * x, SRP_N)
+        self.key = _sha256(_to_bytes(shared))
+
+        n_xor_g = bytes(
+            a ^ b for a, b in zip(_sha256(_to_bytes(SRP_N)), _sha256(_pad(SRP_G)), strict=True)
+        )
+        self._m1 = _sha256(
+            n_xor_g,
+            _sha256(self._account_name.encode()),
+            salt,
+            _to_bytes(self.public),
+            _to_bytes(server_public),
+            self.key,
+        )
+        return self._m1
+
+    def expected_server_proof(self) -> bytes:
+        """The ``M2`` a genuine server answers with."""
+        if self._m1 is None or self.key is None:
+            raise SessionError("SRP challenge has not been processed")
+        return _sha256(_to_bytes(self.public), self._m1, self.key)
+
+
+def totp_code(secret: str, at: float | None = None, digits: int = 6, period: int = 30) -> str:
+    """RFC 6238 one-time code for a base32 ``secret``."""
+    key = base64.b32decode(secret.replace(" ", "").upper() + "=" * (-len(secret) % 8))
+    counter = int((time.time() if at is None else at) // period)
+    digest = hmac.new(key, struct.pack(">Q", counter), hashlib.sha1).digest()
+    offset = digest[-1] & 0x0F
+    value = struct.unpack(">I", digest[offset : offset + 4])[0] & 0x7FFFFFFF
+    return str(value % 10**digits).zfill(digits)
+
+
+class HttpLoginFlow:
+    """Apple ID login over plain HTTP, without launching a browser.
+
+    Performs the SRP handshake against idmsa, completes two-factor
+    authentication with a code from ``code_provider`` (a prompt or a TOTP
+    hook), then collects the same session cookies as the Playwright flow.
+    """
+
+    AUTH_URL = "https://idmsa.apple.com/appleauth/auth"
+    CONFIG_URL = "https://appstoreconnect.apple.com/olympus/v1/app/config"
+    SESSION_URL = "https://appstoreconnect.apple.com/olympus/v1/session"
+
+    # Cookies we need to extract
+    TARGET_COOKIES: ClassVar[list[str]] = ["myacinfo", "DES", "dqsid", "itctx", "itcdq"]
+
+    # Response headers idmsa expects echoed on every follow-up request
+    SESSION_HEADERS: ClassVar[tuple[str, ...]] = ("X-Apple-ID-Session-Id", "scnt")
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        code_provider: CodeProvider,
+        transport: httpx.BaseTransport | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """Initialize login flow.
+
+        Args:
+            email: Apple ID email
+            password: Apple ID password
+            code_provider: Returns the 2FA code, given a prompt
+            transport: Alternative httpx transport (e.g. a fake idmsa for tests)
+            timeout: Per-request timeout in seconds
+        """
+        self._email = email
+        self._password = password
+        self._code_provider = code_provider
+        self._client = httpx.Client(transport=transport, timeout=timeout, follow_redirects=True)
+        self._headers: dict[str, str] = {
+            "Accept": "application/json, text/javascript",
+            "Content-Type": "application/json",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        try:
+            response = self._client.request(method, url, headers=self._headers, **kwargs)
+        except httpx.RequestError as e:
+            raise SessionError(f"Login request failed: {e}") from e
+        for name in self.SESSION_HEADERS:
+            if name in response.headers:
+                self._headers[name] = response.headers[name]
+        return response
+
+    def _auth(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        return self._request(method, f"{self.AUTH_URL}{path}", **kwargs)
+
+    @staticmethod
+    def _json(response: httpx.Response, what: str) -> dict[str, Any]:
+        """Decode a successful JSON object response, or raise naming ``what``."""
+        if not response.is_success:
+            raise SessionError(f"{what} failed (HTTP {response.status_code})")
+        content_type = response.headers.get("Content-Type", "")
+        if "json" not in content_type:
+            raise SessionError(
+                f"{what} returned an unexpected response", content_type=content_type or "none"
+            )
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise SessionError(f"{what} returned invalid JSON") from e
+        if not isinstance(data, dict):
+            raise SessionError(f"{what} returned an unexpected response")
+        return data
+
+    def _load_service_key(self) -> None:
+        response = self._request(
+            "GET", self.CONFIG_URL, params={"hostname": "itunesconnect.apple.com"}
+        )
+        key = self._json(response, "Loading Apple's auth config").get("authServiceKey")
+        if not key:
+            raise SessionError("Could not read Apple's auth service key")
+        self._headers["X-Apple-Widget-Key"] = key
+
+    def _sign_in(self) -> bool:
+        """Run the SRP handshake; returns True when 2FA is required."""
+        srp = SRPClient(self._email)
+        init = self._auth(
+            "POST",
+            "/signin/init",
+            json={
+                "a": base64.b64encode(_to_bytes(srp.public)).decode(),
+                "accountName": self._email,
+                "protocols": ["s2k", "s2k_fo"],
+            },
+        )
+        if not init.is_success:
+            raise SessionError(f"Sign-in was rejected (HTTP {init.status_code})")
+
+        challenge = self._json(init, "Sign-in")
+        try:
+            salt = base64.b64decode(challenge["salt"], validate=True)
+            server_public = int.from_bytes(base64.b64decode(challenge["b"], validate=True), "big")
+            iterations = int(challenge["iteration"])
+            protocol = str(challenge["protocol"])
+            token = str(challenge["c"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise SessionError(f"Apple sent an incomplete SRP challenge: {e}") from e
+        if protocol not in ("s2k", "s2k_fo"):
+            raise SessionError(
+                "Apple asked for an unsupported password protocol", protocol=protocol
+            )
+
+        password_key = derive_password_key(self._password, salt, iterations, protocol)
+        m1 = srp.process_challenge(salt, server_public, password_key)
+
+        # Remembering the browser is what makes Apple issue a long-lived session
+        complete = self._auth(
+            "POST",
+            "/signin/complete",
+            params={"isRememberMeEnabled": "true"},
+            json={
+                "accountName": self._email,
+                "c": token,
+                "m1": base64.b64encode(m1).decode(),
+                "m2": base64.b64encode(srp.expected_server_proof()).decode(),
+                "rememberMe": True,
+            },
+        )
+        if complete.status_code == 409:
+            return True
+        if complete.status_code in (401, 403):
+            raise SessionError("Invalid Apple ID or password")
+        if not complete.is_success:
+            raise SessionError(f"Sign-in failed (HTTP {complete.status_code})")
+        return False
+
+    def _verify_two_factor(self) -> None:
+        """Submit a 2FA code to a trusted device, or by SMS when there is none."""
+        options = self._json(self._auth("GET", ""), "Loading two-factor options")
+        phones = options.get("trustedPhoneNumbers") or []
+
+        if options.get("noTrustedDevices") and phones:
+            phone = phones[0]
+            if not isinstance(phone, dict) or "id" not in phone:
+                raise SessionError("Apple sent a trusted phone number without an id")
+            mode = phone.get("pushMode", "sms")
+            sent = self._auth(
+                "PUT", "/verify/phone", json={"phoneNumber": {"id": phone["id"]}, "mode": mode}
+            )
+            if not sent.is_success:
+                raise SessionError(f"Could not send the two-factor code (HTTP {sent.status_code})")
+            code = self._code_provider(f"Code sent to {phone.get('numberWithDialCode', 'phone')}")
+            response = self._auth(
+                "POST",
+                "/verify/phone/securitycode",
+                json={
+                    "securityCode": {"code": code.strip()},
+                    "phoneNumber": {"id": phone["id"]},
+                    "mode": mode,
+                },
+            )
+        else:
+            code = self._code_provider("Code shown on your trusted device")
+            response = self._auth(
+                "POST",
+                "/verify/trusteddevice/securitycode",
+                json={"securityCode": {"code": code.strip()}},
+            )
+
+        if not response.is_success:
+            raise SessionError("Two-factor code was rejected")
+        # Trusting the session is what issues the long-lived myacinfo cookie
+        self._auth("GET", "/2sv/trust")
+
+    def _session_cookies(self) -> dict[str, str]:
+        cookies: dict[str, str] = {}
+        for cookie in self._client.cookies.jar:
+            if cookie.value is not None and (
+                cookie.name in self.TARGET_COOKIES or cookie.name.startswith("myac")
+            ):
+                cookies[cookie.name] = cookie.value
+        return cookies
+
+    def run(self) -> dict[str, str]:
+        """Log in and return the captured session cookies."""
+        try:
+            self._load_service_key()
+            if self._sign_in():
+                self._verify_two_factor()
+            # Loading the olympus session sets the itctx / dqsid cookies
+            self._request("GET", self.SESSION_URL)
+        finally:
+            self._client.close()
+
+        cookies = self._session_cookies()
+        if not cookies.get("myacinfo"):
+            raise SessionError("Login completed but required cookies not found")
+        return cookies
+
+
+def http_login(
+    email: str,
+    password: str,
+    code_provider: CodeProvider,
+    target_service: str = "appstoreconnect",
+    transport: httpx.BaseTransport | None = None,
+) -> SessionData:
+    """Perform a browser-free login and return session data.
+
+    Args:
+        email: Apple ID email
+        password: Apple ID password
+        code_provider: Returns the 2FA code, given a prompt
+        target_service: "appstoreconnect" or "developer"
+        transport: Alternative httpx transport (e.g. a fake idmsa for tests)
+
+    Returns:
+        SessionData with captured cookies
+
+    Raises:
+        SessionError: If login fails
+    """
+    flow = HttpLoginFlow(email, password, code_provider, transport=transport)
+    return SessionData(
+        cookies=flow.run(),
+        email_hash=hash_email(email),
+        created_at=datetime.now(UTC),
+        target_service=target_service,
+    )
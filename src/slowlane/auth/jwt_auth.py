@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
+import logging
 import os
+import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
 
 import jwt
+from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurvePrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
+from slowlane.auth.token_cache import CachedToken, JWTTokenCache, key_fingerprint
 from slowlane.core.config import SlowlaneConfig
 from slowlane.core.errors import JWTError
 from slowlane.core.secrets import SecretStore
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def load_signing_key(private_key: str) -> EllipticCurvePrivateKey:
+    """Parse a PEM-encoded ES256 key once per process.
+
+    Raises:
+        JWTError: If the key is not a PEM-encoded EC private key
+    """
+    try:
+        key = load_pem_private_key(private_key.strip().encode(), password=None)
+    except Exception as e:
+        raise JWTError(f"Invalid private key: {e}") from e
+    if not isinstance(key, EllipticCurvePrivateKey):
+        raise JWTError("Invalid private key: App Store Connect keys must be EC (ES256)")
+    return key
+
 
 @dataclass
 class JWTCredentials:
@@ -67,18 +92,39 @@ def from_config(
         return None
 
 
+class _TokenState(NamedTuple):
+    """A signed token and its expiry, published as one immutable value."""
+
+    token: str
+    expires_at: float
+
+
 class JWTAuth:
-    """JWT token generator for App Store Connect API."""
+    """JWT token generator for App Store Connect API.
+
+    Safe to share between threads: :meth:`get_token` reads the current
+    token without locking, and only one thread at a time signs a
+    replacement while the others wait for it instead of signing their own.
+    """
 
     # Token lifetime in seconds (max 20 minutes)
     TOKEN_LIFETIME = 20 * 60
     # Refresh token when less than this many seconds remain
     REFRESH_THRESHOLD = 5 * 60
-
-    def __init__(self, credentials: JWTCredentials) -> None:
+    # Background refresh mints the next token this long before REFRESH_THRESHOLD
+    BACKGROUND_REFRESH_LEAD = 60
+
+    def __init__(
+        self,
+        credentials: JWTCredentials,
+        token_cache: JWTTokenCache | None = None,
+    ) -> None:
         self._credentials = credentials
-        self._token: str | None = None
-        self._token_expires_at: float = 0
+        self._token_cache = token_cache
+        self._state: _TokenState | None = None
+        self._refresh_lock = threading.Lock()
+        self._refresher: threading.Thread | None = None
+        self._stop_refresher = threading.Event()
 
     @property
     def key_id(self) -> str:
@@ -107,10 +153,9 @@ def _generate_token(self) -> str:
             "aud": "appstoreconnect-v1",
         }
 
-        try:
-            # Clean up the private key
-            private_key = self._credentials.private_key.strip()
+        private_key = load_signing_key(self._credentials.private_key)
 
+        try:
             token: str = jwt.encode(
                 payload,
                 private_key,
@@ -118,28 +163,130 @@ def _generate_token(self) -> str:
                 headers=headers,
             )
 
-            self._token = token
-            self._token_expires_at = now + self.TOKEN_LIFETIME
+            self._state = _TokenState(token, now + self.TOKEN_LIFETIME)
 
             return token
 
         except Exception as e:
             raise JWTError(f"Failed to generate JWT: {e}") from e
 
-    def get_token(self) -> str:
-        """Get a valid JWT token, generating a new one if needed."""
+    def _needs_refresh(self, expires_at: float, now: float) -> bool:
+        """Whether a token expiring at ``expires_at`` is too old to hand out."""
+        return now >= expires_at - self.REFRESH_THRESHOLD
+
+    def _load_cached_token(self, now: float) -> str | None:
+        """Adopt a still-valid token signed by an earlier process."""
+        if self._token_cache is None:
+            return None
+
+        cached = self._token_cache.load(
+            self.key_id, self.issuer_id, key_fingerprint(self._credentials.private_key)
+        )
+        if cached is None or self._needs_refresh(cached.expires_at, now):
+            return None
+
+        self._state = _TokenState(cached.token, cached.expires_at)
+        return cached.token
+
+    def _refresh(self, force: bool = False) -> str:
+        """Replace the current token; callers serialize on the refresh lock."""
+        with self._refresh_lock:
+            return self._refresh_locked(force)
+
+    def _refresh_locked(self, force: bool) -> str:
         now = time.time()
+        state = self._state
+        # Another thread may have refreshed while we waited for the lock
+        if not force and state is not None and not self._needs_refresh(state.expires_at, now):
+            return state.token
+
+        if not force:
+            token = self._load_cached_token(now)
+            if token is not None:
+                return token
+
+        token = self._generate_token()
+        state = self._state
+        if self._token_cache is not None and state is not None:
+            self._token_cache.store(
+                self.key_id,
+                self.issuer_id,
+                key_fingerprint(self._credentials.private_key),
+                CachedToken(token=state.token, expires_at=state.expires_at),
+            )
+        return token
+
+    def renew(self, rejected_token: str) -> str:
+        """Replace a token the server rejected, unless another caller already has.
 
-        # Check if we need a new token
-        if self._token is None or now >= (self._token_expires_at - self.REFRESH_THRESHOLD):
-            return self._generate_token()
+        Many requests failing with the same token trigger a single new
+        signature; later callers get the token the first one minted.
+        """
+        with self._refresh_lock:
+            state = self._state
+            if state is not None and state.token != rejected_token:
+                return state.token
 
-        return self._token
+            if self._token_cache is not None:
+                self._token_cache.clear(self.key_id, self.issuer_id)
+            return self._refresh_locked(force=True)
+
+    def get_token(self) -> str:
+        """Get a valid JWT token, generating a new one if needed."""
+        # Lock-free fast path: the state tuple is replaced atomically
+        state = self._state
+        if state is not None and not self._needs_refresh(state.expires_at, time.time()):
+            return state.token
+
+        return self._refresh()
 
     def invalidate(self) -> None:
-        """Invalidate the current token."""
-        self._token = None
-        self._token_expires_at = 0
+        """Invalidate the current token (and any cached copy)."""
+        self._state = None
+        if self._token_cache is not None:
+            self._token_cache.clear(self.key_id, self.issuer_id)
+
+    def start_background_refresh(self) -> None:
+        """Mint replacement tokens on a daemon thread before they are needed.
+
+        Workers calling :meth:`get_token` then always find a fresh token and
+        never wait on ES256 signing. Calling this again is a no-op.
+        """
+        if self._refresher is not None and self._refresher.is_alive():
+            return
+
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, name="slowlane-jwt-refresh", daemon=True
+        )
+        self._refresher.start()
+
+    def stop_background_refresh(self) -> None:
+        """Stop the background refresher, if running."""
+        self._stop_refresher.set()
+        if self._refresher is not None:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+
+    def _refresh_loop(self) -> None:
+        while not self._stop_refresher.is_set():
+            state = self._state
+            if state is None:
+                wait = 0.0
+            else:
+                lead = self.REFRESH_THRESHOLD + self.BACKGROUND_REFRESH_LEAD
+                wait = max(0.0, state.expires_at - lead - time.time())
+
+            if self._stop_refresher.wait(wait):
+                return
+
+            try:
+                self._refresh(force=state is not None and self._state is state)
+            except JWTError as e:
+                logger.warning("Background JWT refresh failed: %s", e)
+                # Retry shortly rather than spinning on a broken key
+                if self._stop_refresher.wait(self.BACKGROUND_REFRESH_LEAD):
+                    return
 
 
 def get_jwt_auth(
@@ -152,15 +299,17 @@ def get_jwt_auth(
     1. Environment variables (ASC_KEY_ID, ASC_ISSUER_ID, ASC_PRIVATE_KEY)
     2. Config file + secret store
     """
+    token_cache = JWTTokenCache() if config and config.auth.token_cache else None
+
     # Try environment first
     creds = JWTCredentials.from_env()
     if creds:
-        return JWTAuth(creds)
+        return JWTAuth(creds, token_cache=token_cache)
 
     # Try config
     if config:
         creds = JWTCredentials.from_config(config, secret_store)
         if creds:
-            return JWTAuth(creds)
+            return JWTAuth(creds, token_cache=token_cache)
 
     return None
@@ -0,0 +1,157 @@
+"""Auth layer between the API clients and the HTTP client: attach and renew JWTs."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import httpx
+
+from slowlane.auth.jwt_auth import JWTAuth
+from slowlane.core.errors import AuthExpiredError
+from slowlane.core.http import AppleHTTPClient, AsyncAppleHTTPClient
+from slowlane.core.memcache import CacheStats
+from slowlane.core.singleflight import SingleFlightStats
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _is_rejected_token(error: AuthExpiredError) -> bool:
+    """A 401 means the token itself was refused; 403 is a permissions problem."""
+    return error.context.get("status_code") == 401
+
+
+class AuthMiddleware:
+    """Attach the current JWT to each request and recover once from a 401.
+
+    When Apple rejects a token, the token is renewed through
+    :meth:`JWTAuth.renew`, so concurrent requests failing with the same
+    token share a single new signature, and the request is replayed once.
+    A 401 carries no side effects, so replaying writes is safe. Without
+    ``jwt_auth`` (session cookies) requests pass straight through; a
+    session can only be renewed by logging in again.
+    """
+
+    def __init__(self, http: AppleHTTPClient, jwt_auth: JWTAuth | None = None) -> None:
+        self._http = http
+        self._jwt_auth = jwt_auth
+        self._renew_lock = threading.Lock()
+        self.renewals = 0
+
+    @property
+    def memory_cache_stats(self) -> CacheStats | None:
+        return self._http.memory_cache_stats
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        return self._http.coalescing_stats
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        return self._http.cookies
+
+    def set_cookies(self, cookies: dict[str, str]) -> None:
+        self._http.set_cookies(cookies)
+
+    def close(self) -> None:
+        self._http.close()
+
+    def _call(self, send: Callable[[], T]) -> T:
+        if self._jwt_auth is None:
+            return send()
+
+        token = self._jwt_auth.get_token()
+        self._http.set_jwt_token(token)
+        try:
+            return send()
+        except AuthExpiredError as e:
+            if not _is_rejected_token(e):
+                raise
+            logger.info("API token rejected, renewing and retrying once")
+
+        with self._renew_lock:
+            self._http.set_jwt_token(self._jwt_auth.renew(token))
+            self.renewals += 1
+        return send()
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._call(lambda: self._http.get(url, **kwargs))
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._call(lambda: self._http.post(url, **kwargs))
+
+    def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._call(lambda: self._http.patch(url, **kwargs))
+
+    def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self._call(lambda: self._http.delete(url, **kwargs))
+
+    def get_json(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        return self._call(lambda: self._http.get_json(url, **kwargs))
+
+    def post_json(self, url: str, data: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        return self._call(lambda: self._http.post_json(url, data, **kwargs))
+
+
+class AsyncAuthMiddleware:
+    """Asyncio counterpart of :class:`AuthMiddleware`."""
+
+    def __init__(self, http: AsyncAppleHTTPClient, jwt_auth: JWTAuth | None = None) -> None:
+        self._http = http
+        self._jwt_auth = jwt_auth
+        self._renew_lock = threading.Lock()
+        self.renewals = 0
+
+    @property
+    def memory_cache_stats(self) -> CacheStats | None:
+        return self._http.memory_cache_stats
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        return self._http.coalescing_stats
+
+    def set_cookies(self, cookies: dict[str, str]) -> None:
+        self._http.set_cookies(cookies)
+
+    async def close(self) -> None:
+        await self._http.close()
+
+    async def _call(self, send: Callable[[], Awaitable[T]]) -> T:
+        if self._jwt_auth is None:
+            return await send()
+
+        token = self._jwt_auth.get_token()
+        self._http.set_jwt_token(token)
+        try:
+            return await send()
+        except AuthExpiredError as e:
+            if not _is_rejected_token(e):
+                raise
+            logger.info("API token rejected, renewing and retrying once")
+
+        with self._renew_lock:
+            self._http.set_jwt_token(self._jwt_auth.renew(token))
+            self.renewals += 1
+        return await send()
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._call(lambda: self._http.get(url, **kwargs))
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._call(lambda: self._http.post(url, **kwargs))
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._call(lambda: self._http.patch(url, **kwargs))
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self._call(lambda: self._http.delete(url, **kwargs))
+
+    async def get_json(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        return await self._call(lambda: self._http.get_json(url, **kwargs))
+
+    async def post_json(self, url: str, data: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        return await self._call(lambda: self._http.post_json(url, data, **kwargs))
@@ -3,13 +3,26 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import json
+import logging
+import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any, ClassVar
 
+from slowlane.core.config import get_data_dir
 from slowlane.core.errors import SessionError
 from slowlane.core.secrets import SessionData, hash_email
 
+logger = logging.getLogger(__name__)
+
+
+def get_browser_profile_path(target_service: str) -> Path:
+    """Get the saved browser state (cookies, local storage) for a service."""
+    return get_data_dir() / "browser" / f"{target_service}.json"
+
 
 @dataclass
 class PlaywrightLoginResult:
@@ -35,22 +48,40 @@ class PlaywrightLoginFlow:
     # Cookies we need to extract
     TARGET_COOKIES: ClassVar[list[str]] = ["myacinfo", "DES", "dqsid", "itctx", "itcdq"]
 
+    # Resource types the login form does not need
+    BLOCKED_RESOURCE_TYPES: ClassVar[frozenset[str]] = frozenset({"image", "media", "font"})
+    # Analytics and telemetry hosts loaded alongside the login pages
+    BLOCKED_HOSTS: ClassVar[tuple[str, ...]] = (
+        "securemetrics.apple.com",
+        "metrics.apple.com",
+        "xp.apple.com",
+    )
+
     # Timeout for login flow (5 minutes)
     LOGIN_TIMEOUT_MS = 5 * 60 * 1000
+    # How long to wait for the landing page once the session cookie is set
+    SETTLE_TIMEOUT_MS = 10 * 1000
 
     def __init__(
         self,
         headless: bool = False,
         target_url: str | None = None,
+        block_resources: bool = True,
+        storage_state_path: Path | None = None,
     ) -> None:
         """Initialize login flow.
 
         Args:
             headless: Run browser in headless mode (not recommended for 2FA)
             target_url: URL to navigate to after login (default: App Store Connect)
+            block_resources: Skip images, fonts, media and analytics requests
+            storage_state_path: Browser state to start from and save after
+                login, so a still-valid Apple ID session skips the login form
         """
         self._headless = headless
         self._target_url = target_url or self.APPSTORE_CONNECT_URL
+        self._block_resources = block_resources
+        self._storage_state_path = storage_state_path
 
     async def run_async(self) -> PlaywrightLoginResult:
         """Run the login flow asynchronously."""
@@ -64,7 +95,9 @@ async def run_async(self) -> PlaywrightLoginResult:
 
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=self._headless)
-            context = await browser.new_context()
+            context = await browser.new_context(storage_state=self._load_storage_state())
+            if self._block_resources:
+                await context.route("**/*", self._route_request)
             page = await context.new_page()
 
             try:
@@ -101,6 +134,7 @@ async def run_async(self) -> PlaywrightLoginResult:
                         error_message="Login completed but required cookies not found",
                     )
 
+                await self._save_storage_state(context)
                 return PlaywrightLoginResult(
                     success=True,
                     cookies=cookies_dict,
@@ -110,38 +144,94 @@ async def run_async(self) -> PlaywrightLoginResult:
             finally:
                 await browser.close()
 
+    def _load_storage_state(self) -> str | None:
+        """Path of the saved browser state, if there is a usable one."""
+        path = self._storage_state_path
+        if path is None or not path.exists():
+            return None
+        try:
+            json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable browser profile %s: %s", path, e)
+            return None
+        return str(path)
+
+    async def _save_storage_state(self, context: Any) -> None:
+        """Persist the browser state for the next login; failures are not fatal."""
+        path = self._storage_state_path
+        if path is None:
+            return
+        try:
+            state = await context.storage_state()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # The state holds session cookies, so keep it private to the user
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except Exception as e:
+            logger.debug("Failed to save browser profile %s: %s", path, e)
+
+    async def _route_request(self, route: Any) -> None:
+        """Abort requests the login does not need; let everything else through."""
+        request = route.request
+        if request.resource_type in self.BLOCKED_RESOURCE_TYPES or any(
+            host in request.url for host in self.BLOCKED_HOSTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _is_logged_in_url(self, url: str) -> bool:
+        """Whether a page URL is past the Apple ID login."""
+        return (
+            "appstoreconnect.apple.com" in url or "developer.apple.com/account" in url
+        ) and "auth" not in url
+
     async def _wait_for_login_completion(self, page: Any, context: Any) -> None:
-        """Wait for the login to complete."""
-        # We consider login complete when:
-        # 1. URL contains appstoreconnect.apple.com or developer.apple.com
-        # 2. OR we have the myacinfo cookie
-
-        def check_url() -> bool:
-            url = page.url
-            return (
-                "appstoreconnect.apple.com" in url
-                or "developer.apple.com/account" in url
-            ) and "auth" not in url
-
-        async def check_cookies() -> bool:
-            cookies = await context.cookies()
-            return any(cookie["name"] == "myacinfo" for cookie in cookies)
-
-        # Poll for completion
-        start_time = asyncio.get_event_loop().time()
-        timeout_seconds = self.LOGIN_TIMEOUT_MS / 1000
-
-        while True:
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed > timeout_seconds:
-                raise SessionError("Login timed out after 5 minutes")
-
-            if check_url() or await check_cookies():
-                # Give it a moment for all cookies to be set
-                await asyncio.sleep(1)
+        """Wait for the login to complete.
+
+        Login is complete when the main frame navigates to App Store Connect
+        or the Developer Portal, or a response sets the ``myacinfo`` cookie.
+        Both are observed from page events rather than by polling. The cookie
+        can arrive mid-redirect on idmsa, before the other session cookies,
+        so it is followed by up to ``SETTLE_TIMEOUT_MS`` for the navigation.
+        """
+        done = asyncio.Event()
+        landed = asyncio.Event()
+
+        def on_navigated(frame: Any) -> None:
+            if frame == page.main_frame and self._is_logged_in_url(frame.url):
+                landed.set()
+                done.set()
+
+        async def on_response(response: Any) -> None:
+            if done.is_set():
                 return
+            with contextlib.suppress(Exception):
+                set_cookie = await response.header_value("set-cookie")
+                if set_cookie and "myacinfo=" in set_cookie:
+                    done.set()
 
-            await asyncio.sleep(0.5)
+        page.on("framenavigated", on_navigated)
+        page.on("response", on_response)
+        try:
+            # A restored browser profile may already be signed in
+            if self._is_logged_in_url(page.url):
+                landed.set()
+                done.set()
+            try:
+                await asyncio.wait_for(done.wait(), timeout=self.LOGIN_TIMEOUT_MS / 1000)
+            except TimeoutError as e:
+                raise SessionError("Login timed out after 5 minutes") from e
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(landed.wait(), timeout=self.SETTLE_TIMEOUT_MS / 1000)
+        finally:
+            page.remove_listener("framenavigated", on_navigated)
+            page.remove_listener("response", on_response)
+
+        # Let the landing page finish setting its session cookies
+        with contextlib.suppress(Exception):
+            await page.wait_for_load_state("load", timeout=10_000)
 
     async def _extract_email(self, page: Any) -> str:
         """Try to extract logged-in email from the page."""
@@ -173,12 +263,16 @@ def run(self) -> PlaywrightLoginResult:
 def interactive_login(
     headless: bool = False,
     target_service: str = "appstoreconnect",
+    block_resources: bool = True,
+    keep_profile: bool = False,
 ) -> SessionData:
     """Perform interactive login and return session data.
 
     Args:
         headless: Run browser in headless mode (not recommended)
         target_service: "appstoreconnect" or "developer"
+        block_resources: Skip images, fonts, media and analytics requests
+        keep_profile: Reuse and save the browser state under the data directory
 
     Returns:
         SessionData with extracted cookies
@@ -191,7 +285,12 @@ def interactive_login(
     else:
         target_url = PlaywrightLoginFlow.APPSTORE_CONNECT_URL
 
-    flow = PlaywrightLoginFlow(headless=headless, target_url=target_url)
+    flow = PlaywrightLoginFlow(
+        headless=headless,
+        target_url=target_url,
+        block_resources=block_resources,
+        storage_state_path=get_browser_profile_path(target_service) if keep_profile else None,
+    )
     result = flow.run()
 
     if not result.success:
@@ -3,14 +3,23 @@
 from __future__ import annotations
 
 import base64
+import dataclasses
 import json
 import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import ClassVar
 
+from slowlane.core.config import HttpConfig
+from slowlane.core.http import AppleHTTPClient
 from slowlane.core.secrets import SecretStore, SessionData, hash_email
 
+# Cheap authenticated endpoint; a successful GET keeps the session alive
+KEEPALIVE_URL = "https://appstoreconnect.apple.com/olympus/v1/session"
+
+# Cookies worth persisting when Apple rotates them
+SESSION_COOKIES = frozenset({"myacinfo", "DES", "dqsid", "itctx", "itcdq"})
+
 
 @dataclass
 class SessionCredentials:
@@ -87,12 +96,25 @@ def created_at(self) -> datetime:
         """Get session creation time."""
         return self._session_data.created_at
 
+    @property
+    def verified_at(self) -> datetime | None:
+        """When the session was last confirmed against Apple, if ever."""
+        return self._session_data.verified_at
+
+    @property
+    def session_data(self) -> SessionData:
+        """Get the underlying session data."""
+        return self._session_data
+
     @property
     def is_stale(self) -> bool:
-        """Check if session is stale and should be refreshed."""
-        age = datetime.now(UTC) - self._session_data.created_at.replace(
-            tzinfo=UTC
-        )
+        """Check if session is stale and should be refreshed.
+
+        Age counts from the last successful keep-alive, or from creation
+        when the session was never verified.
+        """
+        last_seen = self._session_data.verified_at or self._session_data.created_at
+        age = datetime.now(UTC) - last_seen.replace(tzinfo=UTC)
         return age.days >= self.STALE_THRESHOLD_DAYS
 
     def validate(self) -> bool:
@@ -149,6 +171,51 @@ def create_session_from_cookies(
     )
 
 
+def refresh_session(
+    session_data: SessionData,
+    http: AppleHTTPClient | None = None,
+    http_config: HttpConfig | None = None,
+) -> SessionData:
+    """Touch an authenticated endpoint and return the session kept alive.
+
+    Cookies Apple rotates in the response replace the stored ones, and
+    ``verified_at`` is set to now.
+
+    Args:
+        session_data: Session to refresh
+        http: HTTP client to use (created from ``http_config`` if omitted)
+        http_config: Configuration for a client created here
+
+    Raises:
+        AuthExpiredError: If Apple no longer accepts the session
+        NetworkError: If Apple could not be reached
+    """
+    owns_client = http is None
+    if http is None:
+        # Never answer a keep-alive from the HTTP cache
+        http = AppleHTTPClient(config=dataclasses.replace(http_config or HttpConfig(), cache=False))
+
+    try:
+        http.set_cookies(session_data.cookies)
+        http.get(KEEPALIVE_URL)
+        # The client's jar also holds cookies set on redirects along the way
+        cookies = http.cookies
+    finally:
+        if owns_client:
+            http.close()
+
+    rotated = {
+        name: value
+        for name, value in cookies.items()
+        if name in SESSION_COOKIES or name in session_data.cookies
+    }
+    return dataclasses.replace(
+        session_data,
+        cookies={**session_data.cookies, **rotated},
+        verified_at=datetime.now(UTC),
+    )
+
+
 def validate_session_cookies(cookies: dict[str, str]) -> list[str]:
     """Validate session cookies and return list of missing required cookies."""
     missing = []
@@ -0,0 +1,89 @@
+"""Encrypted on-disk cache of App Store Connect JWTs shared between invocations."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+from slowlane.core.config import get_data_dir
+from slowlane.core.secrets import EncryptedFileBackend
+
+logger = logging.getLogger(__name__)
+
+
+def get_token_cache_dir() -> Path:
+    """Get the directory holding cached tokens."""
+    return get_data_dir() / "tokens"
+
+
+def key_fingerprint(private_key: str) -> str:
+    """Fingerprint a private key so cached tokens die with a rotated key."""
+    return hashlib.sha256(private_key.strip().encode()).hexdigest()
+
+
+@dataclass
+class CachedToken:
+    """A signed JWT and when it expires."""
+
+    token: str
+    expires_at: float
+
+
+class JWTTokenCache:
+    """Fernet-encrypted token store keyed by key ID and issuer.
+
+    Short-lived CLI invocations reuse a token signed by an earlier process
+    instead of re-signing one each time. Entries record a fingerprint of
+    the private key, so a rotated key never picks up an old token. Cache
+    failures are logged and treated as misses; they never block signing.
+    """
+
+    def __init__(self, storage_dir: Path | None = None) -> None:
+        self._storage_dir = storage_dir or get_token_cache_dir()
+        self._backend: EncryptedFileBackend | None = None
+
+    def _get_backend(self) -> EncryptedFileBackend:
+        if self._backend is None:
+            self._backend = EncryptedFileBackend(self._storage_dir)
+        return self._backend
+
+    @staticmethod
+    def _key(key_id: str, issuer_id: str) -> str:
+        return f"jwt:{issuer_id}:{key_id}"
+
+    def load(self, key_id: str, issuer_id: str, fingerprint: str) -> CachedToken | None:
+        """Load a cached token for this key, if one exists and matches the key."""
+        try:
+            raw = self._get_backend().retrieve(self._key(key_id, issuer_id))
+            if raw is None:
+                return None
+            data = json.loads(raw)
+        except Exception as e:
+            logger.debug("Ignoring unreadable JWT cache entry: %s", e)
+            return None
+
+        if data.get("fingerprint") != fingerprint:
+            return None
+        return CachedToken(token=data["token"], expires_at=float(data["expires_at"]))
+
+    def store(self, key_id: str, issuer_id: str, fingerprint: str, token: CachedToken) -> None:
+        """Store a freshly signed token."""
+        data = {
+            "token": token.token,
+            "expires_at": token.expires_at,
+            "fingerprint": fingerprint,
+        }
+        try:
+            self._get_backend().store(self._key(key_id, issuer_id), json.dumps(data))
+        except Exception as e:
+            logger.debug("Failed to cache JWT: %s", e)
+
+    def clear(self, key_id: str, issuer_id: str) -> None:
+        """Remove the cached token for a key."""
+        try:
+            self._get_backend().delete(self._key(key_id, issuer_id))
+        except Exception as e:
+            logger.debug("Failed to clear cached JWT: %s", e)
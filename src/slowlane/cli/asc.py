@@ -3,19 +3,33 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Callable
-from typing import Any
+from collections.abc import Callable, Iterator, Sequence
+from datetime import UTC, datetime
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from slowlane.asc.client import AppStoreConnectClient
-from slowlane.auth.jwt_auth import get_jwt_auth
-from slowlane.auth.session_auth import get_session_auth
+from slowlane.cli.context import get_context
+from slowlane.cli.output import (
+    OUTPUT_OPTION,
+    Column,
+    RowWriter,
+    attribute,
+    resource_id,
+    resource_table,
+    status,
+)
 from slowlane.core.config import SlowlaneConfig
-from slowlane.core.errors import AuthExpiredError
-from slowlane.core.secrets import SecretStore
+from slowlane.core.errors import SlowlaneError
+
+if TYPE_CHECKING:
+    from slowlane.asc.client import AppStoreConnectClient
+    from slowlane.asc.mirror import ResourceMirror
 
 app = typer.Typer(
     name="asc",
@@ -32,45 +46,126 @@
 app.add_typer(builds_app, name="builds")
 app.add_typer(testflight_app, name="testflight")
 
+# JSON:API query options shared by list/get commands
+FIELDS_OPTION = typer.Option(
+    None, "--fields", help="Sparse fieldset as TYPE=attr,attr (repeatable)"
+)
+INCLUDE_OPTION = typer.Option(
+    None, "--include", help="Related resources to include (repeatable or comma-separated)"
+)
+INCLUDE_LIMIT_OPTION = typer.Option(
+    None, "--include-limit", help="Max included items as RELATIONSHIP=N (repeatable)"
+)
+CACHED_OPTION = typer.Option(
+    False, "--cached", help="Answer from the local mirror (see `asc sync`) without API calls"
+)
+
+# Columns shared by the tables and --output tsv/csv
+APP_COLUMNS = [
+    Column("ID", resource_id, style="cyan"),
+    Column("Name", attribute("name")),
+    Column("Bundle ID", attribute("bundleId")),
+    Column("SKU", attribute("sku")),
+]
+BUILD_COLUMNS = [
+    Column("ID", resource_id, style="cyan"),
+    Column("Version", attribute("version")),
+    Column("Build Number", attribute("buildVersionIdentifier")),
+    Column("Processing State", attribute("processingState")),
+    Column("Uploaded", lambda build: (attribute("uploadedDate")(build) or "")[:10]),
+]
+TESTER_COLUMNS = [
+    Column("ID", resource_id, style="cyan"),
+    Column("Email", attribute("email")),
+    Column("First Name", attribute("firstName")),
+    Column("Last Name", attribute("lastName")),
+    Column(
+        "Invite Type",
+        lambda tester: (attribute("betaTesterMetric")(tester) or {}).get("betaTesterState"),
+    ),
+]
+GROUP_COLUMNS = [
+    Column("ID", resource_id, style="cyan"),
+    Column("Name", attribute("name")),
+    Column("Public Link Enabled", lambda g: "Yes" if attribute("publicLinkEnabled")(g) else "No"),
+    Column("Internal", lambda g: "Yes" if attribute("isInternalGroup")(g) else "No"),
+]
+
 
 def get_client(ctx: typer.Context) -> AppStoreConnectClient:
     """Get authenticated ASC client."""
-    if ctx.obj is None:
-        config = SlowlaneConfig.load()
-    else:
-        config = ctx.obj.get("config", SlowlaneConfig.load())
-    secret_store = SecretStore()
-
-    # Try JWT first
-    jwt_auth = get_jwt_auth(config, secret_store)
-    if jwt_auth:
-        return AppStoreConnectClient(jwt_auth=jwt_auth, config=config)
-
-    # Fall back to session
-    session_auth = get_session_auth(secret_store=secret_store)
-    if session_auth:
-        return AppStoreConnectClient(session_auth=session_auth, config=config)
-
-    raise AuthExpiredError(
-        "No authentication configured. Either set ASC_KEY_ID/ASC_ISSUER_ID/ASC_PRIVATE_KEY "
-        "or run 'spaceauth login'"
-    )
+    return get_context(ctx).asc_client
 
 
 def get_console(ctx: typer.Context) -> Console:
     """Get console from context."""
-    if ctx.obj is None:
-        return Console()
-    console = ctx.obj.get("console")
-    return console if isinstance(console, Console) else Console()
+    return get_context(ctx).console
 
 
 def get_config(ctx: typer.Context) -> SlowlaneConfig:
     """Get config from context."""
-    if ctx.obj is None:
-        return SlowlaneConfig.load()
-    config = ctx.obj.get("config")
-    return config if isinstance(config, SlowlaneConfig) else SlowlaneConfig.load()
+    return get_context(ctx).config
+
+
+def get_mirror(
+    resource_type: str, query: dict[str, Any], app_id: str | None = None
+) -> ResourceMirror:
+    """Open the local mirror for a --cached listing of ``resource_type``."""
+    from slowlane.asc.mirror import ResourceMirror
+
+    if any(query.values()):
+        raise typer.BadParameter(
+            "--fields, --include and --include-limit need the API", param_hint="--cached"
+        )
+    mirror = ResourceMirror()
+    if mirror.synced_at(resource_type, app_id) is None:
+        sync_command = f"slowlane asc sync --app {app_id}" if app_id else "slowlane asc sync"
+        raise SlowlaneError(
+            f"No {resource_type} in the local mirror; run `{sync_command}` first",
+            path=str(mirror.path),
+        )
+    return mirror
+
+
+def _split_assignment(value: str, option: str) -> tuple[str, str]:
+    """Split a NAME=VALUE option value."""
+    name, sep, rest = value.partition("=")
+    if not sep or not name.strip() or not rest.strip():
+        raise typer.BadParameter(f"Expected NAME=VALUE, got {value!r}", param_hint=option)
+    return name.strip(), rest.strip()
+
+
+def parse_query_options(
+    fields: list[str] | None,
+    include: list[str] | None,
+    include_limit: list[str] | None,
+) -> dict[str, Any]:
+    """Turn --fields/--include/--include-limit values into client keyword arguments."""
+    parsed_fields: dict[str, list[str]] = {}
+    for value in fields or []:
+        resource_type, names = _split_assignment(value, "--fields")
+        parsed_fields.setdefault(resource_type, []).extend(
+            name.strip() for name in names.split(",") if name.strip()
+        )
+
+    parsed_include = [
+        name.strip() for value in include or [] for name in value.split(",") if name.strip()
+    ]
+
+    parsed_limits: dict[str, int] = {}
+    for value in include_limit or []:
+        relationship, count = _split_assignment(value, "--include-limit")
+        if not count.isdigit():
+            raise typer.BadParameter(
+                f"Limit for {relationship!r} must be a number", param_hint="--include-limit"
+            )
+        parsed_limits[relationship] = int(count)
+
+    return {
+        "fields": parsed_fields or None,
+        "include": parsed_include or None,
+        "include_limits": parsed_limits or None,
+    }
 
 
 def output_result(
@@ -88,53 +183,80 @@ def output_result(
         console.print(data)
 
 
+def stream_result(
+    console: Console,
+    format: str,
+    columns: Sequence[Column],
+    fetch: Callable[..., Iterator[dict[str, Any]]],
+    limit: int,
+) -> None:
+    """Write up to ``limit`` (0: all) resources as ndjson/tsv/csv rows while pages arrive.
+
+    ``fetch`` is a client ``iter_*`` method, called with the page size to use.
+    """
+    from slowlane.asc.client import page_size_for
+
+    page_size = page_size_for(limit or None)
+    writer = RowWriter(console.file, format, columns, flush_every=page_size)
+    writer.write_all(islice(fetch(page_size=page_size), limit or None))
+
+
 # Apps commands
 @apps_app.command("list")
 def apps_list(
     ctx: typer.Context,
-    limit: int = typer.Option(50, "--limit", "-l", help="Max results"),
+    limit: int = typer.Option(50, "--limit", "-l", min=0, help="Max results (0 for all)"),
+    fields: list[str] | None = FIELDS_OPTION,
+    include: list[str] | None = INCLUDE_OPTION,
+    include_limit: list[str] | None = INCLUDE_LIMIT_OPTION,
+    output: str | None = OUTPUT_OPTION,
+    cached: bool = CACHED_OPTION,
 ) -> None:
     """List all apps in App Store Connect."""
+    query = parse_query_options(fields, include, include_limit)
+    mirror = get_mirror("apps", query) if cached else None
     console = get_console(ctx)
     config = get_config(ctx)
 
-    with console.status("[bold blue]Fetching apps...[/bold blue]"):
-        client = get_client(ctx)
-        apps = client.list_apps(limit=limit)
-
-    def build_table(data: list[dict[str, Any]]) -> None:
-        table = Table(title="Apps")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name")
-        table.add_column("Bundle ID")
-        table.add_column("SKU")
-
-        for app in data:
-            attrs = app.get("attributes", {})
-            table.add_row(
-                app.get("id", ""),
-                attrs.get("name", ""),
-                attrs.get("bundleId", ""),
-                attrs.get("sku", ""),
-            )
-
-        console.print(table)
+    if output:
+        if mirror:
+            fetch = partial(mirror.iter_resources, "apps")
+        else:
+            fetch = partial(get_client(ctx).iter_apps, **query)
+        stream_result(console, output, APP_COLUMNS, fetch, limit)
+        return
 
-    output_result(console, apps, config.output.format, build_table)
+    if mirror:
+        apps = mirror.list_resources("apps", limit=limit or None)
+    else:
+        with status(console, "[bold blue]Fetching apps...[/bold blue]"):
+            client = get_client(ctx)
+            apps = client.list_apps(limit=limit or None, **query)
+
+    output_result(
+        console,
+        apps,
+        config.output.format,
+        lambda data: console.print(resource_table("Apps", APP_COLUMNS, data)),
+    )
 
 
 @apps_app.command("get")
 def apps_get(
     ctx: typer.Context,
     app_id: str = typer.Argument(..., help="App ID or bundle ID"),
+    fields: list[str] | None = FIELDS_OPTION,
+    include: list[str] | None = INCLUDE_OPTION,
+    include_limit: list[str] | None = INCLUDE_LIMIT_OPTION,
 ) -> None:
     """Get details for a specific app."""
+    query = parse_query_options(fields, include, include_limit)
     console = get_console(ctx)
     config = get_config(ctx)
 
-    with console.status("[bold blue]Fetching app...[/bold blue]"):
+    with status(console, "[bold blue]Fetching app...[/bold blue]"):
         client = get_client(ctx)
-        app_data = client.get_app(app_id)
+        app_data = client.get_app(app_id, **query)
 
     if config.output.format == "json":
         console.print(json.dumps(app_data, indent=2, default=str))
@@ -152,51 +274,58 @@ def apps_get(
 def builds_list(
     ctx: typer.Context,
     app_id: str | None = typer.Option(None, "--app", "-a", help="Filter by app ID"),
-    limit: int = typer.Option(25, "--limit", "-l", help="Max results"),
+    limit: int = typer.Option(25, "--limit", "-l", min=0, help="Max results (0 for all)"),
+    fields: list[str] | None = FIELDS_OPTION,
+    include: list[str] | None = INCLUDE_OPTION,
+    include_limit: list[str] | None = INCLUDE_LIMIT_OPTION,
+    output: str | None = OUTPUT_OPTION,
+    cached: bool = CACHED_OPTION,
 ) -> None:
     """List builds in App Store Connect."""
+    query = parse_query_options(fields, include, include_limit)
+    mirror = get_mirror("builds", query, app_id) if cached else None
     console = get_console(ctx)
     config = get_config(ctx)
 
-    with console.status("[bold blue]Fetching builds...[/bold blue]"):
-        client = get_client(ctx)
-        builds = client.list_builds(app_id=app_id, limit=limit)
-
-    def build_table(data: list[dict[str, Any]]) -> None:
-        table = Table(title="Builds")
-        table.add_column("ID", style="cyan")
-        table.add_column("Version")
-        table.add_column("Build Number")
-        table.add_column("Processing State")
-        table.add_column("Uploaded")
-
-        for build in data:
-            attrs = build.get("attributes", {})
-            table.add_row(
-                build.get("id", ""),
-                attrs.get("version", ""),
-                attrs.get("buildVersionIdentifier", ""),
-                attrs.get("processingState", ""),
-                attrs.get("uploadedDate", "")[:10] if attrs.get("uploadedDate") else "",
-            )
-
-        console.print(table)
+    if output:
+        if mirror:
+            fetch = partial(mirror.iter_resources, "builds", app_id=app_id)
+        else:
+            fetch = partial(get_client(ctx).iter_builds, app_id=app_id, **query)
+        stream_result(console, output, BUILD_COLUMNS, fetch, limit)
+        return
 
-    output_result(console, builds, config.output.format, build_table)
+    if mirror:
+        builds = mirror.list_resources("builds", app_id=app_id, limit=limit or None)
+    else:
+        with status(console, "[bold blue]Fetching builds...[/bold blue]"):
+            client = get_client(ctx)
+            builds = client.list_builds(app_id=app_id, limit=limit or None, **query)
+
+    output_result(
+        console,
+        builds,
+        config.output.format,
+        lambda data: console.print(resource_table("Builds", BUILD_COLUMNS, data)),
+    )
 
 
 @builds_app.command("latest")
 def builds_latest(
     ctx: typer.Context,
     app_id: str = typer.Argument(..., help="App ID"),
+    fields: list[str] | None = FIELDS_OPTION,
+    include: list[str] | None = INCLUDE_OPTION,
+    include_limit: list[str] | None = INCLUDE_LIMIT_OPTION,
 ) -> None:
     """Get the latest build for an app."""
+    query = parse_query_options(fields, include, include_limit)
     console = get_console(ctx)
     config = get_config(ctx)
 
-    with console.status("[bold blue]Fetching latest build...[/bold blue]"):
+    with status(console, "[bold blue]Fetching latest build...[/bold blue]"):
         client = get_client(ctx)
-        build = client.get_latest_build(app_id)
+        build = client.get_latest_build(app_id, **query)
 
     if not build:
         console.print("[yellow]No builds found for this app[/yellow]")
@@ -219,71 +348,80 @@ def builds_latest(
 def testflight_testers(
     ctx: typer.Context,
     app_id: str | None = typer.Option(None, "--app", "-a", help="Filter by app ID"),
-    limit: int = typer.Option(50, "--limit", "-l", help="Max results"),
+    limit: int = typer.Option(50, "--limit", "-l", min=0, help="Max results (0 for all)"),
+    fields: list[str] | None = FIELDS_OPTION,
+    include: list[str] | None = INCLUDE_OPTION,
+    include_limit: list[str] | None = INCLUDE_LIMIT_OPTION,
+    output: str | None = OUTPUT_OPTION,
+    cached: bool = CACHED_OPTION,
 ) -> None:
     """List TestFlight testers."""
+    query = parse_query_options(fields, include, include_limit)
+    mirror = get_mirror("betaTesters", query, app_id) if cached else None
     console = get_console(ctx)
     config = get_config(ctx)
 
-    with console.status("[bold blue]Fetching testers...[/bold blue]"):
-        client = get_client(ctx)
-        testers = client.list_beta_testers(app_id=app_id, limit=limit)
-
-    def build_table(data: list[dict[str, Any]]) -> None:
-        table = Table(title="TestFlight Testers")
-        table.add_column("ID", style="cyan")
-        table.add_column("Email")
-        table.add_column("First Name")
-        table.add_column("Last Name")
-        table.add_column("Invite Type")
-
-        for tester in data:
-            attrs = tester.get("attributes", {})
-            table.add_row(
-                tester.get("id", ""),
-                attrs.get("email", ""),
-                attrs.get("firstName", ""),
-                attrs.get("lastName", ""),
-                attrs.get("betaTesterMetric", {}).get("betaTesterState", ""),
-            )
-
-        console.print(table)
+    if output:
+        if mirror:
+            fetch = partial(mirror.iter_resources, "betaTesters", app_id=app_id)
+        else:
+            fetch = partial(get_client(ctx).iter_beta_testers, app_id=app_id, **query)
+        stream_result(console, output, TESTER_COLUMNS, fetch, limit)
+        return
 
-    output_result(console, testers, config.output.format, build_table)
+    if mirror:
+        testers = mirror.list_resources("betaTesters", app_id=app_id, limit=limit or None)
+    else:
+        with status(console, "[bold blue]Fetching testers...[/bold blue]"):
+            client = get_client(ctx)
+            testers = client.list_beta_testers(app_id=app_id, limit=limit or None, **query)
+
+    output_result(
+        console,
+        testers,
+        config.output.format,
+        lambda data: console.print(resource_table("TestFlight Testers", TESTER_COLUMNS, data)),
+    )
 
 
 @testflight_app.command("groups")
 def testflight_groups(
     ctx: typer.Context,
     app_id: str | None = typer.Option(None, "--app", "-a", help="Filter by app ID"),
+    limit: int = typer.Option(100, "--limit", "-l", min=0, help="Max results (0 for all)"),
+    fields: list[str] | None = FIELDS_OPTION,
+    include: list[str] | None = INCLUDE_OPTION,
+    include_limit: list[str] | None = INCLUDE_LIMIT_OPTION,
+    output: str | None = OUTPUT_OPTION,
+    cached: bool = CACHED_OPTION,
 ) -> None:
     """List TestFlight beta groups."""
+    query = parse_query_options(fields, include, include_limit)
+    mirror = get_mirror("betaGroups", query, app_id) if cached else None
     console = get_console(ctx)
     config = get_config(ctx)
 
-    with console.status("[bold blue]Fetching groups...[/bold blue]"):
-        client = get_client(ctx)
-        groups = client.list_beta_groups(app_id=app_id)
-
-    def build_table(data: list[dict[str, Any]]) -> None:
-        table = Table(title="TestFlight Beta Groups")
-        table.add_column("ID", style="cyan")
-        table.add_column("Name")
-        table.add_column("Public Link Enabled")
-        table.add_column("Internal")
-
-        for group in data:
-            attrs = group.get("attributes", {})
-            table.add_row(
-                group.get("id", ""),
-                attrs.get("name", ""),
-                "Yes" if attrs.get("publicLinkEnabled") else "No",
-                "Yes" if attrs.get("isInternalGroup") else "No",
-            )
-
-        console.print(table)
+    if output:
+        if mirror:
+            fetch = partial(mirror.iter_resources, "betaGroups", app_id=app_id)
+        else:
+            fetch = partial(get_client(ctx).iter_beta_groups, app_id=app_id, **query)
+        stream_result(console, output, GROUP_COLUMNS, fetch, limit)
+        return
 
-    output_result(console, groups, config.output.format, build_table)
+    if mirror:
+        groups = mirror.list_resources("betaGroups", app_id=app_id, limit=limit or None)
+    else:
+        with status(console, "[bold blue]Fetching groups...[/bold blue]"):
+            client = get_client(ctx)
+            groups = client.list_beta_groups(app_id=app_id, limit=limit or None, **query)
+
+    output_result(
+        console,
+        groups,
+        config.output.format,
+        lambda data: console.print(resource_table("TestFlight Beta Groups", GROUP_COLUMNS, data)),
+    )
 
 
 @testflight_app.command("invite")
@@ -297,7 +435,7 @@ def testflight_invite(
     """Invite a tester to a TestFlight beta group."""
     console = get_console(ctx)
 
-    with console.status("[bold blue]Inviting tester...[/bold blue]"):
+    with status(console, "[bold blue]Inviting tester...[/bold blue]"):
         client = get_client(ctx)
         tester = client.invite_beta_tester(
             email=email,
@@ -308,3 +446,231 @@ def testflight_invite(
 
     console.print(f"[green]✓[/green] Invited {email} to group {group_id}")
     console.print(f"  Tester ID: {tester.get('id', '')}")
+
+
+@testflight_app.command("import")
+def testflight_import(
+    ctx: typer.Context,
+    source: str = typer.Argument(..., help="CSV (with a header) or NDJSON file of testers"),
+    group_id: str = typer.Option(..., "--group", "-g", help="Beta group ID"),
+    format: str | None = typer.Option(
+        None, "--format", "-f", help="csv or ndjson (default: from the file extension)"
+    ),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Invites in flight at once (default: http.max_concurrency)",
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Report what would be invited"),
+    restart: bool = typer.Option(False, "--restart", help="Ignore saved progress and start over"),
+) -> None:
+    """Invite many testers to a beta group from a CSV or NDJSON file.
+
+    Each row needs an email and may have first_name and last_name. Testers
+    already in the group and repeated emails are skipped. If an import is
+    interrupted, running the same command again resumes after the last
+    finished row; --restart starts over (existing testers are still skipped).
+    """
+    from slowlane.asc.tester_import import (
+        IMPORT_FORMATS,
+        ImportProgress,
+        InviteOutcome,
+        import_format_for,
+        import_testers,
+        read_tester_rows,
+    )
+
+    console = get_console(ctx)
+    config = get_config(ctx)
+
+    path = Path(source)
+    if not path.is_file():
+        raise typer.BadParameter(f"File not found: {source}", param_hint="SOURCE")
+    format = (format or import_format_for(path)).lower()
+    if format not in IMPORT_FORMATS:
+        raise typer.BadParameter(
+            f"Expected one of {', '.join(IMPORT_FORMATS)}, got {format!r}", param_hint="--format"
+        )
+
+    progress = ImportProgress.for_source(path, group_id)
+    if restart:
+        progress.row = 0
+    elif progress.row:
+        console.print(f"Resuming after row {progress.row}")
+
+    json_output = config.output.format == "json"
+
+    def report(outcome: InviteOutcome) -> None:
+        if json_output or outcome.status not in ("failed", "invalid"):
+            return
+        console.print(f"[red]✗[/red] Row {outcome.index} {outcome.email}: {outcome.error}")
+
+    client = get_client(ctx)
+    with (
+        path.open(encoding="utf-8", newline="") as lines,
+        status(console, "[bold blue]Importing testers...[/bold blue]"),
+    ):
+        summary = import_testers(
+            client,
+            read_tester_rows(lines, format),
+            group_id,
+            progress,
+            workers=jobs or config.http.max_concurrency,
+            emit=report,
+            dry_run=dry_run,
+        )
+    if not dry_run:
+        progress.clear()
+
+    counts = summary.counts
+    if json_output:
+        payload = {"group": group_id, "dry_run": dry_run, **vars(summary)}
+        payload["failures"] = [vars(failure) for failure in summary.failures]
+        console.print(json.dumps(payload, indent=2, default=str))
+    else:
+        if dry_run:
+            console.print(f"Would invite {counts.get('pending', 0)} tester(s) to group {group_id}")
+        else:
+            console.print(
+                f"[green]✓[/green] Invited {counts.get('invited', 0)} tester(s) to group {group_id}"
+            )
+        console.print(
+            f"  Already in group: {counts.get('existing', 0)}, "
+            f"duplicates in file: {counts.get('duplicate', 0)}, "
+            f"invalid: {counts.get('invalid', 0)}, failed: {counts.get('failed', 0)}"
+        )
+
+    if counts.get("failed") or counts.get("invalid"):
+        raise typer.Exit(code=1)
+
+
+# Quota commands
+@app.command("quota")
+def quota(
+    ctx: typer.Context,
+    offline: bool = typer.Option(
+        False, "--offline", help="Only read the shared ledger; do not spend a request"
+    ),
+) -> None:
+    """Show the remaining hourly API request budget."""
+    from slowlane.core.quota import read_ledger
+
+    console = get_console(ctx)
+    config = get_config(ctx)
+
+    rows: list[dict[str, Any]] = []
+    if not offline:
+        with status(console, "[bold blue]Checking quota...[/bold blue]"):
+            client = get_client(ctx)
+            rate_limit = client.get_rate_limit()
+        if rate_limit is not None:
+            rows.append(
+                {
+                    "source": "api",
+                    "key_id": config.auth.key_id or "",
+                    "limit": rate_limit.limit,
+                    "remaining": rate_limit.remaining,
+                }
+            )
+
+    for entry in read_ledger():
+        rows.append(
+            {
+                "source": "ledger",
+                "key_id": entry.identity,
+                "limit": entry.limit,
+                "remaining": entry.remaining,
+                "updated_at": datetime.fromtimestamp(entry.updated_at, UTC).isoformat(),
+            }
+        )
+
+    if not rows and config.output.format != "json":
+        console.print("[yellow]No quota information available.[/yellow]")
+        console.print("  Quota is reported for API key (JWT) authentication only.")
+        return
+
+    def build_table(data: list[dict[str, Any]]) -> None:
+        table = Table(title="API Quota")
+        table.add_column("Source", style="cyan")
+        table.add_column("Key ID")
+        table.add_column("Remaining", justify="right")
+        table.add_column("Hourly Limit", justify="right")
+        table.add_column("Updated")
+
+        for row in data:
+            table.add_row(
+                row["source"],
+                row["key_id"],
+                str(row["remaining"]),
+                str(row["limit"]),
+                row.get("updated_at", "")[:19],
+            )
+
+        console.print(table)
+
+    output_result(console, rows, config.output.format, build_table)
+
+
+SYNC_TYPES_OPTION = typer.Option(
+    None,
+    "--only",
+    help="Resource types to sync: apps, bundleIds, betaGroups, betaTesters, builds "
+    "(repeatable or comma-separated)",
+)
+
+
+@app.command("sync")
+def sync(
+    ctx: typer.Context,
+    app_id: str | None = typer.Option(
+        None, "--app", "-a", help="Only sync builds, groups and testers of this app"
+    ),
+    only: list[str] | None = SYNC_TYPES_OPTION,
+    full: bool = typer.Option(False, "--full", help="Re-read builds instead of only new ones"),
+) -> None:
+    """Mirror App Store Connect resources into a local SQLite database.
+
+    Apps, bundle IDs, beta groups, beta testers and builds are stored under
+    the data directory (or SLOWLANE_MIRROR_DB), where `--cached` list
+    commands read them. Builds are refreshed incrementally, newest first, down
+    to the last sync's high-water mark; other types are re-read in full.
+    """
+    from slowlane.asc.mirror import MIRROR_SPECS, ResourceMirror
+
+    console = get_console(ctx)
+    config = get_config(ctx)
+
+    types = [name.strip() for value in only or [] for name in value.split(",") if name.strip()]
+    unknown = [name for name in types if name not in MIRROR_SPECS]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown resource type(s): {', '.join(unknown)}", param_hint="--only"
+        )
+
+    client = get_client(ctx)
+    mirror = ResourceMirror()
+    results = []
+    for resource_type in [name for name in MIRROR_SPECS if not types or name in types]:
+        with status(console, f"[bold blue]Syncing {resource_type}...[/bold blue]"):
+            results.append(mirror.sync(client, resource_type, app_id=app_id, full=full))
+
+    if config.output.format == "json":
+        payload = {"path": str(mirror.path), "results": [vars(result) for result in results]}
+        console.print(json.dumps(payload, indent=2, default=str))
+        return
+
+    table = Table(title=f"Mirror ({mirror.path})")
+    table.add_column("Type", style="cyan")
+    table.add_column("Fetched", justify="right")
+    table.add_column("Removed", justify="right")
+    table.add_column("Mode")
+    for result in results:
+        table.add_row(
+            result.resource_type,
+            str(result.fetched),
+            str(result.removed),
+            "incremental" if result.incremental else "full",
+        )
+    console.print(table)
@@ -0,0 +1,240 @@
+"""Batch mode: run many commands in one process, NDJSON in and out."""
+
+from __future__ import annotations
+
+import functools
+import json
+import queue
+import shlex
+import sys
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from slowlane.cli.context import CLIContext, get_context
+from slowlane.cli.runner import run_command
+from slowlane.core.daemon import FORWARDED_COMMANDS, forwarded_command, needs_confirmation
+from slowlane.core.errors import ExitCode
+
+app = typer.Typer(
+    name="batch",
+    help="Run many commands in one process (NDJSON in, NDJSON out).",
+)
+
+# Width for captured tables; long lines are never wrapped
+OUTPUT_WIDTH = 200
+
+Result = dict[str, Any]
+
+
+@dataclass
+class BatchRecord:
+    """One command read from the input."""
+
+    line: int
+    id: str
+    argv: list[str]
+    after: list[str] = field(default_factory=list)
+
+
+def parse_record(line: int, text: str, known_ids: Iterable[str]) -> BatchRecord:
+    """Parse one NDJSON command record.
+
+    A record is ``{"argv": ["asc", "apps", "list"]}`` or
+    ``{"command": "asc apps list"}``, with an optional ``id`` (default: the
+    line number) and ``after``, a list of earlier ids that must succeed
+    before this command starts.
+
+    Raises:
+        ValueError: If the record is malformed
+    """
+    try:
+        data = json.loads(text)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Record must be a JSON object")
+
+    if "argv" in data:
+        argv = data["argv"]
+        if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+            raise ValueError("'argv' must be a list of strings")
+    elif isinstance(data.get("command"), str):
+        argv = shlex.split(data["command"])
+    else:
+        raise ValueError("Record needs 'argv' or 'command'")
+
+    if needs_confirmation(argv):
+        raise ValueError("Commands that ask for confirmation need --force in a batch")
+    if forwarded_command(argv) is None:
+        raise ValueError(
+            f"Only {', '.join(sorted(FORWARDED_COMMANDS))} commands can run in a batch"
+        )
+
+    record_id = str(data.get("id", line))
+    if record_id in known_ids:
+        raise ValueError(f"Duplicate id {record_id!r}")
+
+    after = data.get("after") or []
+    if isinstance(after, str):
+        after = [after]
+    unknown = [str(dep) for dep in after if str(dep) not in known_ids]
+    if unknown:
+        raise ValueError(f"'after' refers to unknown or later ids: {', '.join(unknown)}")
+
+    return BatchRecord(line=line, id=record_id, argv=argv, after=[str(dep) for dep in after])
+
+
+def _result(record_id: str, line: int, status: str, exit_code: int, **fields: Any) -> Result:
+    return {"id": record_id, "line": line, "status": status, "exit_code": exit_code, **fields}
+
+
+def execute_record(
+    record: BatchRecord, dependencies: list[Future[Result]], context: CLIContext
+) -> Result:
+    """Run one record once its dependencies have finished."""
+    for dependency_id, dependency in zip(record.after, dependencies, strict=True):
+        # A dependency that raised never produced a result; it failed all the same
+        if (
+            dependency.exception() is not None
+            or dependency.result()["exit_code"] != ExitCode.SUCCESS
+        ):
+            return _result(
+                record.id,
+                record.line,
+                "skipped",
+                int(ExitCode.GENERAL_ERROR),
+                stderr=f"Dependency {dependency_id!r} failed",
+            )
+
+    started = time.monotonic()
+    result = run_command(record.argv, context, width=OUTPUT_WIDTH, json_output=True, soft_wrap=True)
+    fields: dict[str, Any] = {"duration_ms": round((time.monotonic() - started) * 1000)}
+    try:
+        fields["output"] = json.loads(result.stdout)
+    except ValueError:
+        fields["stdout"] = result.stdout
+    if result.stderr:
+        fields["stderr"] = result.stderr
+
+    status = "ok" if result.exit_code == ExitCode.SUCCESS else "failed"
+    return _result(record.id, record.line, status, result.exit_code, **fields)
+
+
+def run_batch(
+    lines: Iterable[str],
+    context: CLIContext,
+    jobs: int,
+    emit: Callable[[Result], None],
+) -> int:
+    """Run NDJSON command records, emitting each result as soon as it is ready.
+
+    Records run concurrently on up to ``jobs`` threads over ``context``'s
+    shared clients, except that a record waits for the ids in its ``after``.
+    Results are emitted in completion order.
+
+    Returns:
+        The exit code of the first failed record in input order, or 0
+    """
+    futures: dict[str, Future[Result]] = {}
+    finished: queue.Queue[Result] = queue.Queue()
+    failures: dict[int, int] = {}
+    pending = 0
+
+    def report(result: Result) -> None:
+        if result["exit_code"] != ExitCode.SUCCESS:
+            failures[result["line"]] = result["exit_code"]
+        emit(result)
+
+    def finish(record: BatchRecord, done: Future[Result]) -> None:
+        # Always queue a result, or the wait for pending records never ends
+        try:
+            result = done.result()
+        except BaseException as e:
+            result = _result(
+                record.id,
+                record.line,
+                "failed",
+                int(ExitCode.GENERAL_ERROR),
+                stderr=f"{type(e).__name__}: {e}",
+            )
+        finished.put(result)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for line, text in enumerate(lines, start=1):
+            if not text.strip():
+                continue
+            try:
+                record = parse_record(line, text, futures.keys())
+            except ValueError as e:
+                report(
+                    _result(
+                        str(line), line, "invalid", int(ExitCode.INVALID_ARGUMENTS), stderr=str(e)
+                    )
+                )
+                continue
+
+            # Dependencies were submitted earlier, so they start before this record
+            dependencies = [futures[dep] for dep in record.after]
+            future = pool.submit(execute_record, record, dependencies, context)
+            future.add_done_callback(functools.partial(finish, record))
+            futures[record.id] = future
+            pending += 1
+
+            while pending:
+                try:
+                    report(finished.get_nowait())
+                except queue.Empty:
+                    break
+                pending -= 1
+
+        while pending:
+            report(finished.get())
+            pending -= 1
+
+    return failures[min(failures)] if failures else int(ExitCode.SUCCESS)
+
+
+@app.command()
+def batch(
+    ctx: typer.Context,
+    source: str = typer.Argument("-", help="NDJSON file of commands, or - for stdin"),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Commands to run at once (default: http.max_concurrency)",
+    ),
+) -> None:
+    """Run many asc, signing and env commands over one authenticated client.
+
+    Each input line is a JSON object such as {"id": "apps", "argv": ["asc",
+    "apps", "list"]} or {"command": "asc builds latest --app 123"}; add
+    "after": ["apps"] to wait for earlier commands. Each result line carries
+    the id, status, exit code (as in `slowlane` itself) and the command's
+    JSON output. Exits with the first failed command's exit code.
+    """
+    context = get_context(ctx)
+    workers = jobs or context.config.http.max_concurrency
+
+    def emit(result: Result) -> None:
+        sys.stdout.write(json.dumps(result, default=str) + "\n")
+        sys.stdout.flush()
+
+    if source == "-":
+        exit_code = run_batch(sys.stdin, context, workers, emit)
+    else:
+        path = Path(source)
+        if not path.is_file():
+            raise typer.BadParameter(f"File not found: {source}", param_hint="SOURCE")
+        with path.open(encoding="utf-8") as lines:
+            exit_code = run_batch(lines, context, workers, emit)
+
+    if exit_code:
+        raise typer.Exit(code=exit_code)
@@ -0,0 +1,224 @@
+"""Shared CLI services: config, secrets, auth and API clients, built on first use."""
+
+from __future__ import annotations
+
+import copy
+import threading
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self, TypeVar, overload
+
+import typer
+from rich.console import Console
+
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import AuthExpiredError
+
+if TYPE_CHECKING:
+    from slowlane.asc.client import AppStoreConnectClient
+    from slowlane.auth.jwt_auth import JWTAuth
+    from slowlane.auth.session_auth import SessionAuth
+    from slowlane.core.secrets import SecretStore
+    from slowlane.devportal.api_client import DeveloperPortalAPIClient
+
+T = TypeVar("T")
+
+
+class _service(cached_property[T]):  # noqa: N801 - used like cached_property
+    """``cached_property`` that builds its value once even under concurrent access.
+
+    Batch mode runs commands on several threads against one context; without
+    the lock two threads could each build (and leak) their own client.
+    """
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type[Any] | None = None) -> T: ...
+
+    def __get__(self, instance: Any, owner: type[Any] | None = None) -> T | Self:
+        if instance is None:
+            return self
+        with instance._lock:
+            value: T = super().__get__(instance, owner)
+        return value
+
+
+class CLIContext:
+    """Services for one CLI invocation, stored in ``ctx.obj``.
+
+    Each service is built the first time a command asks for it and reused
+    afterwards, so the config file is read once, keyring is probed once and
+    every command group shares the same authenticated clients. Clients are
+    closed when the invocation ends.
+
+    Contexts made with :meth:`derive` share these services with their parent,
+    which is how ``slowlane daemon`` keeps them warm across invocations.
+    """
+
+    def __init__(
+        self,
+        console: Console | None = None,
+        config_path: Path | None = None,
+        json_output: bool = False,
+        verbose: bool = False,
+        config: SlowlaneConfig | None = None,
+        parent: CLIContext | None = None,
+    ) -> None:
+        """Initialize the context.
+
+        Args:
+            console: Console for output
+            config_path: Config file to load instead of the default
+            json_output: Force JSON output (``--json``)
+            verbose: Enable verbose output (``--verbose``)
+            config: Already-loaded config to use as-is
+            parent: Context whose config, secrets, auth and clients are reused
+        """
+        self.console = console or Console()
+        self._config_path = config_path
+        self._json_output = json_output
+        self._verbose = verbose
+        self._preloaded_config = config
+        self._parent = parent
+        self._session_auth: dict[str | None, SessionAuth | None] = {}
+        self._closers: list[Callable[[], None]] = []
+        self._lock = threading.RLock()
+
+    @_service
+    def config(self) -> SlowlaneConfig:
+        """Configuration with environment and command-line overrides applied."""
+        if self._preloaded_config is not None:
+            return self._preloaded_config
+
+        if self._parent is not None:
+            config = copy.deepcopy(self._parent.config)
+        else:
+            config = SlowlaneConfig.load(self._config_path)
+            config.apply_env_overrides()
+        if self._json_output:
+            config.output.format = "json"
+        if self._verbose:
+            config.output.verbose = True
+        return config
+
+    @_service
+    def secret_store(self) -> SecretStore:
+        """Secret store (keyring or encrypted file fallback)."""
+        if self._parent is not None:
+            return self._parent.secret_store
+
+        from slowlane.core.secrets import SecretStore
+
+        return SecretStore()
+
+    @_service
+    def jwt_auth(self) -> JWTAuth | None:
+        """API key authentication, or None when no key is configured."""
+        if self._parent is not None:
+            return self._parent.jwt_auth
+
+        from slowlane.auth.jwt_auth import get_jwt_auth
+
+        return get_jwt_auth(self.config, self.secret_store)
+
+    def session_auth(self, email: str | None = None) -> SessionAuth | None:
+        """Session authentication from FASTLANE_SESSION or the stored session for ``email``."""
+        if self._parent is not None:
+            return self._parent.session_auth(email)
+
+        with self._lock:
+            if email not in self._session_auth:
+                from slowlane.auth.session_auth import get_session_auth
+
+                self._session_auth[email] = get_session_auth(
+                    email=email, secret_store=self.secret_store
+                )
+            return self._session_auth[email]
+
+    @_service
+    def asc_client(self) -> AppStoreConnectClient:
+        """App Store Connect client, preferring API key over session auth."""
+        if self._parent is not None:
+            return self._parent.asc_client
+
+        from slowlane.asc.client import AppStoreConnectClient
+
+        prefetch_pages = self.config.http.prefetch_pages
+        if self.jwt_auth:
+            client = AppStoreConnectClient(
+                jwt_auth=self.jwt_auth, config=self.config, prefetch_pages=prefetch_pages
+            )
+        else:
+            session_auth = self.session_auth()
+            if not session_auth:
+                raise AuthExpiredError(
+                    "No authentication configured. Either set ASC_KEY_ID/ASC_ISSUER_ID/"
+                    "ASC_PRIVATE_KEY or run 'spaceauth login'"
+                )
+            client = AppStoreConnectClient(
+                session_auth=session_auth, config=self.config, prefetch_pages=prefetch_pages
+            )
+
+        self._closers.append(client.close)
+        return client
+
+    @_service
+    def signing_client(self) -> DeveloperPortalAPIClient | None:
+        """API key signing client, or None when no API key is configured."""
+        if self._parent is not None:
+            return self._parent.signing_client
+
+        if self.jwt_auth is None:
+            return None
+
+        from slowlane.devportal.api_client import DeveloperPortalAPIClient
+
+        client = DeveloperPortalAPIClient(jwt_auth=self.jwt_auth, config=self.config)
+        self._closers.append(client.close)
+        return client
+
+    def derive(
+        self,
+        console: Console | None = None,
+        json_output: bool = False,
+        verbose: bool = False,
+    ) -> CLIContext:
+        """Context for another invocation that reuses this one's services.
+
+        The derived context gets its own console and output options (adding to
+        this context's); auth and clients stay owned (and closed) by the root
+        context.
+        """
+        return CLIContext(
+            console=console or self.console,
+            json_output=json_output or self._json_output,
+            verbose=verbose or self._verbose,
+            parent=self._parent or self,
+        )
+
+    def close(self) -> None:
+        """Close every client built during this invocation."""
+        while self._closers:
+            self._closers.pop()()
+
+
+def get_context(ctx: typer.Context) -> CLIContext:
+    """Get the invocation's CLIContext, creating it if the root callback did not."""
+    root = ctx.find_root()
+    if isinstance(root.obj, CLIContext):
+        return root.obj
+
+    # Commands invoked without the main callback (e.g. in tests)
+    legacy = root.obj if isinstance(root.obj, dict) else {}
+    console = legacy.get("console")
+    config = legacy.get("config")
+    context = CLIContext(
+        console=console if isinstance(console, Console) else None,
+        config=config if isinstance(config, SlowlaneConfig) else None,
+    )
+    root.obj = context
+    root.call_on_close(context.close)
+    return context
@@ -0,0 +1,255 @@
+"""Daemon commands: a long-lived local server that runs CLI commands warm."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import socketserver
+import time
+from pathlib import Path
+from typing import Any
+
+import typer
+from rich.console import Console
+
+from slowlane.cli.context import CLIContext, get_context
+from slowlane.cli.runner import run_command
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.daemon import (
+    FORWARDED_COMMANDS,
+    environment_fingerprint,
+    forwarded_command,
+    get_socket_path,
+    send_request,
+)
+from slowlane.core.errors import SlowlaneError
+
+logger = logging.getLogger(__name__)
+
+app = typer.Typer(
+    name="daemon",
+    help="Keep auth, connections and caches warm between CLI calls.",
+    no_args_is_help=True,
+)
+
+SOCKET_OPTION = typer.Option(
+    None,
+    "--socket",
+    "-s",
+    envvar="SLOWLANE_DAEMON_SOCKET",
+    help="Unix socket path (default: <data dir>/daemon.sock)",
+)
+
+
+def get_console(ctx: typer.Context) -> Console:
+    """Get console from context."""
+    return get_context(ctx).console
+
+
+def get_config(ctx: typer.Context) -> SlowlaneConfig:
+    """Get config from context."""
+    return get_context(ctx).config
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line."""
+
+    server: _UnixServer
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            response: dict[str, Any] = {"error": "Invalid request"}
+        else:
+            response = self.server.daemon_server.handle(request)
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class _UnixServer(socketserver.UnixStreamServer):
+    def __init__(self, path: Path, daemon_server: DaemonServer) -> None:
+        self.daemon_server = daemon_server
+        super().__init__(str(path), _RequestHandler)
+
+    def handle_timeout(self) -> None:
+        self.daemon_server.stop()
+
+
+class DaemonServer:
+    """Runs forwarded CLI commands against one warm :class:`CLIContext`.
+
+    Requests are handled one at a time: each command gets its own captured
+    output and the caller's working directory, while config, secrets,
+    JWT and session auth, HTTP connection pools and caches stay in the
+    shared context for the life of the daemon.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        idle_timeout: float | None = 900.0,
+        context: CLIContext | None = None,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            socket_path: Unix socket to listen on (default: :func:`get_socket_path`)
+            idle_timeout: Exit after this many seconds without a request (None: never)
+            context: Shared context (default: a new one for the default config)
+        """
+        self.socket_path = socket_path or get_socket_path()
+        self.idle_timeout = idle_timeout
+        self.context = context or CLIContext()
+        self.requests = 0
+        self.started_at = time.time()
+        self._fingerprint = environment_fingerprint()
+        self._stopping = False
+        self._server: _UnixServer | None = None
+
+    def bind(self) -> None:
+        """Create the socket, replacing a stale one left by a crashed daemon."""
+        if self.socket_path.exists():
+            try:
+                send_request({"op": "ping"}, self.socket_path)
+            except (OSError, SlowlaneError):
+                self.socket_path.unlink()
+            else:
+                raise SlowlaneError(
+                    "A slowlane daemon is already running", socket=str(self.socket_path)
+                )
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Only the owner may connect: the daemon acts with the owner's credentials
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _UnixServer(self.socket_path, self)
+        finally:
+            os.umask(old_umask)
+        self._server.timeout = self.idle_timeout
+
+    def serve(self) -> None:
+        """Handle requests until stopped or idle for ``idle_timeout`` seconds."""
+        if self._server is None:
+            self.bind()
+        assert self._server is not None
+        try:
+            while not self._stopping:
+                self._server.handle_request()
+        finally:
+            self._server.server_close()
+            with contextlib.suppress(FileNotFoundError):
+                self.socket_path.unlink()
+            self.context.close()
+
+    def stop(self) -> None:
+        """Stop after the current request."""
+        self._stopping = True
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Answer one request."""
+        op = request.get("op")
+        if op == "ping":
+            return {
+                "pid": os.getpid(),
+                "uptime": time.time() - self.started_at,
+                "requests": self.requests,
+            }
+        if op == "stop":
+            self.stop()
+            return {"stopped": True}
+        if op == "run":
+            return self._run(request)
+        return {"error": f"Unknown operation: {op!r}"}
+
+    def _run(self, request: dict[str, Any]) -> dict[str, Any]:
+        argv = [str(arg) for arg in request.get("argv") or []]
+        if forwarded_command(argv) is None:
+            return {"error": f"Only {', '.join(sorted(FORWARDED_COMMANDS))} are served"}
+        if request.get("env") != self._fingerprint:
+            # Different credentials or config than the daemon was started with
+            return {"error": "Environment differs from the daemon's"}
+
+        cwd = os.getcwd()
+        try:
+            os.chdir(request.get("cwd") or cwd)
+            result = run_command(
+                argv,
+                self.context,
+                width=int(request.get("columns") or 80),
+                color=bool(request.get("color")),
+            )
+        except OSError as e:
+            return {"error": f"Cannot run in {request.get('cwd')!r}: {e}"}
+        finally:
+            os.chdir(cwd)
+
+        self.requests += 1
+        return {"exit_code": result.exit_code, "stdout": result.stdout, "stderr": result.stderr}
+
+
+@app.command("start")
+def daemon_start(
+    ctx: typer.Context,
+    socket: str | None = SOCKET_OPTION,
+    idle_timeout: int = typer.Option(
+        900,
+        "--idle-timeout",
+        min=0,
+        help="Exit after this many idle seconds (0: never)",
+    ),
+) -> None:
+    """Run the daemon in the foreground.
+
+    While it runs, `asc`, `signing` and `env` commands from the same user and
+    environment are forwarded to it automatically. Start it in the background
+    at the beginning of a CI job; set SLOWLANE_DAEMON=0 to bypass it.
+    """
+    console = get_console(ctx)
+
+    server = DaemonServer(
+        socket_path=Path(socket) if socket else None,
+        idle_timeout=idle_timeout or None,
+        context=get_context(ctx),
+    )
+    server.bind()
+    console.print(f"[green]✓[/green] slowlane daemon listening on {server.socket_path}")
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve()
+    console.print(f"Daemon stopped after {server.requests} request(s)")
+
+
+@app.command("status")
+def daemon_status(ctx: typer.Context, socket: str | None = SOCKET_OPTION) -> None:
+    """Show whether a daemon is running."""
+    console = get_console(ctx)
+    config = get_config(ctx)
+
+    path = Path(socket) if socket else get_socket_path()
+    try:
+        status = send_request({"op": "ping"}, path)
+    except (OSError, SlowlaneError) as e:
+        console.print(f"[yellow]No daemon running[/yellow] ({path})")
+        raise typer.Exit(code=1) from e
+
+    if config.output.format == "json":
+        console.print(json.dumps({"socket": str(path), **status}, indent=2))
+        return
+    console.print(f"[green]✓[/green] Daemon running (pid {status['pid']}) on {path}")
+    console.print(f"  Uptime: {int(status['uptime'])}s")
+    console.print(f"  Requests served: {status['requests']}")
+
+
+@app.command("stop")
+def daemon_stop(ctx: typer.Context, socket: str | None = SOCKET_OPTION) -> None:
+    """Stop a running daemon."""
+    console = get_console(ctx)
+
+    path = Path(socket) if socket else get_socket_path()
+    try:
+        send_request({"op": "stop"}, path)
+    except (OSError, SlowlaneError) as e:
+        console.print(f"[yellow]No daemon running[/yellow] ({path})")
+        raise typer.Exit(code=1) from e
+    console.print("[green]✓[/green] Daemon stopped")
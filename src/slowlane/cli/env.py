@@ -9,9 +9,8 @@
 from rich.panel import Panel
 from rich.syntax import Syntax
 
-from slowlane.auth.session_auth import get_session_auth
+from slowlane.cli.context import get_context
 from slowlane.core.config import SlowlaneConfig
-from slowlane.core.secrets import SecretStore
 
 app = typer.Typer(
     name="env",
@@ -22,16 +21,12 @@
 
 def get_console(ctx: typer.Context) -> Console:
     """Get console from context."""
-    if ctx.obj is None:
-        return Console()
-    return ctx.obj.get("console", Console())
+    return get_context(ctx).console
 
 
 def get_config(ctx: typer.Context) -> SlowlaneConfig:
     """Get config from context."""
-    if ctx.obj is None:
-        return SlowlaneConfig.load()
-    return ctx.obj.get("config", SlowlaneConfig.load())
+    return get_context(ctx).config
 
 
 @app.command("print")
@@ -67,7 +62,7 @@ def env_print(
 
     # Check for session if requested
     if include_session:
-        session = get_session_auth(secret_store=SecretStore())
+        session = get_context(ctx).session_auth()
         if session:
             env_vars["FASTLANE_SESSION"] = session.to_export_string()
 
@@ -2,43 +2,79 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+import os
 import sys
+from pathlib import Path
+from typing import Any
 
+import click
 import typer
 from rich.console import Console
-from rich.logging import RichHandler
+from typer.core import TyperGroup
 
 from slowlane import __version__
-from slowlane.cli.asc import app as asc_app
-from slowlane.cli.env import app as env_app
-from slowlane.cli.signing import app as signing_app
-from slowlane.cli.spaceauth import app as spaceauth_app
-from slowlane.cli.upload import app as upload_app
-from slowlane.core.config import SlowlaneConfig
+from slowlane.cli.context import CLIContext
+from slowlane.core.daemon import forward_command
 from slowlane.core.errors import ExitCode, SlowlaneError
 
+# Subcommand groups: name -> (module defining ``app``, help).
+# Modules are imported only when their group is invoked, so `slowlane version`
+# or `slowlane env ...` never load httpx, cryptography, keyring or Playwright.
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "spaceauth": ("slowlane.cli.spaceauth", "Session authentication commands"),
+    "asc": ("slowlane.cli.asc", "App Store Connect operations"),
+    "signing": ("slowlane.cli.signing", "Certificates and provisioning profiles"),
+    "upload": ("slowlane.cli.upload", "Upload IPA/pkg files"),
+    "env": ("slowlane.cli.env", "CI environment helpers"),
+    "batch": ("slowlane.cli.batch", "Run many commands in one process (NDJSON in/out)"),
+    "daemon": ("slowlane.cli.daemon", "Keep auth and connections warm between calls"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root command group that imports subcommand modules on first use."""
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return [*SUBCOMMANDS, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in SUBCOMMANDS and cmd_name not in self.commands:
+            module_name, help_text = SUBCOMMANDS[cmd_name]
+            module = importlib.import_module(module_name)
+            command = typer.main.get_command(module.app)
+            command.name = cmd_name
+            command.help = help_text
+            self.add_command(command)
+        return super().get_command(ctx, cmd_name)
+
+    def main(self, args: Any = None, *main_args: Any, **kwargs: Any) -> Any:
+        # Command-line runs hand supported commands to a running daemon, if any
+        if args is None and "_SLOWLANE_COMPLETE" not in os.environ:
+            exit_code = forward_command(sys.argv[1:])
+            if exit_code is not None:
+                sys.exit(exit_code)
+        return super().main(args, *main_args, **kwargs)
+
+
 # Create Typer app
 app = typer.Typer(
     name="slowlane",
     help="Python CLI for Apple service automation - fastlane-compatible authentication and App Store Connect operations.",
+    cls=LazyGroup,
     no_args_is_help=True,
     rich_markup_mode="rich",
 )
 
-# Add subcommands
-app.add_typer(spaceauth_app, name="spaceauth", help="Session authentication commands")
-app.add_typer(asc_app, name="asc", help="App Store Connect operations")
-app.add_typer(signing_app, name="signing", help="Certificates and provisioning profiles")
-app.add_typer(upload_app, name="upload", help="Upload IPA/pkg files")
-app.add_typer(env_app, name="env", help="CI environment helpers")
-
 # Console for rich output
 console = Console()
 
 
 def setup_logging(verbose: bool, json_output: bool) -> None:
     """Configure logging based on options."""
+    from rich.logging import RichHandler
+
     if json_output:
         # JSON output - minimal logging
         logging.basicConfig(
@@ -86,23 +122,19 @@ def main(
     # Set up logging
     setup_logging(verbose, json_output)
 
-    # Load config
-    from pathlib import Path
-
-    config_file = Path(config_path) if config_path else None
-    config = SlowlaneConfig.load(config_file)
-    config.apply_env_overrides()
-
-    # Apply CLI overrides
-    if json_output:
-        config.output.format = "json"
-    if verbose:
-        config.output.verbose = True
-
-    # Store in context for subcommands
-    ctx.ensure_object(dict)
-    ctx.obj["config"] = config
-    ctx.obj["console"] = console
+    # Config, secrets and clients are built on first use and shared by subcommands
+    if isinstance(ctx.obj, CLIContext):
+        # Running inside `slowlane daemon`: reuse its warm services
+        context = ctx.obj.derive(json_output=json_output, verbose=verbose)
+    else:
+        context = CLIContext(
+            console=console,
+            config_path=Path(config_path) if config_path else None,
+            json_output=json_output,
+            verbose=verbose,
+        )
+        ctx.call_on_close(context.close)
+    ctx.obj = context
 
 
 @app.command()
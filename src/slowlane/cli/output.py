@@ -0,0 +1,160 @@
+"""Row output for list commands: rich tables, or NDJSON/TSV/CSV streamed as pages arrive."""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from typing import IO, Any
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+STREAM_FORMATS = ("ndjson", "tsv", "csv")
+
+
+@dataclass(frozen=True)
+class Column:
+    """A list column: header plus how to read its cell from a JSON:API resource."""
+
+    header: str
+    value: Callable[[dict[str, Any]], Any]
+    style: str | None = None
+
+
+def resource_id(resource: dict[str, Any]) -> Any:
+    """Cell value for a resource's ``id``."""
+    return resource.get("id", "")
+
+
+def attribute(name: str) -> Callable[[dict[str, Any]], Any]:
+    """Cell reader for one of a resource's attributes."""
+
+    def read(resource: dict[str, Any]) -> Any:
+        return resource.get("attributes", {}).get(name)
+
+    return read
+
+
+def cell(value: Any) -> str:
+    """Render a cell value as plain text."""
+    return "" if value is None else str(value)
+
+
+def parse_output_format(value: str | None) -> str | None:
+    """Validate an ``--output`` value (None means the default table or JSON output)."""
+    if value is None:
+        return None
+    format = value.strip().lower()
+    if format not in STREAM_FORMATS:
+        raise typer.BadParameter(
+            f"Expected one of {', '.join(STREAM_FORMATS)}, got {value!r}", param_hint="--output"
+        )
+    return format
+
+
+OUTPUT_OPTION = typer.Option(
+    None,
+    "--output",
+    "-o",
+    help="Stream rows as they arrive: ndjson, tsv or csv (no table, no spinner)",
+    callback=parse_output_format,
+)
+
+
+def status(console: Console, message: str) -> AbstractContextManager[Any]:
+    """A spinner while waiting, but only on an interactive terminal.
+
+    In CI and pipes the spinner can't animate anyway; skipping it avoids
+    starting rich's refresh thread and live-display bookkeeping.
+    """
+    if console.is_terminal:
+        return console.status(message)
+    return nullcontext()
+
+
+def resource_table(
+    title: str, columns: Sequence[Column], resources: Iterable[dict[str, Any]]
+) -> Table:
+    """Build a rich table with one row per resource."""
+    table = Table(title=title)
+    for column in columns:
+        table.add_column(column.header, style=column.style)
+    for resource in resources:
+        table.add_row(*(cell(column.value(resource)) for column in columns))
+    return table
+
+
+class RowWriter:
+    """Writes rows straight to a text stream, bypassing rich rendering.
+
+    ``ndjson`` writes each whole resource as one compact JSON line; ``tsv``
+    and ``csv`` write a header and then the given columns. Nothing is held
+    back beyond the stream's own buffer, which is flushed every
+    ``flush_every`` rows (one API page) so consumers see each page as soon
+    as it arrives.
+    """
+
+    def __init__(
+        self,
+        stream: IO[str],
+        format: str,
+        columns: Sequence[Column],
+        flush_every: int = 1,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            stream: Text stream to write to (usually stdout)
+            format: One of :data:`STREAM_FORMATS`
+            columns: Columns for ``tsv`` and ``csv``
+            flush_every: Rows between flushes
+        """
+        if format not in STREAM_FORMATS:
+            raise ValueError(f"Unknown output format: {format!r}")
+        self.stream = stream
+        self.format = format
+        self.columns = list(columns)
+        self.flush_every = max(1, flush_every)
+        self.rows = 0
+        self._csv = csv.writer(stream, lineterminator="\n") if format == "csv" else None
+
+    def _write_cells(self, cells: list[str]) -> None:
+        if self._csv is not None:
+            self._csv.writerow(cells)
+        else:
+            # TSV has no quoting: keep each row on one line and in its columns
+            cleaned = (c.replace("\t", " ").replace("\r", " ").replace("\n", " ") for c in cells)
+            self.stream.write("\t".join(cleaned) + "\n")
+
+    def write_header(self) -> None:
+        """Write the header line (``tsv`` and ``csv`` only)."""
+        if self.format != "ndjson":
+            self._write_cells([column.header for column in self.columns])
+
+    def write(self, resource: dict[str, Any]) -> None:
+        """Write one row."""
+        if self.format == "ndjson":
+            self.stream.write(json.dumps(resource, default=str) + "\n")
+        else:
+            self._write_cells([cell(column.value(resource)) for column in self.columns])
+        self.rows += 1
+        if self.rows % self.flush_every == 0:
+            self.stream.flush()
+
+    def write_all(self, resources: Iterable[dict[str, Any]]) -> int:
+        """Write a header and every resource, flushing at the end.
+
+        Returns:
+            Number of rows written
+        """
+        self.write_header()
+        try:
+            for resource in resources:
+                self.write(resource)
+        finally:
+            self.stream.flush()
+        return self.rows
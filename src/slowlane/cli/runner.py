@@ -0,0 +1,170 @@
+"""Run CLI commands in-process against a shared context (daemon and batch mode)."""
+
+from __future__ import annotations
+
+import io
+import logging
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, TextIO
+
+import click
+import typer
+from rich.console import Console
+
+from slowlane.cli.context import CLIContext
+from slowlane.core.errors import ExitCode, SlowlaneError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CommandResult:
+    """Outcome of one in-process command."""
+
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+class _ThreadRoutedStream:
+    """Standard stream stand-in that uses the calling thread's buffer.
+
+    Click and Typer print help and some errors straight to ``sys.stdout`` /
+    ``sys.stderr``; routing per thread lets several commands run at once
+    without their output interleaving. Commands read an empty ``sys.stdin``,
+    so confirmation prompts abort instead of consuming the caller's input.
+    Threads without a buffer use the original stream.
+    """
+
+    def __init__(self, original: TextIO) -> None:
+        self.original = original
+        self._local = threading.local()
+
+    @property
+    def buffer_for_thread(self) -> io.StringIO | None:
+        return getattr(self._local, "buffer", None)
+
+    @buffer_for_thread.setter
+    def buffer_for_thread(self, value: io.StringIO | None) -> None:
+        self._local.buffer = value
+
+    def write(self, text: str) -> int:
+        return (self.buffer_for_thread or self.original).write(text)
+
+    def read(self, size: int = -1) -> str:
+        return (self.buffer_for_thread or self.original).read(size)
+
+    def readline(self, size: int = -1) -> str:
+        return (self.buffer_for_thread or self.original).readline(size)
+
+    def flush(self) -> None:
+        (self.buffer_for_thread or self.original).flush()
+
+    def isatty(self) -> bool:
+        return self.buffer_for_thread is None and self.original.isatty()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.original, name)
+
+
+_streams_lock = threading.Lock()
+_streams_users = 0
+
+
+@contextmanager
+def _capture(stdout: io.StringIO, stderr: io.StringIO) -> Iterator[None]:
+    """Route this thread's standard streams into buffers (and an empty stdin)."""
+    global _streams_users
+    with _streams_lock:
+        if _streams_users == 0:
+            sys.stdin = _ThreadRoutedStream(sys.stdin)
+            sys.stdout = _ThreadRoutedStream(sys.stdout)
+            sys.stderr = _ThreadRoutedStream(sys.stderr)
+        _streams_users += 1
+        streams = (sys.stdin, sys.stdout, sys.stderr)
+    routed = [stream for stream in streams if isinstance(stream, _ThreadRoutedStream)]
+    assert len(routed) == 3
+    stdin, out, err = routed
+
+    stdin.buffer_for_thread = io.StringIO()
+    out.buffer_for_thread, err.buffer_for_thread = stdout, stderr
+    try:
+        yield
+    finally:
+        stdin.buffer_for_thread = out.buffer_for_thread = err.buffer_for_thread = None
+        with _streams_lock:
+            _streams_users -= 1
+            if _streams_users == 0:
+                sys.stdin, sys.stdout, sys.stderr = stdin.original, out.original, err.original
+
+
+_command: click.Command | None = None
+
+
+def _main_command() -> click.Command:
+    global _command
+    if _command is None:
+        from slowlane.cli.main import app
+
+        _command = typer.main.get_command(app)
+    return _command
+
+
+def run_command(
+    argv: list[str],
+    context: CLIContext,
+    width: int = 80,
+    color: bool = False,
+    json_output: bool = False,
+    soft_wrap: bool = False,
+) -> CommandResult:
+    """Run ``slowlane <argv>`` in this process, reusing ``context``'s services.
+
+    Output is captured rather than printed, and errors are mapped to exit
+    codes the way the ``slowlane`` entry point does. Safe to call from
+    several threads at once.
+
+    Args:
+        argv: Arguments after ``slowlane``
+        context: Context whose config, auth and clients are reused
+        width: Console width for tables and wrapping
+        color: Render ANSI styles (the console still isn't a terminal, so no
+            spinners or live displays are drawn into the captured output)
+        json_output: Run as if ``--json`` were given
+        soft_wrap: Don't wrap long lines (keeps JSON output parseable)
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    console = Console(
+        file=stdout,
+        width=width,
+        force_terminal=False,
+        color_system="standard" if color else None,
+        soft_wrap=soft_wrap,
+    )
+    invocation = context.derive(console=console, json_output=json_output)
+
+    with _capture(stdout, stderr):
+        try:
+            result = _main_command().main(
+                args=argv, prog_name="slowlane", standalone_mode=False, obj=invocation
+            )
+            exit_code = result if isinstance(result, int) else int(ExitCode.SUCCESS)
+        except click.ClickException as e:
+            e.show(file=stderr)
+            exit_code = e.exit_code
+        except click.Abort:
+            stderr.write("Aborted!\n")
+            exit_code = int(ExitCode.GENERAL_ERROR)
+        except SlowlaneError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            exit_code = int(e.exit_code)
+        except Exception as e:
+            console.print(f"[red]Unexpected error:[/red] {e}")
+            logger.exception("Unexpected error in %s", " ".join(argv))
+            exit_code = int(ExitCode.GENERAL_ERROR)
+
+    return CommandResult(exit_code, stdout.getvalue(), stderr.getvalue())
@@ -2,13 +2,24 @@
 
 from __future__ import annotations
 
+import base64
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from slowlane.cli.context import get_context
+from slowlane.cli.output import status
 from slowlane.core.config import SlowlaneConfig
-from slowlane.core.secrets import SecretStore
+from slowlane.core.errors import DeveloperPortalError
+
+if TYPE_CHECKING:
+    from slowlane.devportal.api_client import DeveloperPortalAPIClient
 
 app = typer.Typer(
     name="signing",
@@ -19,36 +30,37 @@
 # Subcommands
 certs_app = typer.Typer(name="certs", help="Certificate management")
 profiles_app = typer.Typer(name="profiles", help="Provisioning profile management")
+devices_app = typer.Typer(name="devices", help="Device management")
 
 app.add_typer(certs_app, name="certs")
 app.add_typer(profiles_app, name="profiles")
+app.add_typer(devices_app, name="devices")
 
 
 def get_console(ctx: typer.Context) -> Console:
     """Get console from context."""
-    if ctx.obj is None:
-        return Console()
-    return ctx.obj.get("console", Console())
+    return get_context(ctx).console
 
 
 def get_config(ctx: typer.Context) -> SlowlaneConfig:
     """Get config from context."""
-    if ctx.obj is None:
-        return SlowlaneConfig.load()
-    return ctx.obj.get("config", SlowlaneConfig.load())
+    return get_context(ctx).config
+
 
+def get_api_client(ctx: typer.Context) -> DeveloperPortalAPIClient | None:
+    """Get the API key signing client, or None when no API key is configured."""
+    return get_context(ctx).signing_client
 
-def require_session_auth(console: Console) -> None:
-    """Check for session auth (required for Developer Portal)."""
-    from slowlane.auth.session_auth import get_session_auth
 
-    session = get_session_auth(secret_store=SecretStore())
-    if not session:
+def require_session_auth(ctx: typer.Context, console: Console) -> None:
+    """Check for session auth (needed when no API key is configured)."""
+    if not get_context(ctx).session_auth():
         console.print(
             Panel(
-                "[red]Session authentication required[/red]\n\n"
-                "Developer Portal operations require Apple ID session cookies.\n"
-                "JWT authentication is not supported for these endpoints.\n\n"
+                "[red]Authentication required[/red]\n\n"
+                "Signing operations use an App Store Connect API key when one is\n"
+                "configured (ASC_KEY_ID, ASC_ISSUER_ID, ASC_PRIVATE_KEY), or\n"
+                "Apple ID session cookies otherwise.\n\n"
                 "Run: [bold]slowlane spaceauth login --service developer[/bold]",
                 title="⚠️ Auth Required",
             )
@@ -56,7 +68,81 @@ def require_session_auth(console: Console) -> None:
         raise typer.Exit(code=2)
 
 
+def require_api_client(ctx: typer.Context, console: Console) -> DeveloperPortalAPIClient:
+    """Get the API key signing client, exiting when no API key is configured."""
+    client = get_api_client(ctx)
+    if client is None:
+        console.print(
+            Panel(
+                "[red]API key required[/red]\n\n"
+                "This command uses the App Store Connect API.\n"
+                "Set ASC_KEY_ID, ASC_ISSUER_ID and ASC_PRIVATE_KEY.",
+                title="⚠️ Auth Required",
+            )
+        )
+        raise typer.Exit(code=2)
+    return client
+
+
+def output_result(
+    console: Console,
+    config: SlowlaneConfig,
+    data: list[dict[str, Any]],
+    table: Table,
+    columns: list[str],
+) -> None:
+    """Print JSON:API resources as JSON or as rows of ``id`` plus ``columns`` attributes."""
+    if config.output.format == "json":
+        console.print(json.dumps(data, indent=2, default=str))
+        return
+
+    for item in data:
+        attrs = item.get("attributes", {})
+        table.add_row(item.get("id", ""), *(str(attrs.get(name) or "") for name in columns))
+    console.print(table)
+
+
+def _generate_csr(common_name: str) -> tuple[bytes, str]:
+    """Generate an RSA key and a certificate signing request for it.
+
+    Returns the unencrypted PEM private key and the PEM CSR.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from cryptography.x509.oid import NameOID
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    csr = (
+        x509.CertificateSigningRequestBuilder()
+        .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)]))
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    return key_pem, csr.public_bytes(serialization.Encoding.PEM).decode()
+
+
 # Certificate commands
+CSR_OPTION = typer.Option(
+    None,
+    "--csr",
+    exists=True,
+    dir_okay=False,
+    help="Path to CSR file (a key and CSR are generated if not provided)",
+)
+CERT_OUTPUT_DIR_OPTION = typer.Option(
+    Path("."),
+    "--output-dir",
+    "-o",
+    file_okay=False,
+    help="Directory for the certificate (<id>.cer) and any generated key (<id>.key)",
+)
+
+
 @certs_app.command("list")
 def certs_list(
     ctx: typer.Context,
@@ -69,9 +155,29 @@ def certs_list(
 ) -> None:
     """List signing certificates."""
     console = get_console(ctx)
-    get_config(ctx)
+    config = get_config(ctx)
+
+    client = get_api_client(ctx)
+    if client is not None:
+        with status(console, "[bold blue]Fetching certificates...[/bold blue]"):
+            certs = client.list_certificates(cert_type)
+
+        table = Table(title="Certificates")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name")
+        table.add_column("Type")
+        table.add_column("Expires")
+        table.add_column("Serial")
+        output_result(
+            console,
+            config,
+            certs,
+            table,
+            ["displayName", "certificateType", "expirationDate", "serialNumber"],
+        )
+        return
 
-    require_session_auth(console)
+    require_session_auth(ctx, console)
 
     # TODO: Implement actual API call
     console.print("[yellow]Certificate listing not yet implemented[/yellow]")
@@ -105,27 +211,48 @@ def certs_create(
         "-t",
         help="Certificate type: development or distribution",
     ),
-    csr_path: str | None = typer.Option(
-        None,
-        "--csr",
-        help="Path to CSR file (auto-generated if not provided)",
-    ),
+    csr_path: Path | None = CSR_OPTION,
+    output_dir: Path = CERT_OUTPUT_DIR_OPTION,
 ) -> None:
     """Create a new signing certificate."""
     console = get_console(ctx)
-
-    require_session_auth(console)
-
-    console.print(
-        Panel(
-            "[yellow]Certificate creation not yet implemented[/yellow]\n\n"
-            "This will:\n"
-            "1. Generate a CSR if not provided\n"
-            "2. Submit to Apple Developer Portal\n"
-            "3. Download and install the certificate",
-            title="🔏 Create Certificate",
-        )
-    )
+    config = get_config(ctx)
+
+    client = require_api_client(ctx, console)
+
+    key_pem: bytes | None = None
+    if csr_path is not None:
+        csr = csr_path.read_text()
+    else:
+        key_pem, csr = _generate_csr("slowlane")
+
+    with status(console, "[bold blue]Creating certificate...[/bold blue]"):
+        certificate = client.create_certificate(csr, cert_type)
+
+    cert_id = certificate.get("id", "")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    saved: list[Path] = []
+    content = certificate.get("attributes", {}).get("certificateContent")
+    if content:
+        saved.append(output_dir / f"{cert_id}.cer")
+        saved[-1].write_bytes(base64.b64decode(content))
+    if key_pem is not None:
+        # The key exists nowhere else, so keep it private to the user
+        saved.append(output_dir / f"{cert_id}.key")
+        fd = os.open(saved[-1], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        if hasattr(os, "fchmod"):
+            # The mode above only applies to a new file, and is subject to the umask
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(key_pem)
+
+    if config.output.format == "json":
+        console.print(json.dumps(certificate, indent=2, default=str))
+        return
+
+    console.print(f"[green]Created certificate {cert_id}[/green]")
+    for path in saved:
+        console.print(f"Saved {path}")
 
 
 @certs_app.command("revoke")
@@ -140,7 +267,8 @@ def certs_revoke(
     """
     console = get_console(ctx)
 
-    require_session_auth(console)
+    if get_api_client(ctx) is None:
+        require_session_auth(ctx, console)
 
     if not force:
         console.print(
@@ -158,7 +286,13 @@ def certs_revoke(
         if not confirm:
             raise typer.Abort()
 
-    console.print("[yellow]Certificate revocation not yet implemented[/yellow]")
+    client = get_api_client(ctx)
+    if client is None:
+        console.print("[yellow]Certificate revocation not yet implemented[/yellow]")
+        return
+
+    client.revoke_certificate(cert_id)
+    console.print(f"[green]Revoked certificate {cert_id}[/green]")
 
 
 # Profile commands
@@ -180,9 +314,34 @@ def profiles_list(
 ) -> None:
     """List provisioning profiles."""
     console = get_console(ctx)
-    get_config(ctx)
+    config = get_config(ctx)
+
+    client = get_api_client(ctx)
+    if client is not None:
+        with status(console, "[bold blue]Fetching profiles...[/bold blue]"):
+            profiles = client.list_profiles(profile_type)
+
+        if app_id:
+            profiles = [
+                profile for profile in profiles if _profile_bundle_identifier(profile) == app_id
+            ]
+
+        table = Table(title="Provisioning Profiles")
+        table.add_column("ID", style="cyan")
+        table.add_column("Name")
+        table.add_column("Type")
+        table.add_column("State")
+        table.add_column("Expires")
+        output_result(
+            console,
+            config,
+            profiles,
+            table,
+            ["name", "profileType", "profileState", "expirationDate"],
+        )
+        return
 
-    require_session_auth(console)
+    require_session_auth(ctx, console)
 
     console.print("[yellow]Profile listing not yet implemented[/yellow]")
 
@@ -205,6 +364,37 @@ def profiles_list(
     console.print(table)
 
 
+def _profile_bundle_identifier(profile: dict[str, Any]) -> str | None:
+    """Bundle identifier of a profile listed with its bundle ID included."""
+    bundle_id = profile.get("relationships", {}).get("bundleId", {}).get("data")
+    if not isinstance(bundle_id, dict):
+        return None
+    identifier = bundle_id.get("attributes", {}).get("identifier")
+    return identifier if isinstance(identifier, str) else None
+
+
+@profiles_app.command("download")
+def profiles_download(
+    ctx: typer.Context,
+    profile_id: str = typer.Argument(..., help="Profile ID to download"),
+    output: str | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Destination file (default: <profile_id>.mobileprovision)",
+    ),
+) -> None:
+    """Download a provisioning profile."""
+    console = get_console(ctx)
+
+    client = require_api_client(ctx, console)
+    content = client.download_profile(profile_id)
+
+    destination = Path(output or f"{profile_id}.mobileprovision")
+    destination.write_bytes(content)
+    console.print(f"[green]Saved profile to {destination}[/green]")
+
+
 @profiles_app.command("create")
 def profiles_create(
     ctx: typer.Context,
@@ -220,23 +410,53 @@ def profiles_create(
         None,
         "--cert",
         "-c",
-        help="Certificate ID (auto-select if not provided)",
+        help="Certificate ID (default: every certificate of the matching type)",
     ),
 ) -> None:
-    """Create a new provisioning profile."""
+    """Create a new provisioning profile.
+
+    Development and ad hoc profiles include every enabled device.
+    """
     console = get_console(ctx)
+    config = get_config(ctx)
 
-    require_session_auth(console)
+    client = require_api_client(ctx, console)
 
-    console.print(
-        Panel(
-            f"[yellow]Profile creation not yet implemented[/yellow]\n\n"
-            f"Will create: {name}\n"
-            f"Type: {profile_type}\n"
-            f"Bundle ID: {bundle_id}",
-            title="📦 Create Profile",
+    with status(console, "[bold blue]Creating profile...[/bold blue]"):
+        bundle = client.find_bundle_id(bundle_id)
+        if bundle is None:
+            raise DeveloperPortalError(
+                f"Bundle ID {bundle_id} is not registered", bundle_id=bundle_id
+            )
+
+        if cert_id:
+            certificate_ids = [cert_id]
+        else:
+            cert_type = "development" if profile_type == "development" else "distribution"
+            certificate_ids = [cert["id"] for cert in client.list_certificates(cert_type)]
+            if not certificate_ids:
+                raise DeveloperPortalError(
+                    f"No {cert_type} certificate to sign the profile with",
+                    profile_type=profile_type,
+                )
+
+        device_ids = None
+        if profile_type in ("development", "adhoc"):
+            device_ids = [
+                device["id"]
+                for device in client.list_devices()
+                if device.get("attributes", {}).get("status") != "DISABLED"
+            ]
+
+        profile = client.create_profile(
+            name, bundle["id"], profile_type, certificate_ids, device_ids
         )
-    )
+
+    if config.output.format == "json":
+        console.print(json.dumps(profile, indent=2, default=str))
+        return
+
+    console.print(f"[green]Created profile {name} ({profile.get('id', '')})[/green]")
 
 
 @profiles_app.command("delete")
@@ -248,11 +468,54 @@ def profiles_delete(
     """Delete a provisioning profile."""
     console = get_console(ctx)
 
-    require_session_auth(console)
+    if get_api_client(ctx) is None:
+        require_session_auth(ctx, console)
 
     if not force:
         confirm = typer.confirm(f"Delete profile {profile_id}?")
         if not confirm:
             raise typer.Abort()
 
-    console.print("[yellow]Profile deletion not yet implemented[/yellow]")
+    client = get_api_client(ctx)
+    if client is None:
+        console.print("[yellow]Profile deletion not yet implemented[/yellow]")
+        return
+
+    client.delete_profile(profile_id)
+    console.print(f"[green]Deleted profile {profile_id}[/green]")
+
+
+# Device commands
+@devices_app.command("list")
+def devices_list(ctx: typer.Context) -> None:
+    """List registered devices."""
+    console = get_console(ctx)
+    config = get_config(ctx)
+
+    client = require_api_client(ctx, console)
+    with status(console, "[bold blue]Fetching devices...[/bold blue]"):
+        devices = client.list_devices()
+
+    table = Table(title="Devices")
+    table.add_column("ID", style="cyan")
+    table.add_column("Name")
+    table.add_column("UDID")
+    table.add_column("Platform")
+    table.add_column("Status")
+    output_result(console, config, devices, table, ["name", "udid", "platform", "status"])
+
+
+@devices_app.command("register")
+def devices_register(
+    ctx: typer.Context,
+    name: str = typer.Option(..., "--name", "-n", help="Device name"),
+    udid: str = typer.Option(..., "--udid", "-u", help="Device UDID"),
+    platform: str = typer.Option("ios", "--platform", "-p", help="Platform: ios or mac"),
+) -> None:
+    """Register a device for development and ad hoc profiles."""
+    console = get_console(ctx)
+
+    client = require_api_client(ctx, console)
+    device = client.register_device(name, udid, platform)
+
+    console.print(f"[green]Registered device {name} ({device.get('id', '')})[/green]")
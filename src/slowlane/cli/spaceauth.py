@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import os
+import time
+from typing import TYPE_CHECKING
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from slowlane.auth.playwright_login import interactive_login
-from slowlane.auth.session_auth import get_session_auth, validate_session_cookies
+from slowlane.cli.context import get_context
 from slowlane.core.config import SlowlaneConfig
-from slowlane.core.errors import SessionError
-from slowlane.core.secrets import SecretStore
+from slowlane.core.errors import AuthExpiredError, NetworkError, SessionError
+
+if TYPE_CHECKING:
+    from slowlane.core.secrets import SessionData
 
 app = typer.Typer(
     name="spaceauth",
@@ -22,16 +27,12 @@
 
 def get_console(ctx: typer.Context) -> Console:
     """Get console from context."""
-    if ctx.obj is None:
-        return Console()
-    return ctx.obj.get("console", Console())
+    return get_context(ctx).console
 
 
 def get_config(ctx: typer.Context) -> SlowlaneConfig:
     """Get config from context."""
-    if ctx.obj is None:
-        return SlowlaneConfig.load()
-    return ctx.obj.get("config", SlowlaneConfig.load())
+    return get_context(ctx).config
 
 
 @app.command()
@@ -54,15 +55,44 @@ def login(
         "--headless",
         help="Run browser in headless mode (not recommended)",
     ),
+    block_resources: bool = typer.Option(
+        True,
+        "--block-resources/--load-all-resources",
+        help="Skip images, fonts and analytics while logging in (browser engine)",
+    ),
+    keep_profile: bool = typer.Option(
+        False,
+        "--keep-profile",
+        help="Save the browser state so the next login can reuse it (browser engine)",
+    ),
+    engine: str = typer.Option(
+        "browser",
+        "--engine",
+        help="Login engine: browser (Playwright) or http (no browser, needs --email)",
+    ),
+    totp_secret: str | None = typer.Option(
+        None,
+        "--totp-secret",
+        envvar="SLOWLANE_TOTP_SECRET",
+        help="Base32 secret to generate 2FA codes instead of prompting (http engine)",
+    ),
 ) -> None:
-    """Interactive login via browser.
+    """Interactive login via browser or plain HTTP.
 
-    Opens a browser window for you to complete Apple ID login,
-    including 2FA verification. Cookies are extracted and stored
-    securely for future use.
+    The browser engine opens a window for you to complete Apple ID login,
+    including 2FA verification. The http engine signs in without a browser
+    and prompts for the 2FA code (password from SLOWLANE_PASSWORD or a
+    prompt). Cookies are extracted and stored securely for future use.
     """
     console = get_console(ctx)
 
+    if engine not in ("browser", "http"):
+        raise typer.BadParameter("Expected 'browser' or 'http'", param_hint="--engine")
+
+    if engine == "http":
+        _http_login(ctx, email, service, totp_secret)
+        return
+
     console.print(
         Panel(
             "[bold]Interactive Apple ID Login[/bold]\n\n"
@@ -76,31 +106,17 @@ def login(
     )
 
     try:
-        with console.status("[bold blue]Launching browser...[/bold blue]"):
-            session_data = interactive_login(headless=headless, target_service=service)
-
-        # Validate cookies
-        missing = validate_session_cookies(session_data.cookies)
-        if missing:
-            console.print(
-                f"[yellow]Warning:[/yellow] Missing cookies: {', '.join(missing)}"
-            )
+        from slowlane.auth.playwright_login import interactive_login
 
-        # Store session
-        if email:
-            secret_store = SecretStore()
-            secret_store.store_session(email, session_data)
-            console.print(f"[green]✓[/green] Session stored for {email}")
-        else:
-            console.print(
-                "[yellow]Note:[/yellow] Session not stored (no --email provided). "
-                "Use 'spaceauth export' to get the session string."
+        with console.status("[bold blue]Launching browser...[/bold blue]"):
+            session_data = interactive_login(
+                headless=headless,
+                target_service=service,
+                block_resources=block_resources,
+                keep_profile=keep_profile,
             )
 
-        # Show session info
-        console.print("\n[green]✓ Login successful![/green]")
-        console.print(f"  Cookies captured: {len(session_data.cookies)}")
-        console.print(f"  Service: {session_data.target_service}")
+        _finish_login(ctx, email, session_data)
 
     except SessionError as e:
         console.print(f"[red]Login failed:[/red] {e}")
@@ -115,6 +131,65 @@ def login(
         raise typer.Exit(code=1) from e
 
 
+def _finish_login(ctx: typer.Context, email: str | None, session_data: SessionData) -> None:
+    """Validate, store and summarize a freshly captured session."""
+    from slowlane.auth.session_auth import validate_session_cookies
+
+    console = get_console(ctx)
+
+    # Validate cookies
+    missing = validate_session_cookies(session_data.cookies)
+    if missing:
+        console.print(
+            f"[yellow]Warning:[/yellow] Missing cookies: {', '.join(missing)}"
+        )
+
+    # Store session
+    if email:
+        get_context(ctx).secret_store.store_session(email, session_data)
+        console.print(f"[green]✓[/green] Session stored for {email}")
+    else:
+        console.print(
+            "[yellow]Note:[/yellow] Session not stored (no --email provided). "
+            "Use 'spaceauth export' to get the session string."
+        )
+
+    # Show session info
+    console.print("\n[green]✓ Login successful![/green]")
+    console.print(f"  Cookies captured: {len(session_data.cookies)}")
+    console.print(f"  Service: {session_data.target_service}")
+
+
+def _http_login(
+    ctx: typer.Context,
+    email: str | None,
+    service: str,
+    totp_secret: str | None,
+) -> None:
+    """Log in without a browser: SRP sign-in, then a prompted or generated 2FA code."""
+    from slowlane.auth.http_login import http_login, totp_code
+
+    console = get_console(ctx)
+    if not email:
+        raise typer.BadParameter("The http engine needs an Apple ID", param_hint="--email")
+
+    password = os.environ.get("SLOWLANE_PASSWORD") or typer.prompt(
+        "Apple ID password", hide_input=True
+    )
+
+    def code_provider(prompt: str) -> str:
+        if totp_secret:
+            return totp_code(totp_secret)
+        return str(typer.prompt(f"{prompt}. Enter the 2FA code"))
+
+    try:
+        session_data = http_login(email, password, code_provider, target_service=service)
+        _finish_login(ctx, email, session_data)
+    except SessionError as e:
+        console.print(f"[red]Login failed:[/red] {e}")
+        raise typer.Exit(code=2) from e
+
+
 @app.command()
 def export(
     ctx: typer.Context,
@@ -134,7 +209,7 @@ def export(
     config = get_config(ctx)
 
     # Try to get session
-    session_auth = get_session_auth(email=email, secret_store=SecretStore())
+    session_auth = get_context(ctx).session_auth(email)
 
     if not session_auth:
         console.print("[red]No session found.[/red] Run 'spaceauth login' first.")
@@ -167,7 +242,7 @@ def verify(
     """
     console = get_console(ctx)
 
-    session_auth = get_session_auth(email=email, secret_store=SecretStore())
+    session_auth = get_context(ctx).session_auth(email)
 
     if not session_auth:
         console.print("[red]No session found.[/red] Run 'spaceauth login' first.")
@@ -180,7 +255,8 @@ def verify(
 
     if session_auth.is_stale:
         console.print(
-            "[yellow]Warning:[/yellow] Session is older than 7 days and may be expired"
+            "[yellow]Warning:[/yellow] Session has not been verified in 7 days and may be "
+            "expired. Run 'spaceauth keepalive' to keep it warm."
         )
 
     # TODO: Make actual API request to verify
@@ -189,6 +265,69 @@ def verify(
     console.print(f"  Cookies: {len(session_auth.cookies)}")
 
 
+@app.command()
+def keepalive(
+    ctx: typer.Context,
+    email: str = typer.Option(
+        ...,
+        "--email",
+        "-e",
+        help="Apple ID email of the stored session to keep alive",
+    ),
+    interval: int = typer.Option(
+        3600,
+        "--interval",
+        "-i",
+        min=60,
+        help="Seconds between refreshes",
+    ),
+    once: bool = typer.Option(
+        False,
+        "--once",
+        help="Refresh once and exit (for cron or CI schedules)",
+    ),
+) -> None:
+    """Keep a stored session warm by touching Apple on a schedule.
+
+    Each refresh makes one lightweight authenticated request, stores any
+    cookies Apple rotated and records when the session was last verified.
+    Exits with code 2 once Apple rejects the session.
+    """
+    from slowlane.auth.session_auth import refresh_session
+
+    console = get_console(ctx)
+    config = get_config(ctx)
+    secret_store = get_context(ctx).secret_store
+
+    while True:
+        session_data = secret_store.retrieve_session(email)
+        if session_data is None:
+            console.print("[red]No session found.[/red] Run 'spaceauth login' first.")
+            raise typer.Exit(code=2)
+
+        try:
+            session_data = refresh_session(session_data, http_config=config.http)
+        except AuthExpiredError as e:
+            console.print(
+                f"[red]Session expired:[/red] {e}. Run 'spaceauth login' to sign in again."
+            )
+            raise typer.Exit(code=2) from e
+        except NetworkError as e:
+            # Transient; the session may well still be valid
+            if once:
+                console.print(f"[red]Keep-alive failed:[/red] {e}")
+                raise typer.Exit(code=e.exit_code) from e
+            console.print(f"[yellow]Keep-alive failed, retrying next interval:[/yellow] {e}")
+        else:
+            secret_store.store_session(email, session_data)
+            verified = f"{session_data.verified_at:%Y-%m-%d %H:%M:%S}"
+            console.print(f"[green]✓[/green] Session refreshed at {verified} UTC")
+
+        if once:
+            return
+        time.sleep(interval)
+
+
 @app.command()
 def revoke(
     ctx: typer.Context,
@@ -213,7 +352,7 @@ def revoke(
         if not confirm:
             raise typer.Abort()
 
-    secret_store = SecretStore()
+    secret_store = get_context(ctx).secret_store
     secret_store.delete_session(email)
 
     console.print(f"[green]✓[/green] Session deleted for {email}")
@@ -280,7 +419,7 @@ def doctor(
 
     # Check secret store
     try:
-        secret_store = SecretStore()
+        secret_store = get_context(ctx).secret_store
         backend_name = type(secret_store._backend).__name__
         table.add_row("Secret Store", "[green]✓ Available[/green]", backend_name)
     except Exception as e:
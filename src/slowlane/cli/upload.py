@@ -8,10 +8,10 @@
 from rich.console import Console
 from rich.panel import Panel
 
-from slowlane.auth.jwt_auth import get_jwt_auth
+from slowlane.cli.context import get_context
+from slowlane.cli.output import status
 from slowlane.core.config import SlowlaneConfig
 from slowlane.core.errors import TransporterError
-from slowlane.core.secrets import SecretStore
 from slowlane.transporter.wrapper import TransporterWrapper, find_transporter
 
 app = typer.Typer(
@@ -23,16 +23,12 @@
 
 def get_console(ctx: typer.Context) -> Console:
     """Get console from context."""
-    if ctx.obj is None:
-        return Console()
-    return ctx.obj.get("console", Console())
+    return get_context(ctx).console
 
 
 def get_config(ctx: typer.Context) -> SlowlaneConfig:
     """Get config from context."""
-    if ctx.obj is None:
-        return SlowlaneConfig.load()
-    return ctx.obj.get("config", SlowlaneConfig.load())
+    return get_context(ctx).config
 
 
 @app.command("ipa")
@@ -64,7 +60,6 @@ def upload_ipa(
     Requires JWT authentication (API key).
     """
     console = get_console(ctx)
-    config = get_config(ctx)
 
     # Check for transporter
     transporter_path = find_transporter()
@@ -82,7 +77,7 @@ def upload_ipa(
         raise typer.Exit(code=1)
 
     # Get JWT auth
-    jwt_auth = get_jwt_auth(config, SecretStore())
+    jwt_auth = get_context(ctx).jwt_auth
     if not jwt_auth:
         console.print(
             Panel(
@@ -108,16 +103,16 @@ def upload_ipa(
         )
 
         if validate_only:
-            with console.status("[bold blue]Validating IPA...[/bold blue]"):
+            with status(console, "[bold blue]Validating IPA...[/bold blue]"):
                 wrapper.validate(ipa_path)
             console.print("[green]✓[/green] Validation successful!")
         else:
             if not skip_validation:
-                with console.status("[bold blue]Validating IPA...[/bold blue]"):
+                with status(console, "[bold blue]Validating IPA...[/bold blue]"):
                     wrapper.validate(ipa_path)
                 console.print("[green]✓[/green] Validation passed")
 
-            with console.status("[bold blue]Uploading IPA...[/bold blue]"):
+            with status(console, "[bold blue]Uploading IPA...[/bold blue]"):
                 wrapper.upload(ipa_path)
             console.print("[green]✓[/green] Upload successful!")
 
@@ -0,0 +1,234 @@
+"""Adaptive (AIMD) concurrency limiting for parallel API work."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import TypeVar
+
+from .errors import ConfigError
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_INITIAL_LIMIT = 4
+DEFAULT_MAX_LIMIT = 16
+
+# Window multiplier applied on 429s, 5xx and network failures
+BACKOFF_RATIO = 0.5
+# Gentler multiplier when latency climbs well above the observed baseline
+LATENCY_BACKOFF_RATIO = 0.9
+# A response slower than baseline * tolerance counts as queueing upstream
+LATENCY_TOLERANCE = 2.0
+# How quickly the latency baseline drifts up toward recent samples
+BASELINE_DRIFT = 0.05
+
+
+class _AIMDWindow:
+    """Additive-increase / multiplicative-decrease window shared by both limiters.
+
+    Each success grows the window by ``1 / limit`` (about one slot per
+    window's worth of requests); an overload halves it. Responses much
+    slower than the best recent latency shrink it slightly, so the window
+    backs off before Apple starts rejecting requests. Overloads from
+    requests started before the last decrease are ignored, so one burst of
+    failures only shrinks the window once.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        min_limit: int,
+        max_limit: int,
+        clock: Callable[[], float],
+    ) -> None:
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ConfigError(
+                f"Concurrency limits must satisfy 1 <= min ({min_limit}) <= "
+                f"initial ({initial}) <= max ({max_limit})"
+            )
+        self._window = float(initial)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._now = clock
+        self._in_flight = 0
+        self._baseline: float | None = None
+        self._last_decrease = float("-inf")
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self._min_limit, min(self._max_limit, int(self._window)))
+
+    @property
+    def max_limit(self) -> int:
+        """Upper bound of the window."""
+        return self._max_limit
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        return self._in_flight
+
+    def _decrease(self, ratio: float, now: float) -> None:
+        self._window = max(float(self._min_limit), self._window * ratio)
+        self._last_decrease = now
+
+    def _record(self, started: float, overloaded: bool) -> None:
+        """Adjust the window for one finished request."""
+        now = self._now()
+        if overloaded:
+            if started >= self._last_decrease:
+                self._decrease(BACKOFF_RATIO, now)
+            return
+
+        latency = now - started
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            self._baseline += (latency - self._baseline) * BASELINE_DRIFT
+
+        if latency > self._baseline * LATENCY_TOLERANCE and started >= self._last_decrease:
+            self._decrease(LATENCY_BACKOFF_RATIO, now)
+        else:
+            self._window = min(float(self._max_limit), self._window + 1 / self._window)
+
+
+class AdaptiveLimiter(_AIMDWindow):
+    """Thread-safe adaptive limit on requests in flight."""
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(initial, min_limit, max_limit, clock)
+        self._cond = threading.Condition()
+
+    def acquire(self) -> float:
+        """Block until a slot is free; returns the start time to pass to release."""
+        with self._cond:
+            while self._in_flight >= self.limit:
+                self._cond.wait()
+            self._in_flight += 1
+            return self._now()
+
+    def release(self, started: float, overloaded: bool = False) -> None:
+        """Free a slot and feed the outcome back into the window."""
+        with self._cond:
+            self._in_flight -= 1
+            self._record(started, overloaded)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a slot for the duration of the block; exceptions count as overload."""
+        started = self.acquire()
+        try:
+            yield
+        except BaseException:
+            self.release(started, overloaded=True)
+            raise
+        self.release(started)
+
+
+class AsyncAdaptiveLimiter(_AIMDWindow):
+    """Asyncio counterpart of :class:`AdaptiveLimiter`."""
+
+    def __init__(
+        self,
+        initial: int = DEFAULT_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_MAX_LIMIT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(initial, min_limit, max_limit, clock)
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> float:
+        """Wait until a slot is free; returns the start time to pass to release."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            return self._now()
+
+    async def release(self, started: float, overloaded: bool = False) -> None:
+        """Free a slot and feed the outcome back into the window."""
+        async with self._cond:
+            self._in_flight -= 1
+            self._record(started, overloaded)
+            self._cond.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block; exceptions count as overload."""
+        started = await self.acquire()
+        try:
+            yield
+        except BaseException:
+            await self.release(started, overloaded=True)
+            raise
+        await self.release(started)
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(identity: str, max_limit: int = DEFAULT_MAX_LIMIT) -> AdaptiveLimiter:
+    """Get the process-wide adaptive limiter for ``identity`` (typically an API key ID)."""
+    with _limiters_lock:
+        limiter = _limiters.get(identity)
+        if limiter is None:
+            limiter = _limiters[identity] = AdaptiveLimiter(
+                initial=min(DEFAULT_INITIAL_LIMIT, max_limit), max_limit=max_limit
+            )
+        return limiter
+
+
+def bulk_map(
+    fn: Callable[[T], R], items: Iterable[T], workers: int, window: int | None = None
+) -> Iterator[R]:
+    """Apply ``fn`` to ``items`` on a thread pool, yielding results in input order.
+
+    ``workers`` is an upper bound; the adaptive limiter in the request
+    layer decides how many of those threads actually have a request in
+    flight. ``items`` is consumed lazily, at most ``window`` (default: twice
+    ``workers``) ahead of the result being yielded, so long or streamed
+    inputs are never queued up front. The first exception raised by ``fn``
+    is re-raised and items not yet started are cancelled.
+    """
+    workers = max(1, workers)
+    window = max(1, window or 2 * workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: deque[Future[R]] = deque()
+        try:
+            for item in items:
+                pending.append(pool.submit(fn, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def async_bulk_map(
+    fn: Callable[[T], Awaitable[R]], items: Iterable[T], workers: int
+) -> list[R]:
+    """Await ``fn`` over ``items`` with at most ``workers`` tasks running at once."""
+    gate = asyncio.Semaphore(max(1, workers))
+
+    async def run(item: T) -> R:
+        async with gate:
+            return await fn(item)
+
+    return list(await asyncio.gather(*(run(item) for item in items)))
@@ -41,6 +41,7 @@ class AuthConfig:
     key_id: str | None = None
     issuer_id: str | None = None
     private_key_path: str | None = None
+    token_cache: bool = False  # Reuse signed JWTs across invocations (encrypted on disk)
 
 
 @dataclass
@@ -50,6 +51,21 @@ class HttpConfig:
     timeout: int = 30
     max_retries: int = 3
     backoff_factor: float = 0.5
+    http2: bool = False  # Multiplex requests over one connection per host (needs h2)
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 5.0  # Seconds an idle connection stays open
+    adaptive_concurrency: bool = True  # AIMD limit on requests in flight per API key
+    max_concurrency: int = 16  # Upper bound for the adaptive limit and bulk workers
+    rate_limit: bool = True  # Pace requests from Apple's X-Rate-Limit header
+    shared_quota: bool = False  # Coordinate the budget across processes via a ledger
+    coalesce_requests: bool = True  # Share one request among identical concurrent GETs
+    cache: bool = False  # Revalidate GETs against an on-disk ETag/Last-Modified cache
+    cache_max_stale: int = 0  # Serve cached GETs up to this many seconds old unrevalidated
+    memory_cache: bool = False  # Keep recent GET responses in memory for this process
+    memory_cache_size: int = 256  # Max responses held in memory
+    memory_cache_ttls: dict[str, int] = field(default_factory=dict)  # Seconds per resource type
+    prefetch_pages: int = 0  # Pages listings fetch ahead in the background (0 disables)
 
 
 @dataclass
@@ -96,12 +112,36 @@ def _apply_dict(self, data: dict[str, Any]) -> None:
             self.auth.key_id = auth.get("key_id", self.auth.key_id)
             self.auth.issuer_id = auth.get("issuer_id", self.auth.issuer_id)
             self.auth.private_key_path = auth.get("private_key_path", self.auth.private_key_path)
+            self.auth.token_cache = auth.get("token_cache", self.auth.token_cache)
 
         if "http" in data:
             http = data["http"]
             self.http.timeout = http.get("timeout", self.http.timeout)
             self.http.max_retries = http.get("max_retries", self.http.max_retries)
             self.http.backoff_factor = http.get("backoff_factor", self.http.backoff_factor)
+            self.http.http2 = http.get("http2", self.http.http2)
+            self.http.max_connections = http.get("max_connections", self.http.max_connections)
+            self.http.max_keepalive_connections = http.get(
+                "max_keepalive_connections", self.http.max_keepalive_connections
+            )
+            self.http.keepalive_expiry = http.get("keepalive_expiry", self.http.keepalive_expiry)
+            self.http.adaptive_concurrency = http.get(
+                "adaptive_concurrency", self.http.adaptive_concurrency
+            )
+            self.http.max_concurrency = http.get("max_concurrency", self.http.max_concurrency)
+            self.http.rate_limit = http.get("rate_limit", self.http.rate_limit)
+            self.http.shared_quota = http.get("shared_quota", self.http.shared_quota)
+            self.http.coalesce_requests = http.get(
+                "coalesce_requests", self.http.coalesce_requests
+            )
+            self.http.cache = http.get("cache", self.http.cache)
+            self.http.cache_max_stale = http.get("cache_max_stale", self.http.cache_max_stale)
+            self.http.memory_cache = http.get("memory_cache", self.http.memory_cache)
+            self.http.memory_cache_size = http.get(
+                "memory_cache_size", self.http.memory_cache_size
+            )
+            self.http.memory_cache_ttls.update(http.get("memory_cache_ttls", {}))
+            self.http.prefetch_pages = http.get("prefetch_pages", self.http.prefetch_pages)
 
         if "output" in data:
             output = data["output"]
@@ -119,11 +159,27 @@ def _filter_none(d: dict[str, Any]) -> dict[str, Any]:
                 "key_id": self.auth.key_id,
                 "issuer_id": self.auth.issuer_id,
                 "private_key_path": self.auth.private_key_path,
+                "token_cache": self.auth.token_cache,
             }),
             "http": {
                 "timeout": self.http.timeout,
                 "max_retries": self.http.max_retries,
                 "backoff_factor": self.http.backoff_factor,
+                "http2": self.http.http2,
+                "max_connections": self.http.max_connections,
+                "max_keepalive_connections": self.http.max_keepalive_connections,
+                "keepalive_expiry": self.http.keepalive_expiry,
+                "adaptive_concurrency": self.http.adaptive_concurrency,
+                "max_concurrency": self.http.max_concurrency,
+                "rate_limit": self.http.rate_limit,
+                "shared_quota": self.http.shared_quota,
+                "coalesce_requests": self.http.coalesce_requests,
+                "cache": self.http.cache,
+                "cache_max_stale": self.http.cache_max_stale,
+                "memory_cache": self.http.memory_cache,
+                "memory_cache_size": self.http.memory_cache_size,
+                "memory_cache_ttls": dict(self.http.memory_cache_ttls),
+                "prefetch_pages": self.http.prefetch_pages,
             },
             "output": {
                 "format": self.output.format,
@@ -153,6 +209,20 @@ def apply_env_overrides(self) -> None:
             self.auth.issuer_id = issuer_id
         if private_key_path := os.environ.get("ASC_PRIVATE_KEY_PATH"):
             self.auth.private_key_path = private_key_path
+        if os.environ.get("SLOWLANE_TOKEN_CACHE", "").lower() in ("1", "true"):
+            self.auth.token_cache = True
+
+        # HTTP overrides
+        if os.environ.get("SLOWLANE_HTTP2", "").lower() in ("1", "true"):
+            self.http.http2 = True
+        if os.environ.get("SLOWLANE_SHARED_QUOTA", "").lower() in ("1", "true"):
+            self.http.shared_quota = True
+        if os.environ.get("SLOWLANE_HTTP_CACHE", "").lower() in ("1", "true"):
+            self.http.cache = True
+        if max_stale := os.environ.get("SLOWLANE_MAX_STALE"):
+            if not max_stale.isdigit():
+                raise ConfigError(f"SLOWLANE_MAX_STALE must be a number of seconds: {max_stale!r}")
+            self.http.cache_max_stale = int(max_stale)
 
         # Output overrides
         if os.environ.get("SLOWLANE_JSON", "").lower() in ("1", "true"):
@@ -0,0 +1,157 @@
+"""Client side of the local slowlane daemon.
+
+``slowlane daemon start`` keeps config, secrets, API key and session auth and
+pooled HTTP connections warm in one long-lived process listening on a unix
+socket. When that socket exists, the CLI forwards read-only command groups to
+the daemon instead of paying for start-up, TLS handshakes and JWT signing on
+every call.
+
+The protocol is one JSON object per line in each direction. This module only
+uses the standard library so forwarding stays cheap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import socket
+import sys
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from .config import get_data_dir
+from .errors import NetworkError
+
+# Set to 0/false/off to never forward commands to a running daemon
+DAEMON_ENV = "SLOWLANE_DAEMON"
+
+# Command groups that are forwarded: non-interactive and safe to run in the daemon
+FORWARDED_COMMANDS = frozenset({"asc", "signing", "env"})
+
+# Commands in those groups that ask for confirmation unless given --force. The
+# daemon has no terminal to ask on, so they are only forwarded with the flag.
+CONFIRMING_COMMANDS = frozenset({("signing", "certs", "revoke"), ("signing", "profiles", "delete")})
+_FORCE_OPTIONS = frozenset({"--force", "-f"})
+
+# Global options that take a value
+_VALUE_OPTIONS = frozenset({"-c", "--config"})
+
+# Seconds to wait for the daemon to accept a connection before running locally
+CONNECT_TIMEOUT = 0.5
+
+
+def get_socket_path() -> Path:
+    """Get the daemon socket path, overridable with ``SLOWLANE_DAEMON_SOCKET``."""
+    if override := os.environ.get("SLOWLANE_DAEMON_SOCKET"):
+        return Path(override).expanduser()
+    return get_data_dir() / "daemon.sock"
+
+
+def environment_fingerprint(environ: Mapping[str, str] | None = None) -> str:
+    """Hash the environment that affects credentials and config.
+
+    The daemon only runs commands for callers whose fingerprint matches its
+    own, so a CI step with a different API key or session is never served
+    with the daemon's credentials.
+    """
+    environ = os.environ if environ is None else environ
+    relevant = sorted(
+        (name, value)
+        for name, value in environ.items()
+        if (name.startswith(("ASC_", "SLOWLANE_", "XDG_")) or name in ("FASTLANE_SESSION", "HOME"))
+        and not name.startswith(DAEMON_ENV)
+    )
+    return hashlib.sha256(json.dumps(relevant).encode()).hexdigest()
+
+
+def send_request(
+    request: dict[str, Any],
+    socket_path: Path | None = None,
+    connect_timeout: float = CONNECT_TIMEOUT,
+) -> dict[str, Any]:
+    """Send one request to the daemon and return its response.
+
+    Raises:
+        OSError: If the daemon is not reachable
+        NetworkError: If the daemon accepted the request but did not answer
+    """
+    path = socket_path or get_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(connect_timeout)
+        sock.connect(str(path))
+        # Commands may take as long as the API does
+        sock.settimeout(None)
+        try:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+            response: dict[str, Any] = json.loads(line)
+        except (OSError, ValueError) as e:
+            raise NetworkError(f"slowlane daemon did not answer: {e}") from e
+    return response
+
+
+def needs_confirmation(argv: list[str]) -> bool:
+    """Whether ``argv`` runs a command that would prompt before acting."""
+    words = tuple(arg for arg in argv if not arg.startswith("-"))
+    return words[:3] in CONFIRMING_COMMANDS and not _FORCE_OPTIONS & set(argv)
+
+
+def forwarded_command(argv: list[str]) -> str | None:
+    """The command group ``argv`` would run, if it is one the daemon serves."""
+    for arg in argv:
+        if arg in _VALUE_OPTIONS or arg.startswith("--config="):
+            # A different config file than the daemon loaded
+            return None
+        if arg.startswith("-"):
+            continue
+        if arg not in FORWARDED_COMMANDS or needs_confirmation(argv):
+            return None
+        return arg
+    return None
+
+
+def forward_command(argv: list[str]) -> int | None:
+    """Run ``argv`` in a running daemon.
+
+    Returns:
+        The command's exit code, or None when it should run in this process
+        (no daemon, forwarding disabled, or a command the daemon does not serve)
+    """
+    if os.environ.get(DAEMON_ENV, "").lower() in ("0", "false", "off"):
+        return None
+    if forwarded_command(argv) is None:
+        return None
+
+    path = get_socket_path()
+    if not path.exists():
+        return None
+
+    try:
+        response = send_request(
+            {
+                "op": "run",
+                "argv": argv,
+                "cwd": os.getcwd(),
+                "env": environment_fingerprint(),
+                "columns": shutil.get_terminal_size().columns,
+                "color": sys.stdout.isatty() and "NO_COLOR" not in os.environ,
+            },
+            path,
+        )
+    except NetworkError as e:
+        # The command may have run, so running it again here is not safe
+        sys.stderr.write(f"Error: {e}\n")
+        return int(e.exit_code)
+    except OSError:
+        # Stale socket or a daemon that is not listening: run locally
+        return None
+
+    if "exit_code" not in response:
+        return None
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response["exit_code"])
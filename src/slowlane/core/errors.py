@@ -100,6 +100,12 @@ class SessionError(SlowlaneError):
     message = "Session error"
 
 
+class QuotaLedgerError(SlowlaneError):
+    """The shared quota ledger could not be read or updated."""
+
+    message = "Quota ledger error"
+
+
 class TransporterError(SlowlaneError):
     """iTunes Transporter error."""
 
@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import re
 import time
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ParamSpec, TypeVar
 
 import httpx
+import jwt
 
+from .concurrency import AdaptiveLimiter, AsyncAdaptiveLimiter
 from .config import HttpConfig
 from .errors import (
     AppleFlowChangedError,
     AuthExpiredError,
+    ConfigError,
     NetworkError,
     RateLimitError,
 )
+from .httpcache import CacheEntry, HttpCache
+from .memcache import CacheStats, ResponseCache
+from .ratelimit import RateLimiter
+from .singleflight import AsyncSingleFlight, SingleFlight, SingleFlightStats
 
 logger = logging.getLogger(__name__)
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
+# GET keyword arguments that can be folded into a single-flight key
+_COALESCIBLE_KWARGS = frozenset({"params", "headers", "max_stale"})
+# Responses that mean Apple is shedding load
+_OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+# GET keyword arguments compatible with the in-memory response cache
+_MEMORY_CACHEABLE_KWARGS = frozenset({"params", "max_stale"})
+
 # Patterns for redacting secrets in logs
 SECRET_PATTERNS = [
     re.compile(r'(Authorization:\s*Bearer\s+)[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+\.[A-Za-z0-9\-_]+'),
@@ -36,8 +56,8 @@ def redact_secrets(text: str) -> str:
     return result
 
 
-class AppleHTTPClient:
-    """HTTP client configured for Apple APIs with retry and error handling."""
+class _AppleHTTPBase:
+    """Shared configuration, headers and error classification for Apple HTTP clients."""
 
     ASC_API_BASE = "https://api.appstoreconnect.apple.com/v1"
     APPLE_AUTH_BASE = "https://idmsa.apple.com"
@@ -48,26 +68,46 @@ def __init__(
         config: HttpConfig | None = None,
         jwt_token: str | None = None,
         cookies: dict[str, str] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: HttpCache | None = None,
+        memory_cache: ResponseCache | None = None,
     ) -> None:
         self._config = config or HttpConfig()
         self._jwt_token = jwt_token
         self._cookies = cookies or {}
-
-        self._client = httpx.Client(
-            timeout=httpx.Timeout(self._config.timeout),
-            follow_redirects=True,
-            cookies=self._cookies,
-        )
+        self._rate_limiter = rate_limiter if self._config.rate_limit else None
+        if cache is None and self._config.cache:
+            cache = HttpCache()
+        self._cache = cache
+        self._memory_cache = memory_cache
+
+    def _client_options(self) -> dict[str, Any]:
+        """Keyword arguments for the underlying httpx client."""
+        if self._config.http2:
+            try:
+                import h2  # noqa: F401
+            except ImportError as exc:
+                raise ConfigError(
+                    "HTTP/2 support requires the h2 package. "
+                    "Install it with: pip install 'httpx[http2]'"
+                ) from exc
+
+        return {
+            "timeout": httpx.Timeout(self._config.timeout),
+            "limits": httpx.Limits(
+                max_connections=self._config.max_connections,
+                max_keepalive_connections=self._config.max_keepalive_connections,
+                keepalive_expiry=self._config.keepalive_expiry,
+            ),
+            "http2": self._config.http2,
+            "follow_redirects": True,
+            "cookies": self._cookies,
+        }
 
     def set_jwt_token(self, token: str) -> None:
         """Set JWT token for authentication."""
         self._jwt_token = token
 
-    def set_cookies(self, cookies: dict[str, str]) -> None:
-        """Set cookies for session authentication."""
-        self._cookies = cookies
-        self._client.cookies.update(cookies)
-
     def _get_headers(self, extra_headers: dict[str, str] | None = None) -> dict[str, str]:
         """Build request headers."""
         headers: dict[str, str] = {
@@ -103,7 +143,14 @@ def _classify_error(self, response: httpx.Response) -> None:
 
         if status == 429:
             retry_after = response.headers.get("Retry-After")
-            retry_seconds = int(retry_after) if retry_after and retry_after.isdigit() else 60
+            if retry_after and retry_after.isdigit():
+                retry_seconds = int(retry_after)
+            elif self._rate_limiter is not None:
+                # The limiter paces the retry from the refill rate instead
+                self._rate_limiter.on_rate_limited()
+                retry_seconds = 0
+            else:
+                retry_seconds = 60
             raise RateLimitError("Rate limit exceeded", retry_after=retry_seconds)
 
         if status >= 500:
@@ -123,6 +170,170 @@ def _classify_error(self, response: httpx.Response) -> None:
             except Exception:
                 pass
 
+    def _rate_limit_delay(self) -> float:
+        """Reserve rate-limit budget for one request and return the wait in seconds."""
+        if self._rate_limiter is None:
+            return 0.0
+        delay = self._rate_limiter.acquire()
+        if delay > 0:
+            logger.debug("Rate limit budget low, pacing request by %.2f seconds", delay)
+        return delay
+
+    def _record_rate_limit(self, response: httpx.Response) -> None:
+        """Feed the response's rate-limit headers back into the limiter."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.update(response.headers)
+
+    def _cache_identity(self) -> str:
+        """Identify whose view of the API a cached response belongs to."""
+        if self._jwt_token:
+            try:
+                header = jwt.get_unverified_header(self._jwt_token)
+                claims = jwt.decode(self._jwt_token, options={"verify_signature": False})
+                return f"jwt:{claims.get('iss', '')}:{header.get('kid', '')}"
+            except jwt.PyJWTError:
+                return "jwt:" + hashlib.sha256(self._jwt_token.encode()).hexdigest()
+        if self._cookies:
+            jar = ";".join(f"{k}={v}" for k, v in sorted(self._cookies.items()))
+            return "cookies:" + hashlib.sha256(jar.encode()).hexdigest()
+        return "anonymous"
+
+    @staticmethod
+    def _canonical_url(url: str, params: Any = None) -> httpx.URL:
+        """URL with query parameters merged in, as the request will send it."""
+        request_url = httpx.URL(url)
+        if params:
+            request_url = request_url.copy_merge_params(params)
+        return request_url
+
+    def _flight_key(self, url: str, kwargs: dict[str, Any]) -> tuple[str, ...] | None:
+        """Key identifying identical GETs, or None if the call cannot be coalesced."""
+        if not self._config.coalesce_requests or not kwargs.keys() <= _COALESCIBLE_KWARGS:
+            return None
+        headers = kwargs.get("headers") or {}
+        return (
+            str(self._canonical_url(url, kwargs.get("params"))),
+            self._cache_identity(),
+            repr(sorted(headers.items())),
+            repr(kwargs.get("max_stale")),
+        )
+
+    @property
+    def memory_cache_stats(self) -> CacheStats | None:
+        """Hit, miss and eviction counters of the in-memory cache, if enabled."""
+        return self._memory_cache.stats if self._memory_cache is not None else None
+
+    def _memory_cache_url(self, url: str, kwargs: dict[str, Any]) -> httpx.URL | None:
+        """URL to look up in the in-memory cache, or None if the GET bypasses it."""
+        if self._memory_cache is None or not kwargs.keys() <= _MEMORY_CACHEABLE_KWARGS:
+            return None
+        return self._canonical_url(url, kwargs.get("params"))
+
+    def _invalidate_memory_cache(self, url: str) -> None:
+        """Drop cached responses of every resource type a write touched."""
+        if self._memory_cache is not None:
+            self._memory_cache.invalidate(url)
+
+    def _cache_lookup(
+        self, url: str, kwargs: dict[str, Any]
+    ) -> tuple[str, CacheEntry | None, httpx.Response | None]:
+        """Prepare a cached GET.
+
+        Returns the cache key, any stored entry and, when that entry is
+        within ``max_stale`` seconds, a response to serve without a request.
+        Otherwise the entry's validators are added to ``kwargs["headers"]``.
+        """
+        assert self._cache is not None
+        max_stale = kwargs.pop("max_stale", None)
+        if max_stale is None:
+            max_stale = self._config.cache_max_stale
+
+        request_url = self._canonical_url(url, kwargs.get("params"))
+        key = self._cache.key(str(request_url), self._cache_identity())
+
+        entry, fresh = self._cache.lookup(key, max_stale)
+        if entry is not None and fresh:
+            logger.debug("Serving %s from cache (age %.0fs)", request_url, entry.age())
+            return key, entry, entry.to_response(httpx.Request("GET", request_url))
+
+        if entry is not None:
+            kwargs["headers"] = {**entry.validators(), **(kwargs.get("headers") or {})}
+        return key, entry, None
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff delay for a retry attempt."""
+        return float(self._config.backoff_factor * (2**attempt))
+
+    def _log_request(self, method: str, url: str, attempt: int) -> None:
+        """Log an outgoing request at debug level."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Request: %s %s (attempt %d)",
+                method,
+                url,
+                attempt + 1,
+            )
+
+    def _log_response(self, response: httpx.Response) -> None:
+        """Log a response at debug level with secrets redacted."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Response: %d %s",
+                response.status_code,
+                redact_secrets(response.text[:200] if response.text else ""),
+            )
+
+
+class AppleHTTPClient(_AppleHTTPBase):
+    """HTTP client configured for Apple APIs with retry and error handling."""
+
+    def __init__(
+        self,
+        config: HttpConfig | None = None,
+        jwt_token: str | None = None,
+        cookies: dict[str, str] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: HttpCache | None = None,
+        memory_cache: ResponseCache | None = None,
+        concurrency: AdaptiveLimiter | None = None,
+    ) -> None:
+        super().__init__(
+            config=config,
+            jwt_token=jwt_token,
+            cookies=cookies,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            memory_cache=memory_cache,
+        )
+        self._concurrency = concurrency
+        self._inflight: SingleFlight[httpx.Response] = SingleFlight()
+
+        self._client = httpx.Client(**self._client_options())
+
+    def set_cookies(self, cookies: dict[str, str]) -> None:
+        """Set cookies for session authentication."""
+        self._cookies = cookies
+        self._client.cookies.update(cookies)
+
+    @property
+    def cookies(self) -> dict[str, str]:
+        """Cookies the client holds now, including any set by responses or redirects."""
+        return {cookie.name: cookie.value for cookie in self._client.cookies.jar if cookie.value}
+
+    def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one request, holding an adaptive concurrency slot if configured."""
+        if self._concurrency is None:
+            return self._client.request(method, url, **kwargs)
+
+        started = self._concurrency.acquire()
+        overloaded = True
+        try:
+            response = self._client.request(method, url, **kwargs)
+            overloaded = response.status_code in _OVERLOAD_STATUSES
+            return response
+        finally:
+            self._concurrency.release(started, overloaded)
+
     def _request_with_retry(
         self,
         method: str,
@@ -136,22 +347,16 @@ def _request_with_retry(
         last_exception: Exception | None = None
         for attempt in range(self._config.max_retries + 1):
             try:
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(
-                        "Request: %s %s (attempt %d)",
-                        method,
-                        url,
-                        attempt + 1,
-                    )
+                delay = self._rate_limit_delay()
+                if delay > 0:
+                    time.sleep(delay)
 
-                response = self._client.request(method, url, **kwargs)
+                self._log_request(method, url, attempt)
 
-                if logger.isEnabledFor(logging.DEBUG):
-                    logger.debug(
-                        "Response: %d %s",
-                        response.status_code,
-                        redact_secrets(response.text[:200] if response.text else ""),
-                    )
+                response = self._send(method, url, **kwargs)
+
+                self._log_response(response)
+                self._record_rate_limit(response)
 
                 if response.status_code < 400:
                     return response
@@ -166,7 +371,7 @@ def _request_with_retry(
 
             except RateLimitError as e:
                 last_exception = e
-                wait_time = e.retry_after or (self._config.backoff_factor * (2**attempt))
+                wait_time = e.retry_after or self._backoff(attempt)
                 if attempt < self._config.max_retries:
                     logger.warning("Rate limited, waiting %d seconds...", wait_time)
                     time.sleep(wait_time)
@@ -176,7 +381,7 @@ def _request_with_retry(
             except httpx.TimeoutException as e:
                 last_exception = NetworkError(f"Request timeout: {e}")
                 if attempt < self._config.max_retries:
-                    wait_time = self._config.backoff_factor * (2**attempt)
+                    wait_time = self._backoff(attempt)
                     logger.warning("Timeout, retrying in %.1f seconds...", wait_time)
                     time.sleep(wait_time)
                     continue
@@ -184,7 +389,7 @@ def _request_with_retry(
             except httpx.RequestError as e:
                 last_exception = NetworkError(f"Request failed: {e}")
                 if attempt < self._config.max_retries:
-                    wait_time = self._config.backoff_factor * (2**attempt)
+                    wait_time = self._backoff(attempt)
                     logger.warning("Network error, retrying in %.1f seconds...", wait_time)
                     time.sleep(wait_time)
                     continue
@@ -193,21 +398,76 @@ def _request_with_retry(
             raise last_exception
         raise NetworkError("Request failed after retries")
 
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        """How many GETs were answered by an identical request already in flight."""
+        return self._inflight.stats
+
+    @property
+    def concurrency(self) -> AdaptiveLimiter | None:
+        """Adaptive in-flight limiter, if configured."""
+        return self._concurrency
+
     def get(self, url: str, **kwargs: Any) -> httpx.Response:
-        """HTTP GET request."""
-        return self._request_with_retry("GET", url, **kwargs)
+        """HTTP GET request.
+
+        Identical GETs issued concurrently from several threads share one
+        request. With a cache configured, ``max_stale=`` overrides how old
+        (in seconds) a cached response may be to skip revalidation.
+        """
+        cache = self._memory_cache
+        memory_url = self._memory_cache_url(url, kwargs)
+        identity = ""
+        generation = 0
+        if cache is not None and memory_url is not None:
+            identity = self._cache_identity()
+            cached = cache.get(identity, memory_url)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
+        key = self._flight_key(url, kwargs)
+        if key is None:
+            response = self._get_once(url, **kwargs)
+        else:
+            response = self._inflight.do(key, lambda: self._get_once(url, **kwargs))
+
+        if cache is not None and memory_url is not None:
+            cache.put(identity, memory_url, response, generation)
+        return response
+
+    def _get_once(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one GET, going through the cache when configured."""
+        if self._cache is None:
+            kwargs.pop("max_stale", None)
+            return self._request_with_retry("GET", url, **kwargs)
+
+        key, entry, cached = self._cache_lookup(url, kwargs)
+        if cached is not None:
+            return cached
+        response = self._request_with_retry("GET", url, **kwargs)
+        return self._cache.update(key, entry, response)
 
     def post(self, url: str, **kwargs: Any) -> httpx.Response:
         """HTTP POST request."""
-        return self._request_with_retry("POST", url, **kwargs)
+        try:
+            return self._request_with_retry("POST", url, **kwargs)
+        finally:
+            self._invalidate_memory_cache(url)
 
     def patch(self, url: str, **kwargs: Any) -> httpx.Response:
         """HTTP PATCH request."""
-        return self._request_with_retry("PATCH", url, **kwargs)
+        try:
+            return self._request_with_retry("PATCH", url, **kwargs)
+        finally:
+            self._invalidate_memory_cache(url)
 
     def delete(self, url: str, **kwargs: Any) -> httpx.Response:
         """HTTP DELETE request."""
-        return self._request_with_retry("DELETE", url, **kwargs)
+        try:
+            return self._request_with_retry("DELETE", url, **kwargs)
+        finally:
+            self._invalidate_memory_cache(url)
 
     def get_json(self, url: str, **kwargs: Any) -> dict[str, Any]:
         """GET request returning JSON."""
@@ -228,3 +488,210 @@ def __enter__(self) -> AppleHTTPClient:
 
     def __exit__(self, *args: Any) -> None:
         self.close()
+
+
+class AsyncAppleHTTPClient(_AppleHTTPBase):
+    """Asynchronous twin of :class:`AppleHTTPClient` built on ``httpx.AsyncClient``.
+
+    Retry, backoff and error classification behave exactly like the blocking
+    client, but waits use ``asyncio.sleep`` so many requests can be awaited
+    concurrently over one pooled connection set.
+    """
+
+    def __init__(
+        self,
+        config: HttpConfig | None = None,
+        jwt_token: str | None = None,
+        cookies: dict[str, str] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        cache: HttpCache | None = None,
+        memory_cache: ResponseCache | None = None,
+        concurrency: AsyncAdaptiveLimiter | None = None,
+    ) -> None:
+        super().__init__(
+            config=config,
+            jwt_token=jwt_token,
+            cookies=cookies,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            memory_cache=memory_cache,
+        )
+        self._concurrency = concurrency
+        self._inflight: AsyncSingleFlight[httpx.Response] = AsyncSingleFlight()
+
+        self._client = httpx.AsyncClient(**self._client_options())
+
+    def set_cookies(self, cookies: dict[str, str]) -> None:
+        """Set cookies for session authentication."""
+        self._cookies = cookies
+        self._client.cookies.update(cookies)
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one request, holding an adaptive concurrency slot if configured."""
+        if self._concurrency is None:
+            return await self._client.request(method, url, **kwargs)
+
+        started = await self._concurrency.acquire()
+        overloaded = True
+        try:
+            response = await self._client.request(method, url, **kwargs)
+            overloaded = response.status_code in _OVERLOAD_STATUSES
+            return response
+        finally:
+            await self._concurrency.release(started, overloaded)
+
+    async def _off_loop(self, fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run a rate-limiter call on a worker thread when a limiter is configured.
+
+        A :class:`~slowlane.core.quota.QuotaLedger` may wait up to its lock
+        timeout for another process, which must not stall the event loop.
+        """
+        if self._rate_limiter is None:
+            return fn(*args, **kwargs)
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Execute request with exponential backoff retry."""
+        headers = self._get_headers(kwargs.pop("headers", None))
+        kwargs["headers"] = headers
+
+        last_exception: Exception | None = None
+        for attempt in range(self._config.max_retries + 1):
+            try:
+                delay = await self._off_loop(self._rate_limit_delay)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self._log_request(method, url, attempt)
+
+                response = await self._send(method, url, **kwargs)
+
+                self._log_response(response)
+                await self._off_loop(self._record_rate_limit, response)
+
+                if response.status_code < 400:
+                    return response
+
+                # Non-retryable errors raise here; 429 raises RateLimitError
+                await self._off_loop(self._classify_error, response)
+                return response
+
+            except RateLimitError as e:
+                last_exception = e
+                wait_time = e.retry_after or self._backoff(attempt)
+                if attempt < self._config.max_retries:
+                    logger.warning("Rate limited, waiting %d seconds...", wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise
+
+            except httpx.TimeoutException as e:
+                last_exception = NetworkError(f"Request timeout: {e}")
+                if attempt < self._config.max_retries:
+                    wait_time = self._backoff(attempt)
+                    logger.warning("Timeout, retrying in %.1f seconds...", wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+
+            except httpx.RequestError as e:
+                last_exception = NetworkError(f"Request failed: {e}")
+                if attempt < self._config.max_retries:
+                    wait_time = self._backoff(attempt)
+                    logger.warning("Network error, retrying in %.1f seconds...", wait_time)
+                    await asyncio.sleep(wait_time)
+                    continue
+
+        if last_exception:
+            raise last_exception
+        raise NetworkError("Request failed after retries")
+
+    @property
+    def coalescing_stats(self) -> SingleFlightStats:
+        """How many GETs were answered by an identical request already in flight."""
+        return self._inflight.stats
+
+    @property
+    def concurrency(self) -> AsyncAdaptiveLimiter | None:
+        """Adaptive in-flight limiter, if configured."""
+        return self._concurrency
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """HTTP GET request, coalesced and cached like :meth:`AppleHTTPClient.get`."""
+        cache = self._memory_cache
+        memory_url = self._memory_cache_url(url, kwargs)
+        identity = ""
+        generation = 0
+        if cache is not None and memory_url is not None:
+            identity = self._cache_identity()
+            cached = cache.get(identity, memory_url)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
+        key = self._flight_key(url, kwargs)
+        if key is None:
+            response = await self._get_once(url, **kwargs)
+        else:
+            response = await self._inflight.do(key, lambda: self._get_once(url, **kwargs))
+
+        if cache is not None and memory_url is not None:
+            cache.put(identity, memory_url, response, generation)
+        return response
+
+    async def _get_once(self, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one GET, going through the cache when configured."""
+        if self._cache is None:
+            kwargs.pop("max_stale", None)
+            return await self._request_with_retry("GET", url, **kwargs)
+
+        key, entry, cached = self._cache_lookup(url, kwargs)
+        if cached is not None:
+            return cached
+        response = await self._request_with_retry("GET", url, **kwargs)
+        return self._cache.update(key, entry, response)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        """HTTP POST request."""
+        try:
+            return await self._request_with_retry("POST", url, **kwargs)
+        finally:
+            self._invalidate_memory_cache(url)
+
+    async def patch(self, url: str, **kwargs: Any) -> httpx.Response:
+        """HTTP PATCH request."""
+        try:
+            return await self._request_with_retry("PATCH", url, **kwargs)
+        finally:
+            self._invalidate_memory_cache(url)
+
+    async def delete(self, url: str, **kwargs: Any) -> httpx.Response:
+        """HTTP DELETE request."""
+        try:
+            return await self._request_with_retry("DELETE", url, **kwargs)
+        finally:
+            self._invalidate_memory_cache(url)
+
+    async def get_json(self, url: str, **kwargs: Any) -> dict[str, Any]:
+        """GET request returning JSON."""
+        response = await self.get(url, **kwargs)
+        return response.json()  # type: ignore[no-any-return]
+
+    async def post_json(self, url: str, data: dict[str, Any], **kwargs: Any) -> dict[str, Any]:
+        """POST JSON data and return JSON response."""
+        response = await self.post(url, json=data, **kwargs)
+        return response.json()  # type: ignore[no-any-return]
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncAppleHTTPClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
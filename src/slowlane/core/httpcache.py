@@ -0,0 +1,182 @@
+"""On-disk HTTP cache for conditional GET requests (ETag / Last-Modified)."""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import httpx
+
+from .config import get_data_dir
+
+logger = logging.getLogger(__name__)
+
+# Response headers replayed when a body is served from the cache
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def get_http_cache_dir() -> Path:
+    """Get the directory holding cached HTTP responses."""
+    return get_data_dir() / "cache" / "http"
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body and the validators needed to revalidate it."""
+
+    url: str
+    status_code: int
+    body: bytes
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the entry was stored or last revalidated."""
+        return (time.time() if now is None else now) - self.stored_at
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        """Rebuild an ``httpx.Response`` from the cached entry."""
+        return httpx.Response(
+            self.status_code,
+            headers={**self.headers, "X-Slowlane-Cache": "hit"},
+            content=self.body,
+            request=request,
+        )
+
+
+class HttpCache:
+    """Cache of GET responses stored as one JSON file per request key.
+
+    Keys combine the full URL (including query parameters) with an auth
+    identity, so responses are never shared between API keys or sessions.
+    Only responses carrying an ``ETag`` or ``Last-Modified`` validator are
+    stored; they are revalidated with a conditional request and a ``304``
+    is answered from disk. With ``max_stale`` an entry younger than that
+    many seconds is served without contacting the server at all.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self._directory = directory or get_http_cache_dir()
+
+    @property
+    def directory(self) -> Path:
+        """Cache directory."""
+        return self._directory
+
+    @staticmethod
+    def key(url: str, identity: str) -> str:
+        """Build the cache key for a URL as seen by one auth identity."""
+        return hashlib.sha256(f"{identity}\n{url}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}.json"
+
+    def load(self, key: str) -> CacheEntry | None:
+        """Load an entry, treating unreadable files as a miss."""
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            data["body"] = base64.b64decode(data["body"])
+            return CacheEntry(**data)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Discarding unreadable cache entry %s: %s", path.name, e)
+            with contextlib.suppress(OSError):
+                path.unlink()
+            return None
+
+    def store(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry atomically; failures only cost a cache miss."""
+        data = asdict(entry)
+        data["body"] = base64.b64encode(entry.body).decode("ascii")
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # Cached bodies may contain account data, so the file is never
+            # readable by others, even if a stale temp file was left behind
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Failed to write cache entry %s: %s", path.name, e)
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+
+    def clear(self) -> int:
+        """Delete every cached entry and return how many were removed."""
+        removed = 0
+        if not self._directory.exists():
+            return removed
+        for path in self._directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                path.unlink()
+                removed += 1
+        return removed
+
+    def lookup(self, key: str, max_stale: float = 0) -> tuple[CacheEntry | None, bool]:
+        """Find an entry and whether it is young enough to serve without revalidating."""
+        entry = self.load(key)
+        if entry is None:
+            return None, False
+        return entry, max_stale > 0 and entry.age() <= max_stale
+
+    def update(
+        self, key: str, entry: CacheEntry | None, response: httpx.Response
+    ) -> httpx.Response:
+        """Record a response to a (possibly conditional) GET.
+
+        A ``304`` refreshes the stored entry and returns its body as a full
+        response; a successful response with validators replaces the entry.
+        """
+        if response.status_code == 304 and entry is not None:
+            entry.stored_at = time.time()
+            self.store(key, entry)
+            return entry.to_response(response.request)
+
+        if response.status_code == 200:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                self.store(
+                    key,
+                    CacheEntry(
+                        url=str(response.request.url),
+                        status_code=response.status_code,
+                        body=response.content,
+                        stored_at=time.time(),
+                        etag=etag,
+                        last_modified=last_modified,
+                        headers={
+                            name: response.headers[name]
+                            for name in _STORED_HEADERS
+                            if name in response.headers
+                        },
+                    ),
+                )
+
+        return response
@@ -0,0 +1,166 @@
+"""In-memory LRU/TTL cache of GET responses with per-resource-type policies."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+
+import httpx
+
+# Path segments naming a resource type ("apps", "betaGroups"); IDs and
+# version prefixes ("v1") contain digits, dashes or start uppercase.
+_TYPE_SEGMENT = re.compile(r"^[a-z][A-Za-z]*$")
+_NON_TYPE_SEGMENTS = frozenset({"relationships"})
+
+DEFAULT_MAX_ENTRIES = 256
+
+
+def resource_types(url: httpx.URL | str) -> tuple[str, ...]:
+    """Resource types named in a URL path, outermost first.
+
+    ``/v1/betaGroups/42/relationships/betaTesters`` gives
+    ``("betaGroups", "betaTesters")``.
+    """
+    path = httpx.URL(str(url)).path
+    return tuple(
+        segment
+        for segment in path.split("/")
+        if _TYPE_SEGMENT.match(segment) and segment not in _NON_TYPE_SEGMENTS
+    )
+
+
+@dataclass
+class CacheStats:
+    """Counters for a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0  # Dropped to stay within max_entries
+    expirations: int = 0  # Dropped because their TTL passed
+    invalidations: int = 0  # Dropped because a write touched their resource type
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class _Entry:
+    response: httpx.Response
+    expires_at: float
+    types: frozenset[str]
+
+
+class ResponseCache:
+    """Bounded, thread-safe cache of successful GET responses.
+
+    Each response is kept for the TTL of its primary resource type (the
+    first type in the URL path); types without a policy fall back to
+    ``default_ttl``, and a TTL of 0 disables caching for that type. The
+    least recently used entry is evicted once ``max_entries`` is reached.
+    A write to a URL drops every entry that mentions any of its types.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float = 0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttls = dict(ttls or {})
+        self._default_ttl = default_ttl
+        self._max_entries = max_entries
+        self._now = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], _Entry] = OrderedDict()
+        self._generation = 0
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every invalidation.
+
+        Read it before fetching and pass it to :meth:`put`, so a response
+        fetched before a write cannot repopulate the cache after it.
+        """
+        return self._generation
+
+    def ttl_for(self, url: httpx.URL | str) -> float:
+        """TTL policy for a URL's primary resource type."""
+        types = resource_types(url)
+        if not types:
+            return self._default_ttl
+        return self._ttls.get(types[0], self._default_ttl)
+
+    def get(self, identity: str, url: httpx.URL | str) -> httpx.Response | None:
+        """Return a live cached response, refreshing its LRU position."""
+        key = (identity, str(url))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at <= self._now():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.response
+
+    def put(
+        self,
+        identity: str,
+        url: httpx.URL | str,
+        response: httpx.Response,
+        generation: int | None = None,
+    ) -> None:
+        """Cache a successful response according to its type's TTL."""
+        ttl = self.ttl_for(url)
+        if ttl <= 0 or response.status_code != 200 or self._max_entries <= 0:
+            return
+
+        key = (identity, str(url))
+        entry = _Entry(
+            response=response,
+            expires_at=self._now() + ttl,
+            types=frozenset(resource_types(url)),
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, url: httpx.URL | str) -> int:
+        """Drop entries sharing a resource type with ``url``; returns how many."""
+        types = frozenset(resource_types(url))
+        if not types:
+            return 0
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, entry in self._entries.items() if entry.types & types]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
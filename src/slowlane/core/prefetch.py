@@ -0,0 +1,112 @@
+"""Read-ahead helpers that overlap fetching the next item with consuming the current one."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import queue
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Sentinel kinds for entries passed from producer to consumer
+_ITEM = "item"
+_DONE = "done"
+_ERROR = "error"
+
+# How often a blocked producer re-checks whether the consumer went away
+_PUT_POLL_SECONDS = 0.1
+
+
+def read_ahead(items: Iterator[T], depth: int) -> Iterator[T]:
+    """Iterate ``items`` on a background thread, buffering up to ``depth`` results.
+
+    While the caller processes one item, the worker thread is already
+    producing the next ones, so slow producers (such as paginated HTTP
+    requests) overlap with the caller's work. Exceptions raised by the
+    producer are re-raised in the consumer. A depth of 0 disables read-ahead.
+    """
+    if depth <= 0:
+        yield from items
+        return
+
+    buffer: queue.Queue[tuple[str, Any]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple[str, Any]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((_ITEM, item)):
+                    return
+            put((_DONE, None))
+        except BaseException as e:
+            put((_ERROR, e))
+        finally:
+            close = getattr(items, "close", None)
+            if close is not None:
+                with contextlib.suppress(Exception):
+                    close()
+
+    worker = threading.Thread(target=produce, name="slowlane-read-ahead", daemon=True)
+    worker.start()
+
+    try:
+        while True:
+            kind, value = buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        stop.set()
+
+
+async def async_read_ahead(items: AsyncIterator[T], depth: int) -> AsyncGenerator[T, None]:
+    """Async counterpart of :func:`read_ahead` using a background task."""
+    if depth <= 0:
+        async for item in items:
+            yield item
+        return
+
+    buffer: asyncio.Queue[tuple[str, Any]] = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async for item in items:
+                await buffer.put((_ITEM, item))
+            await buffer.put((_DONE, None))
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await buffer.put((_ERROR, e))
+
+    task = asyncio.create_task(produce())
+
+    try:
+        while True:
+            kind, value = await buffer.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            yield value
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            with contextlib.suppress(Exception):
+                await aclose()
@@ -0,0 +1,176 @@
+"""Cross-process request quota shared through a SQLite ledger.
+
+CI fleets often run many slowlane processes against one API key. Each
+process's in-memory :class:`~slowlane.core.ratelimit.RateLimiter` only sees
+its own traffic, so together they overspend the hourly budget. The ledger
+keeps one token bucket per key in a SQLite database that every process on
+the host (or on a shared volume) reads and updates under a write lock.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from .config import get_data_dir
+from .errors import QuotaLedgerError
+from .ratelimit import RateLimiter, TokenBucket
+
+# Seconds to wait for another process to release the ledger's write lock
+LOCK_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota (
+    identity TEXT PRIMARY KEY,
+    quota_limit INTEGER NOT NULL,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+def get_ledger_path() -> Path:
+    """Get the quota ledger path, overridable with ``SLOWLANE_QUOTA_DB``."""
+    if override := os.environ.get("SLOWLANE_QUOTA_DB"):
+        return Path(override).expanduser()
+    return get_data_dir() / "quota.db"
+
+
+@dataclass
+class QuotaEntry:
+    """Snapshot of one key's budget in the ledger."""
+
+    identity: str
+    limit: int
+    remaining: int
+    updated_at: float
+
+
+def _connect(path: Path, check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open the ledger, creating it if needed.
+
+    Raises:
+        QuotaLedgerError: If the database cannot be opened
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Autocommit mode so transactions are controlled explicitly below
+        conn = sqlite3.connect(
+            path,
+            timeout=LOCK_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=check_same_thread,
+        )
+        conn.execute(_SCHEMA)
+    except sqlite3.Error as e:
+        raise QuotaLedgerError(f"Cannot open quota ledger: {e}", path=str(path)) from e
+    return conn
+
+
+class QuotaLedger(RateLimiter):
+    """Rate limiter whose token bucket lives in a shared SQLite ledger.
+
+    Every reservation runs inside ``BEGIN IMMEDIATE``, so concurrent
+    processes serialize on the database write lock and each sees the
+    others' reservations. Wall-clock time is used because monotonic clocks
+    are not comparable across processes.
+
+    The ledger is opened once and its connection shared by the instance's
+    threads, one transaction at a time. SQLite failures surface as
+    :class:`~slowlane.core.errors.QuotaLedgerError`.
+    """
+
+    def __init__(
+        self,
+        identity: str,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__(clock=clock)
+        self._identity = identity
+        self._path = path or get_ledger_path()
+        self._conn = _connect(self._path, check_same_thread=False)
+
+    @property
+    def path(self) -> Path:
+        """Ledger database path."""
+        return self._path
+
+    def close(self) -> None:
+        """Close the ledger connection."""
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        with self._lock:
+            conn = self._conn
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield
+                    conn.execute("COMMIT")
+                finally:
+                    # Still open only if the body or COMMIT failed
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
+            except sqlite3.Error as e:
+                raise QuotaLedgerError(
+                    f"Quota ledger update failed: {e}", path=str(self._path)
+                ) from e
+
+    def _load(self) -> TokenBucket | None:
+        row = self._conn.execute(
+            "SELECT quota_limit, tokens, updated_at FROM quota WHERE identity = ?",
+            (self._identity,),
+        ).fetchone()
+        if row is None:
+            return None
+        return TokenBucket(limit=row[0], tokens=row[1], updated_at=row[2])
+
+    def _save(self, bucket: TokenBucket) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO quota (identity, quota_limit, tokens, updated_at) "
+            "VALUES (?, ?, ?, ?)",
+            (self._identity, bucket.limit, bucket.tokens, bucket.updated_at),
+        )
+
+
+def read_ledger(path: Path | None = None, now: float | None = None) -> list[QuotaEntry]:
+    """List every key's budget in the ledger, refilled to the current time.
+
+    Returns an empty list when the ledger does not exist yet.
+    """
+    path = path or get_ledger_path()
+    if not path.exists():
+        return []
+
+    now = time.time() if now is None else now
+    conn = _connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT identity, quota_limit, tokens, updated_at FROM quota ORDER BY identity"
+        ).fetchall()
+    except sqlite3.Error as e:
+        raise QuotaLedgerError(f"Cannot read quota ledger: {e}", path=str(path)) from e
+    finally:
+        conn.close()
+
+    entries = []
+    for identity, limit, tokens, updated_at in rows:
+        bucket = TokenBucket(limit=limit, tokens=tokens, updated_at=updated_at)
+        bucket.refill(now)
+        entries.append(
+            QuotaEntry(
+                identity=identity,
+                limit=limit,
+                remaining=max(0, int(bucket.tokens)),
+                updated_at=updated_at,
+            )
+        )
+    return entries
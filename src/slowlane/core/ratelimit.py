@@ -0,0 +1,188 @@
+"""Client-side rate limiting driven by Apple's ``X-Rate-Limit`` response header."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+# Apple reports the hourly budget as "user-hour-lim:3500;user-hour-rem:3499;"
+RATE_LIMIT_HEADER = "X-Rate-Limit"
+WINDOW_SECONDS = 60 * 60
+
+_FIELD_PATTERN = re.compile(r"([\w-]+)\s*:\s*(\d+)")
+
+
+@dataclass
+class RateLimitStatus:
+    """Hourly request budget as reported by Apple."""
+
+    limit: int
+    remaining: int
+
+
+def parse_rate_limit_header(value: str | None) -> RateLimitStatus | None:
+    """Parse an ``X-Rate-Limit`` header value.
+
+    Returns None when the header is missing or does not carry both the
+    hourly limit and the remaining count.
+    """
+    if not value:
+        return None
+
+    fields = {name.lower(): int(number) for name, number in _FIELD_PATTERN.findall(value)}
+    limit = fields.get("user-hour-lim")
+    remaining = fields.get("user-hour-rem")
+    if limit is None or remaining is None or limit <= 0:
+        return None
+    return RateLimitStatus(limit=limit, remaining=remaining)
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket refilled at ``limit / WINDOW_SECONDS`` tokens per second.
+
+    Reservations may drive the balance negative; the deficit tells each
+    caller how long to wait, so concurrent callers queue up behind each other
+    instead of all waking at once.
+    """
+
+    limit: int
+    tokens: float
+    updated_at: float
+
+    @property
+    def refill_rate(self) -> float:
+        """Tokens added per second."""
+        return self.limit / WINDOW_SECONDS
+
+    def refill(self, now: float) -> None:
+        """Add tokens earned since the last update."""
+        elapsed = max(0.0, now - self.updated_at)
+        self.tokens = min(float(self.limit), self.tokens + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how many seconds to wait before sending."""
+        self.refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.refill_rate
+
+    def sync(self, status: RateLimitStatus, now: float) -> None:
+        """Align the bucket with the budget Apple reported."""
+        self.refill(now)
+        self.limit = status.limit
+        # Never hand out more than the server says is left, but keep any
+        # outstanding deficit so queued callers stay spaced out.
+        self.tokens = min(self.tokens, float(status.remaining))
+
+    def exhaust(self, now: float) -> None:
+        """Drop the balance to zero after an unexpected 429."""
+        self.refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimiter:
+    """Thread-safe pacing for one API key's hourly request budget.
+
+    The limiter is inactive until the first response carrying an
+    ``X-Rate-Limit`` header arrives; from then on every request reserves a
+    token and sleeps for the returned delay, spreading the hourly budget
+    evenly once it runs low instead of hitting 429s.
+
+    Subclasses can keep the bucket elsewhere by overriding
+    :meth:`_transaction`, :meth:`_load` and :meth:`_save`.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._lock = threading.Lock()
+        self._bucket: TokenBucket | None = None
+        self._now = clock
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Serialize a load/modify/save cycle."""
+        with self._lock:
+            yield
+
+    def _load(self) -> TokenBucket | None:
+        """Read the bucket inside a transaction."""
+        return self._bucket
+
+    def _save(self, bucket: TokenBucket) -> None:
+        """Write the bucket back inside a transaction."""
+        self._bucket = bucket
+
+    @property
+    def status(self) -> RateLimitStatus | None:
+        """Current estimate of the hourly budget, if known."""
+        with self._transaction():
+            bucket = self._load()
+            if bucket is None:
+                return None
+            bucket.refill(self._now())
+            return RateLimitStatus(limit=bucket.limit, remaining=max(0, int(bucket.tokens)))
+
+    def acquire(self) -> float:
+        """Reserve budget for one request and return the seconds to wait first."""
+        with self._transaction():
+            bucket = self._load()
+            if bucket is None:
+                return 0.0
+            delay = bucket.reserve(self._now())
+            self._save(bucket)
+            return delay
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Update the budget from a response's headers."""
+        status = parse_rate_limit_header(headers.get(RATE_LIMIT_HEADER))
+        if status is None:
+            return
+
+        with self._transaction():
+            now = self._now()
+            bucket = self._load()
+            if bucket is None:
+                bucket = TokenBucket(
+                    limit=status.limit, tokens=float(status.remaining), updated_at=now
+                )
+            else:
+                bucket.sync(status, now)
+            self._save(bucket)
+
+    def on_rate_limited(self) -> None:
+        """Record a 429 so subsequent requests are paced."""
+        with self._transaction():
+            bucket = self._load()
+            if bucket is not None:
+                bucket.exhaust(self._now())
+                self._save(bucket)
+
+
+_limiters: dict[tuple[str, bool], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(identity: str, shared: bool = False) -> RateLimiter:
+    """Get the process-wide limiter shared by every client using ``identity``.
+
+    Args:
+        identity: Budget owner, typically the API key ID
+        shared: Coordinate with other processes through the quota ledger
+    """
+    with _limiters_lock:
+        limiter = _limiters.get((identity, shared))
+        if limiter is None:
+            if shared:
+                from .quota import QuotaLedger
+
+                limiter = QuotaLedger(identity)
+            else:
+                limiter = RateLimiter()
+            _limiters[(identity, shared)] = limiter
+        return limiter
@@ -0,0 +1,230 @@
+"""JWT-authenticated signing client backed by the App Store Connect API."""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from slowlane.asc.client import AppStoreConnectClient
+from slowlane.auth.jwt_auth import JWTAuth
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import DeveloperPortalError
+from slowlane.devportal.client import CERTIFICATE_TYPES, PROFILE_TYPES
+
+DEVICE_PLATFORMS = {
+    "ios": "IOS",
+    "mac": "MAC_OS",
+}
+
+
+class DeveloperPortalAPIClient(AppStoreConnectClient):
+    """Certificates, profiles, devices and bundle IDs over the ASC API.
+
+    Exposes the signing methods of
+    :class:`~slowlane.devportal.client.DeveloperPortalClient` using an API
+    key instead of Apple ID session cookies, so CI signing runs headless
+    without a browser login. Results are JSON:API resources (``id``,
+    ``type``, ``attributes``) rather than the portal's legacy shapes.
+    """
+
+    def __init__(
+        self,
+        jwt_auth: JWTAuth,
+        config: SlowlaneConfig | None = None,
+        background_token_refresh: bool = False,
+    ) -> None:
+        """Initialize client with API key authentication.
+
+        Args:
+            jwt_auth: JWT authentication (required)
+            config: Configuration for HTTP client
+            background_token_refresh: Mint JWTs on a background thread
+        """
+        super().__init__(
+            jwt_auth=jwt_auth,
+            config=config,
+            background_token_refresh=background_token_refresh,
+        )
+
+    def _delete(self, endpoint: str) -> None:
+        """Make DELETE request to API."""
+        self._http.delete(f"{self.BASE_URL}/{endpoint}")
+
+    def _create(
+        self,
+        resource_type: str,
+        attributes: dict[str, Any],
+        relationships: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """POST a new resource and return it."""
+        data: dict[str, Any] = {"type": resource_type, "attributes": attributes}
+        if relationships:
+            data["relationships"] = relationships
+        response = self._post(resource_type, {"data": data})
+        created: dict[str, Any] = response.get("data", {})
+        return created
+
+    # Certificates
+    def list_certificates(
+        self,
+        cert_type: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List signing certificates.
+
+        Args:
+            cert_type: Filter by type (development, distribution, etc.)
+            limit: Maximum number to return (all of them when None)
+        """
+        params: dict[str, Any] = {}
+        if cert_type:
+            params["filter[certificateType]"] = CERTIFICATE_TYPES.get(cert_type, cert_type)
+        return self._paginate("certificates", params, limit=limit)
+
+    def get_certificate(self, cert_id: str) -> dict[str, Any]:
+        """Get certificate details, including its content."""
+        return self._get_resource(f"certificates/{cert_id}") or {}
+
+    def create_certificate(
+        self,
+        csr_content: str,
+        cert_type: str = "development",
+    ) -> dict[str, Any]:
+        """Create a new certificate.
+
+        Args:
+            csr_content: Certificate Signing Request content
+            cert_type: Certificate type (development, distribution)
+        """
+        return self._create(
+            "certificates",
+            {
+                "csrContent": csr_content,
+                "certificateType": CERTIFICATE_TYPES.get(cert_type, cert_type),
+            },
+        )
+
+    def revoke_certificate(self, cert_id: str) -> None:
+        """Revoke a certificate."""
+        self._delete(f"certificates/{cert_id}")
+
+    # Provisioning Profiles
+    def list_profiles(
+        self,
+        profile_type: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """List provisioning profiles.
+
+        Args:
+            profile_type: Filter by type (development, appstore, adhoc)
+            limit: Maximum number to return (all of them when None)
+        """
+        params: dict[str, Any] = {"include": "bundleId"}
+        if profile_type:
+            params["filter[profileType]"] = PROFILE_TYPES.get(profile_type, profile_type)
+        return self._paginate("profiles", params, limit=limit)
+
+    def get_profile(self, profile_id: str) -> dict[str, Any]:
+        """Get provisioning profile details."""
+        return self._get_resource(f"profiles/{profile_id}", {"include": "bundleId"}) or {}
+
+    def download_profile(self, profile_id: str) -> bytes:
+        """Download provisioning profile content."""
+        profile = self._get_resource(
+            f"profiles/{profile_id}", {"fields[profiles]": "profileContent"}
+        )
+        content = (profile or {}).get("attributes", {}).get("profileContent")
+        if not content:
+            raise DeveloperPortalError(
+                f"Profile {profile_id} has no content", profile_id=profile_id
+            )
+        return base64.b64decode(content)
+
+    def create_profile(
+        self,
+        name: str,
+        bundle_id: str,
+        profile_type: str,
+        certificate_ids: list[str],
+        device_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Create a new provisioning profile.
+
+        Args:
+            name: Profile name
+            bundle_id: Bundle ID resource ID (see :meth:`find_bundle_id`)
+            profile_type: Profile type (development, appstore, adhoc)
+            certificate_ids: List of certificate IDs to include
+            device_ids: List of device IDs (required for development/adhoc)
+        """
+        relationships: dict[str, Any] = {
+            "bundleId": {"data": {"type": "bundleIds", "id": bundle_id}},
+            "certificates": {
+                "data": [{"type": "certificates", "id": cert_id} for cert_id in certificate_ids]
+            },
+        }
+        if device_ids:
+            relationships["devices"] = {
+                "data": [{"type": "devices", "id": device_id} for device_id in device_ids]
+            }
+
+        return self._create(
+            "profiles",
+            {"name": name, "profileType": PROFILE_TYPES.get(profile_type, profile_type)},
+            relationships,
+        )
+
+    def delete_profile(self, profile_id: str) -> None:
+        """Delete a provisioning profile."""
+        self._delete(f"profiles/{profile_id}")
+
+    # Devices
+    def list_devices(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List registered devices."""
+        return self._paginate("devices", limit=limit)
+
+    def register_device(
+        self,
+        name: str,
+        udid: str,
+        platform: str = "ios",
+    ) -> dict[str, Any]:
+        """Register a new device.
+
+        Args:
+            name: Device name
+            udid: Device UDID
+            platform: Platform (ios, mac)
+        """
+        return self._create(
+            "devices",
+            {
+                "name": name,
+                "udid": udid,
+                "platform": DEVICE_PLATFORMS.get(platform, platform),
+            },
+        )
+
+    # Bundle IDs (App IDs)
+    def list_app_ids(self) -> list[dict[str, Any]]:
+        """List registered App IDs."""
+        return self.list_bundle_ids(limit=None)
+
+    def get_app_id(self, app_id: str) -> dict[str, Any]:
+        """Get App ID details."""
+        return self.get_bundle_id(app_id)
+
+    def find_bundle_id(self, identifier: str) -> dict[str, Any] | None:
+        """Find a bundle ID resource by its identifier (e.g. ``com.example.app``)."""
+        data = self._get_resource("bundleIds", {"filter[identifier]": identifier})
+        # The filter matches prefixes, so check for the exact identifier
+        matches: list[dict[str, Any]] = [
+            bundle_id
+            for bundle_id in data or []
+            if bundle_id.get("attributes", {}).get("identifier") == identifier
+        ]
+        return matches[0] if matches else None
+
+    def __enter__(self) -> DeveloperPortalAPIClient:
+        return self
@@ -0,0 +1,237 @@
+"""Asynchronous Developer Portal API client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from slowlane.auth.session_auth import SessionAuth
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import DeveloperPortalError
+from slowlane.core.http import AsyncAppleHTTPClient
+from slowlane.devportal.client import CERTIFICATE_TYPES, PROFILE_TYPES
+
+
+class AsyncDeveloperPortalClient:
+    """Async twin of :class:`~slowlane.devportal.client.DeveloperPortalClient`.
+
+    Note: Developer Portal operations require session-based authentication.
+    JWT (API key) authentication is not supported for these endpoints.
+    """
+
+    BASE_URL = "https://developer.apple.com/services-account/v1"
+    PORTAL_URL = "https://developer.apple.com"
+
+    def __init__(
+        self,
+        session_auth: SessionAuth,
+        config: SlowlaneConfig | None = None,
+    ) -> None:
+        """Initialize client with session authentication.
+
+        Args:
+            session_auth: Session cookie authentication (required)
+            config: Configuration for HTTP client
+        """
+        self._session_auth = session_auth
+        self._config = config or SlowlaneConfig.load()
+
+        http_config = self._config.http if self._config else None
+        self._http = AsyncAppleHTTPClient(config=http_config)
+        self._http.set_cookies(session_auth.cookies)
+
+        # Team ID is needed for most operations; the lock keeps concurrent
+        # callers from all fetching the team list at once.
+        self._team_id: str | None = None
+        self._team_lock = asyncio.Lock()
+
+    async def _get_team_id(self) -> str:
+        """Get the team ID from the portal."""
+        if self._team_id:
+            return self._team_id
+
+        async with self._team_lock:
+            if self._team_id:
+                return self._team_id
+
+            teams = await self.list_teams()
+            if not teams:
+                raise DeveloperPortalError("No development teams found")
+
+            # Use first team (or could prompt user)
+            self._team_id = teams[0]["teamId"]
+            return self._team_id
+
+    async def _get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Make GET request to portal API."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        params = params or {}
+        params["teamId"] = await self._get_team_id()
+        return await self._http.get_json(url, params=params)
+
+    async def _post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Make POST request to portal API."""
+        url = f"{self.BASE_URL}/{endpoint}"
+        data["teamId"] = await self._get_team_id()
+        return await self._http.post_json(url, data)
+
+    # Teams
+    async def list_teams(self) -> list[dict[str, Any]]:
+        """List development teams the user belongs to."""
+        response = await self._http.get_json(f"{self.BASE_URL}/account/listTeams")
+        teams: list[dict[str, Any]] = response.get("teams", [])
+        return teams
+
+    # Certificates
+    async def list_certificates(
+        self,
+        cert_type: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List signing certificates."""
+        params: dict[str, Any] = {}
+        if cert_type:
+            params["filter[certificateType]"] = cert_type
+
+        response = await self._get("account/ios/certificate/listCertRequests.action", params)
+        certificates: list[dict[str, Any]] = response.get("certRequests", [])
+        return certificates
+
+    async def get_certificate(self, cert_id: str) -> dict[str, Any]:
+        """Get certificate details."""
+        return await self._get(
+            "account/ios/certificate/downloadCertificateContent.action",
+            params={"certificateId": cert_id},
+        )
+
+    async def create_certificate(
+        self,
+        csr_content: str,
+        cert_type: str = "development",
+    ) -> dict[str, Any]:
+        """Create a new certificate."""
+        data = {
+            "csrContent": csr_content,
+            "certificateType": CERTIFICATE_TYPES.get(cert_type, cert_type),
+        }
+
+        response = await self._post("account/ios/certificate/submitCertificateRequest.action", data)
+        certificate: dict[str, Any] = response.get("certRequest", {})
+        return certificate
+
+    async def revoke_certificate(self, cert_id: str) -> None:
+        """Revoke a certificate."""
+        await self._post(
+            "account/ios/certificate/revokeCertificate.action",
+            {"certificateId": cert_id},
+        )
+
+    # Provisioning Profiles
+    async def list_profiles(
+        self,
+        profile_type: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """List provisioning profiles."""
+        params: dict[str, Any] = {}
+        if profile_type:
+            params["filter[profileType]"] = profile_type
+
+        response = await self._get("account/ios/profile/listProvisioningProfiles.action", params)
+        profiles: list[dict[str, Any]] = response.get("provisioningProfiles", [])
+        return profiles
+
+    async def get_profile(self, profile_id: str) -> dict[str, Any]:
+        """Get provisioning profile details."""
+        response = await self._get(
+            "account/ios/profile/getProvisioningProfile.action",
+            params={"provisioningProfileId": profile_id},
+        )
+        profile: dict[str, Any] = response.get("provisioningProfile", {})
+        return profile
+
+    async def download_profile(self, profile_id: str) -> bytes:
+        """Download provisioning profile content."""
+        response = await self._http.get(
+            f"{self.BASE_URL}/account/ios/profile/downloadProfileContent",
+            params={"provisioningProfileId": profile_id, "teamId": await self._get_team_id()},
+        )
+        return response.content
+
+    async def create_profile(
+        self,
+        name: str,
+        bundle_id: str,
+        profile_type: str,
+        certificate_ids: list[str],
+        device_ids: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """Create a new provisioning profile."""
+        data: dict[str, Any] = {
+            "provisioningProfileName": name,
+            "appIdId": bundle_id,
+            "distributionType": PROFILE_TYPES.get(profile_type, profile_type),
+            "certificateIds": certificate_ids,
+        }
+
+        if device_ids:
+            data["deviceIds"] = device_ids
+
+        response = await self._post("account/ios/profile/createProvisioningProfile.action", data)
+        profile: dict[str, Any] = response.get("provisioningProfile", {})
+        return profile
+
+    async def delete_profile(self, profile_id: str) -> None:
+        """Delete a provisioning profile."""
+        await self._post(
+            "account/ios/profile/deleteProvisioningProfile.action",
+            {"provisioningProfileId": profile_id},
+        )
+
+    # Devices
+    async def list_devices(self) -> list[dict[str, Any]]:
+        """List registered devices."""
+        response = await self._get("account/ios/device/listDevices.action")
+        devices: list[dict[str, Any]] = response.get("devices", [])
+        return devices
+
+    async def register_device(
+        self,
+        name: str,
+        udid: str,
+        platform: str = "ios",
+    ) -> dict[str, Any]:
+        """Register a new device."""
+        data = {
+            "deviceName": name,
+            "deviceNumber": udid,
+            "devicePlatform": platform,
+        }
+
+        response = await self._post("account/ios/device/addDevice.action", data)
+        device: dict[str, Any] = response.get("device", {})
+        return device
+
+    # Bundle IDs (App IDs)
+    async def list_app_ids(self) -> list[dict[str, Any]]:
+        """List registered App IDs."""
+        response = await self._get("account/ios/identifiers/listAppIds.action")
+        app_ids: list[dict[str, Any]] = response.get("appIds", [])
+        return app_ids
+
+    async def get_app_id(self, app_id: str) -> dict[str, Any]:
+        """Get App ID details."""
+        response = await self._get(
+            "account/ios/identifiers/getAppIdDetail.action",
+            params={"appIdId": app_id},
+        )
+        details: dict[str, Any] = response.get("appId", {})
+        return details
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._http.close()
+
+    async def __aenter__(self) -> AsyncDeveloperPortalClient:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
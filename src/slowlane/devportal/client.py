@@ -9,6 +9,20 @@
 from slowlane.core.errors import DeveloperPortalError
 from slowlane.core.http import AppleHTTPClient
 
+# Map friendly names to Apple's internal types
+CERTIFICATE_TYPES = {
+    "development": "IOS_DEVELOPMENT",
+    "distribution": "IOS_DISTRIBUTION",
+    "mac_development": "MAC_APP_DEVELOPMENT",
+    "mac_distribution": "MAC_APP_DISTRIBUTION",
+}
+
+PROFILE_TYPES = {
+    "development": "IOS_APP_DEVELOPMENT",
+    "appstore": "IOS_APP_STORE",
+    "adhoc": "IOS_APP_ADHOC",
+}
+
 
 class DeveloperPortalClient:
     """Client for Apple Developer Portal operations.
@@ -111,17 +125,9 @@ def create_certificate(
             csr_content: Certificate Signing Request content
             cert_type: Certificate type (development, distribution)
         """
-        # Map friendly names to Apple's internal types
-        type_map = {
-            "development": "IOS_DEVELOPMENT",
-            "distribution": "IOS_DISTRIBUTION",
-            "mac_development": "MAC_APP_DEVELOPMENT",
-            "mac_distribution": "MAC_APP_DISTRIBUTION",
-        }
-
         data = {
             "csrContent": csr_content,
-            "certificateType": type_map.get(cert_type, cert_type),
+            "certificateType": CERTIFICATE_TYPES.get(cert_type, cert_type),
         }
 
         response = self._post("account/ios/certificate/submitCertificateRequest.action", data)
@@ -184,16 +190,10 @@ def create_profile(
             certificate_ids: List of certificate IDs to include
             device_ids: List of device IDs (required for development/adhoc)
         """
-        type_map = {
-            "development": "IOS_APP_DEVELOPMENT",
-            "appstore": "IOS_APP_STORE",
-            "adhoc": "IOS_APP_ADHOC",
-        }
-
         data = {
             "provisioningProfileName": name,
             "appIdId": bundle_id,
-            "distributionType": type_map.get(profile_type, profile_type),
+            "distributionType": PROFILE_TYPES.get(profile_type, profile_type),
             "certificateIds": certificate_ids,
         }
 
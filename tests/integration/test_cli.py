@@ -1,8 +1,13 @@
 """CLI integration tests."""
 
+import json
+from pathlib import Path
+
+import pytest
 from typer.testing import CliRunner
 
 from slowlane.cli.main import app
+from slowlane.core.quota import QuotaLedger
 
 runner = CliRunner()
 
@@ -128,6 +133,12 @@ def test_spaceauth_export_no_session(self) -> None:
         # Should indicate no session available
         assert "session" in result.stdout.lower() or result.exit_code != 0
 
+    def test_spaceauth_keepalive_help(self) -> None:
+        """Test spaceauth keepalive --help."""
+        result = runner.invoke(app, ["spaceauth", "keepalive", "--help"])
+        assert result.exit_code == 0
+        assert "--interval" in result.stdout
+
 
 class TestAscCommands:
     """Tests for asc command subcommands."""
@@ -144,6 +155,29 @@ def test_asc_builds_help(self) -> None:
         assert result.exit_code == 0
         assert "list" in result.stdout
 
+    def test_asc_builds_list_rejects_bad_fields(self) -> None:
+        """Test malformed --fields values are rejected before any request."""
+        result = runner.invoke(app, ["asc", "builds", "list", "--fields", "version"])
+        assert result.exit_code == 2
+
+    def test_asc_quota_offline_reads_ledger(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test asc quota --offline reports the shared ledger without a request."""
+        ledger_path = tmp_path / "quota.db"
+        monkeypatch.setenv("SLOWLANE_QUOTA_DB", str(ledger_path))
+        QuotaLedger("KEY123", path=ledger_path).update(
+            {"X-Rate-Limit": "user-hour-lim:3500;user-hour-rem:1200;"}
+        )
+
+        result = runner.invoke(app, ["--json", "asc", "quota", "--offline"])
+
+        assert result.exit_code == 0
+        [row] = json.loads(result.stdout)
+        assert row["key_id"] == "KEY123"
+        assert row["limit"] == 3500
+        assert 1200 <= row["remaining"] <= 1201
+
     def test_asc_testflight_help(self) -> None:
         """Test asc testflight --help."""
         result = runner.invoke(app, ["asc", "testflight", "--help"])
@@ -167,3 +201,9 @@ def test_signing_profiles_help(self) -> None:
         assert result.exit_code == 0
         assert "list" in result.stdout
 
+
+    def test_signing_devices_help(self) -> None:
+        """Test signing devices --help."""
+        result = runner.invoke(app, ["signing", "devices", "--help"])
+        assert result.exit_code == 0
+        assert "register" in result.stdout
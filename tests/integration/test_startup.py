@@ -0,0 +1,88 @@
+"""Startup regression tests: what each subcommand imports, and at what cost."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("httpx", "cryptography", "jwt", "keyring", "playwright")
+
+# A subcommand's --help may cost at most this many times the bare --help,
+# which imports only the CLI entry point (the heavy modules alone add more)
+STARTUP_BUDGET_FACTOR = 2.0
+
+# CLI plumbing rather than command groups
+SHARED_CLI_MODULES = {
+    "slowlane.cli.main",
+    "slowlane.cli.context",
+    "slowlane.cli.output",
+    "slowlane.cli.runner",
+}
+
+# Runs the CLI in a fresh interpreter under -X importtime and reports which
+# modules of interest were loaded
+PROBE = """
+import json, sys
+from slowlane.cli.main import app
+try:
+    app(sys.argv[1:], standalone_mode=False)
+except SystemExit:
+    pass
+print(json.dumps(sorted(m for m in sys.modules if m.split(".")[0] in {names!r}
+                        or m.startswith("slowlane.cli."))))
+"""
+
+
+def probe(*args: str) -> tuple[set[str], float]:
+    """Return (interesting modules imported, total import time in ms) for a CLI call."""
+    names = {*HEAVY_MODULES}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(names=names), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = set(json.loads(result.stdout.strip().splitlines()[-1]))
+    # importtime lines: "import time: self [us] | cumulative | name"
+    self_us = [
+        int(line.split("|")[0].split(":")[1])
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[0].split(":")[1].strip().isdigit()
+    ]
+    return modules, sum(self_us) / 1000
+
+
+def loaded_heavy(modules: set[str]) -> set[str]:
+    return {m.split(".")[0] for m in modules} & set(HEAVY_MODULES)
+
+
+@pytest.fixture(scope="module")
+def budget_ms() -> float:
+    """Import-time budget for one CLI call, relative to the bare ``--help``."""
+    _, baseline_ms = probe("--help")
+    return baseline_ms * STARTUP_BUDGET_FACTOR
+
+
+class TestStartup:
+    """Tests that subcommands only pay for their own imports."""
+
+    def test_version_imports_nothing_heavy(self, budget_ms: float) -> None:
+        """Test `slowlane version` loads no sub-app and no heavy dependency."""
+        modules, cost_ms = probe("version")
+        assert loaded_heavy(modules) == set(), f"import cost {cost_ms:.0f} ms"
+        assert modules <= {"slowlane.cli.main", "slowlane.cli.context"}
+        assert cost_ms <= budget_ms, f"import cost {cost_ms:.0f} ms > {budget_ms:.0f} ms"
+
+    @pytest.mark.parametrize(
+        "subcommand", ["spaceauth", "asc", "signing", "upload", "env", "daemon", "batch"]
+    )
+    def test_subcommand_imports_only_itself(self, subcommand: str, budget_ms: float) -> None:
+        """Test a subcommand loads its own module and none of the others, within budget."""
+        modules, cost_ms = probe(subcommand, "--help")
+        sub_apps = {m for m in modules if m.startswith("slowlane.cli.")} - SHARED_CLI_MODULES
+        assert sub_apps == {f"slowlane.cli.{subcommand}"}
+        assert loaded_heavy(modules) == set(), f"import cost {cost_ms:.0f} ms"
+        assert cost_ms <= budget_ms, f"import cost {cost_ms:.0f} ms > {budget_ms:.0f} ms"
@@ -0,0 +1,22 @@
+"""Manually advanced clock shared by the unit tests."""
+
+from __future__ import annotations
+
+# A plausible Unix time, for code that stores or compares wall-clock times
+WALL_CLOCK_START = 1_700_000_000.0
+
+
+class FakeClock:
+    """Clock that only moves when a test sets or advances ``now``.
+
+    With ``step`` each reading also advances the clock, so every call
+    returns a distinct, increasing time.
+    """
+
+    def __init__(self, start: float = 0.0, step: float = 0.0) -> None:
+        self.now = start
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
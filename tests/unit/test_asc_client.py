@@ -221,6 +221,19 @@ def test_list_builds_filtered_by_app(
         call_args = mock_http.get_json.call_args
         assert call_args is not None
 
+    def test_iter_builds_sorted(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test iter_builds passes the sort order."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.return_value = {"data": [], "links": {}}
+
+        list(client.iter_builds(app_id="app-123", sort="-uploadedDate"))
+
+        params = mock_http.get_json.call_args.kwargs["params"]
+        assert params["sort"] == "-uploadedDate"
+        assert params["filter[app]"] == "app-123"
+
     def test_get_build(
         self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
     ) -> None:
@@ -402,3 +415,134 @@ def test_pagination_respects_limit(
         result = client.list_apps(limit=5)
 
         assert len(result) == 5
+
+    def test_limit_none_fetches_every_page(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test limit=None walks every page at the maximum page size."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.side_effect = [
+            {"data": [{"id": "1"}], "links": {"next": "https://api.example.com/v1/apps?c=1"}},
+            {"data": [{"id": "2"}], "links": {"next": "https://api.example.com/v1/apps?c=2"}},
+            {"data": [{"id": "3"}], "links": {}},
+        ]
+
+        result = client.list_beta_testers(limit=None)
+
+        assert [r["id"] for r in result] == ["1", "2", "3"]
+        first_call = mock_http.get_json.call_args_list[0]
+        assert first_call.kwargs["params"]["limit"] == 200
+
+    def test_iter_resources_is_lazy(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test items stream before later pages are requested."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.side_effect = [
+            {"data": [{"id": "1"}, {"id": "2"}], "links": {"next": "https://api.example.com/n"}},
+            {"data": [{"id": "3"}], "links": {}},
+        ]
+
+        items = client.iter_resources("betaTesters")
+
+        assert next(items)["id"] == "1"
+        assert mock_http.get_json.call_count == 1
+        assert [item["id"] for item in items] == ["2", "3"]
+        assert mock_http.get_json.call_count == 2
+
+    def test_iter_pages_yields_documents(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test iter_pages yields whole response documents."""
+        client, mock_http = client_with_mock_http
+        page = {"data": [{"id": "1"}], "links": {}, "meta": {"paging": {"total": 1}}}
+        mock_http.get_json.return_value = page
+
+        pages = list(client.iter_pages("builds", params={"filter[app]": "a"}, page_size=10))
+
+        assert pages == [page]
+        params = mock_http.get_json.call_args.kwargs["params"]
+        assert params == {"filter[app]": "a", "limit": 10}
+
+    def test_prefetch_returns_all_pages(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test read-ahead pagination yields the same results in order."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.side_effect = [
+            {"data": [{"id": "1"}], "links": {"next": "https://api.example.com/v1/b?c=1"}},
+            {"data": [{"id": "2"}], "links": {"next": "https://api.example.com/v1/b?c=2"}},
+            {"data": [{"id": "3"}], "links": {}},
+        ]
+
+        result = list(client.iter_resources("builds", prefetch=2))
+
+        assert [r["id"] for r in result] == ["1", "2", "3"]
+        assert mock_http.get_json.call_count == 3
+
+
+class TestAppStoreConnectClientIncludes:
+    """Tests for sparse fieldsets and included resources."""
+
+    @pytest.fixture
+    def client_with_mock_http(self) -> tuple[AppStoreConnectClient, MagicMock]:
+        """Create client with mocked HTTP layer."""
+        with patch("slowlane.asc.client.AppleHTTPClient") as mock_http:
+            mock_instance = MagicMock()
+            mock_http.return_value = mock_instance
+
+            mock_jwt = MagicMock(spec=JWTAuth)
+            mock_jwt.get_token.return_value = "test_token"
+
+            client = AppStoreConnectClient(jwt_auth=mock_jwt)
+            return client, mock_instance
+
+    def test_list_builds_sends_query_and_resolves(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test list_builds passes fields/include and attaches included apps."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.return_value = {
+            "data": [
+                {
+                    "id": "b1",
+                    "type": "builds",
+                    "relationships": {"app": {"data": {"type": "apps", "id": "a1"}}},
+                }
+            ],
+            "included": [{"id": "a1", "type": "apps", "attributes": {"name": "Test App"}}],
+            "links": {},
+        }
+
+        result = client.list_builds(
+            app_id="a1",
+            fields={"builds": ["version"]},
+            include=["app"],
+            include_limits={"individualTesters": 3},
+        )
+
+        params = mock_http.get_json.call_args.kwargs["params"]
+        assert params["fields[builds]"] == "version"
+        assert params["include"] == "app"
+        assert params["limit[individualTesters]"] == 3
+        assert params["filter[app]"] == "a1"
+        app = result[0]["relationships"]["app"]["data"]
+        assert app["attributes"]["name"] == "Test App"
+
+    def test_get_app_with_include(
+        self, client_with_mock_http: tuple[AppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test get_app resolves included resources."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.return_value = {
+            "data": {
+                "id": "a1",
+                "relationships": {"builds": {"data": [{"type": "builds", "id": "b1"}]}},
+            },
+            "included": [{"id": "b1", "type": "builds", "attributes": {"version": "42"}}],
+        }
+
+        result = client.get_app("a1", include=["builds"])
+
+        assert mock_http.get_json.call_args.kwargs["params"] == {"include": "builds"}
+        assert result["relationships"]["builds"]["data"][0]["attributes"]["version"] == "42"
@@ -0,0 +1,198 @@
+"""Unit tests for the async HTTP transport and async API clients."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from slowlane.asc.async_client import AsyncAppStoreConnectClient
+from slowlane.auth.jwt_auth import JWTAuth
+from slowlane.auth.session_auth import SessionAuth
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import AuthExpiredError, RateLimitError
+from slowlane.core.http import AsyncAppleHTTPClient
+from slowlane.core.secrets import SessionData
+from slowlane.devportal.async_client import AsyncDeveloperPortalClient
+
+
+def make_async_http(handler: object, **config: object) -> AsyncAppleHTTPClient:
+    """Create an async HTTP client backed by a mock transport."""
+    http = AsyncAppleHTTPClient(config=HttpConfig(backoff_factor=0, **config))  # type: ignore[arg-type]
+    http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+    return http
+
+
+class TestAsyncAppleHTTPClient:
+    """Tests for AsyncAppleHTTPClient."""
+
+    async def test_get_json(self) -> None:
+        """Test successful JSON GET sends auth header."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"data": {"id": "1"}})
+
+        async with make_async_http(handler) as http:
+            http.set_jwt_token("token")
+            result = await http.get_json("https://api.example.com/v1/apps/1")
+
+        assert result == {"data": {"id": "1"}}
+        assert seen[0].headers["Authorization"] == "Bearer token"
+
+    async def test_retries_rate_limit(self) -> None:
+        """Test 429 responses are retried with Retry-After."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"ok": True}),
+        ]
+
+        with patch("slowlane.core.http.asyncio.sleep", new=AsyncMock()) as sleep:
+            async with make_async_http(lambda request: responses.pop(0)) as http:
+                result = await http.get_json("https://api.example.com/v1/apps")
+
+        assert result == {"ok": True}
+        sleep.assert_awaited_once()
+
+    async def test_rate_limit_exhausted(self) -> None:
+        """Test RateLimitError is raised once retries run out."""
+        with patch("slowlane.core.http.asyncio.sleep", new=AsyncMock()):
+            async with make_async_http(
+                lambda request: httpx.Response(429, headers={"Retry-After": "1"}),
+                max_retries=1,
+            ) as http:
+                with pytest.raises(RateLimitError):
+                    await http.get("https://api.example.com/v1/apps")
+
+    async def test_unauthorized_raises(self) -> None:
+        """Test 401 is classified as AuthExpiredError."""
+        async with make_async_http(lambda request: httpx.Response(401)) as http:
+            with pytest.raises(AuthExpiredError):
+                await http.get("https://api.example.com/v1/apps")
+
+
+class TestAsyncAppStoreConnectClient:
+    """Tests for AsyncAppStoreConnectClient."""
+
+    @pytest.fixture
+    def client_with_mock_http(self) -> tuple[AsyncAppStoreConnectClient, MagicMock]:
+        """Create client with mocked async HTTP layer."""
+        with patch("slowlane.asc.async_client.AsyncAppleHTTPClient") as mock_http:
+            mock_instance = MagicMock()
+            mock_instance.get_json = AsyncMock()
+            mock_instance.post_json = AsyncMock()
+            mock_instance.close = AsyncMock()
+            mock_http.return_value = mock_instance
+
+            mock_jwt = MagicMock(spec=JWTAuth)
+            mock_jwt.get_token.return_value = "test_token"
+
+            client = AsyncAppStoreConnectClient(jwt_auth=mock_jwt)
+            return client, mock_instance
+
+    async def test_gather_get_app(
+        self, client_with_mock_http: tuple[AsyncAppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test concurrent lookups can be gathered."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.side_effect = lambda url, params=None: {
+            "data": {"id": url.rsplit("/", 1)[-1]}
+        }
+
+        results = await asyncio.gather(*(client.get_app(str(i)) for i in range(5)))
+
+        assert [r["id"] for r in results] == ["0", "1", "2", "3", "4"]
+
+    async def test_pagination_follows_next_link(
+        self, client_with_mock_http: tuple[AsyncAppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test pagination follows next links."""
+        client, mock_http = client_with_mock_http
+        mock_http.get_json.side_effect = [
+            {"data": [{"id": "1"}], "links": {"next": "https://api.example.com/v1/apps?c=1"}},
+            {"data": [{"id": "2"}], "links": {}},
+        ]
+
+        result = await client.list_apps(limit=10)
+
+        assert [r["id"] for r in result] == ["1", "2"]
+
+    async def test_limit_none_streams_everything(
+        self, client_with_mock_http: tuple[AsyncAppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test limit=None collects every page and iter_resources streams items."""
+        client, mock_http = client_with_mock_http
+        pages = [
+            {"data": [{"id": "1"}], "links": {"next": "https://api.example.com/v1/b?c=1"}},
+            {"data": [{"id": "2"}], "links": {}},
+        ]
+        mock_http.get_json.side_effect = pages * 2
+
+        result = await client.list_builds(limit=None)
+        streamed = [item["id"] async for item in client.iter_resources("builds")]
+
+        assert [r["id"] for r in result] == ["1", "2"]
+        assert streamed == ["1", "2"]
+
+    async def test_invite_beta_tester(
+        self, client_with_mock_http: tuple[AsyncAppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test invite posts the shared payload."""
+        client, mock_http = client_with_mock_http
+        mock_http.post_json.return_value = {"data": {"id": "tester"}}
+
+        result = await client.invite_beta_tester("a@example.com", "group-1", first_name="A")
+
+        assert result["id"] == "tester"
+        payload = mock_http.post_json.call_args[0][1]
+        assert payload["data"]["attributes"] == {"email": "a@example.com", "firstName": "A"}
+
+    async def test_context_manager_closes(
+        self, client_with_mock_http: tuple[AsyncAppStoreConnectClient, MagicMock]
+    ) -> None:
+        """Test async context manager closes the transport."""
+        client, mock_http = client_with_mock_http
+
+        async with client:
+            pass
+
+        mock_http.close.assert_awaited_once()
+
+
+class TestAsyncDeveloperPortalClient:
+    """Tests for AsyncDeveloperPortalClient."""
+
+    async def test_team_id_fetched_once(self) -> None:
+        """Test concurrent calls share a single team lookup."""
+        session = SessionAuth(
+            SessionData(
+                cookies={"myacinfo": "x", "DES": "y"},
+                email_hash="abc",
+                created_at=datetime.now(UTC),
+            )
+        )
+
+        with patch("slowlane.devportal.async_client.AsyncAppleHTTPClient") as mock_http:
+            mock_instance = MagicMock()
+
+            async def get_json(url: str, params: dict | None = None) -> dict:
+                if url.endswith("listTeams"):
+                    await asyncio.sleep(0)
+                    return {"teams": [{"teamId": "TEAM1"}]}
+                return {"devices": [{"id": "d1"}]}
+
+            mock_instance.get_json = AsyncMock(side_effect=get_json)
+            mock_http.return_value = mock_instance
+
+            client = AsyncDeveloperPortalClient(session_auth=session)
+            results = await asyncio.gather(*(client.list_devices() for _ in range(3)))
+
+        assert all(r == [{"id": "d1"}] for r in results)
+        team_calls = [
+            c for c in mock_instance.get_json.call_args_list if c[0][0].endswith("listTeams")
+        ]
+        assert len(team_calls) == 1
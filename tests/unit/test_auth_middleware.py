@@ -0,0 +1,182 @@
+"""Tests for the 401-renewing auth middleware."""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from slowlane.auth.jwt_auth import JWTAuth, JWTCredentials
+from slowlane.auth.middleware import AsyncAuthMiddleware, AuthMiddleware
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import AuthExpiredError
+from slowlane.core.http import AppleHTTPClient, AsyncAppleHTTPClient
+from tests.unit.test_jwt_auth import TEST_PRIVATE_KEY
+
+BASE_URL = "https://api.appstoreconnect.apple.com/v1"
+
+
+class CountingJWTAuth(JWTAuth):
+    """JWTAuth that counts signatures."""
+
+    def __init__(self) -> None:
+        super().__init__(
+            JWTCredentials(key_id="KEY1", issuer_id="issuer", private_key=TEST_PRIVATE_KEY)
+        )
+        self.signed: list[str] = []
+
+    def _generate_token(self) -> str:
+        token = super()._generate_token()
+        self.signed.append(token)
+        return token
+
+
+class RevokingServer:
+    """Rejects every token in ``revoked`` with a 401."""
+
+    def __init__(self) -> None:
+        self.revoked: set[str] = set()
+        self.seen: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        with self._lock:
+            self.seen.append(token)
+        if token in self.revoked:
+            return httpx.Response(401, json={"errors": [{"status": "401"}]})
+        return httpx.Response(200, json={"data": {"id": request.url.path}})
+
+
+def make_middleware(server: RevokingServer, jwt_auth: JWTAuth | None) -> AuthMiddleware:
+    http = AppleHTTPClient(config=HttpConfig(max_retries=0))
+    http._client = httpx.Client(transport=httpx.MockTransport(server))
+    return AuthMiddleware(http, jwt_auth)
+
+
+class TestJWTAuthRenew:
+    """Tests for JWTAuth.renew."""
+
+    def test_renews_rejected_token(self) -> None:
+        """Test the rejected token is replaced by a freshly signed one."""
+        auth = CountingJWTAuth()
+        token = auth.get_token()
+        renewed = auth.renew(token)
+        assert renewed != token
+        assert auth.get_token() == renewed
+
+    def test_already_renewed_token_is_returned(self) -> None:
+        """Test a second renewal of the same stale token does not re-sign."""
+        auth = CountingJWTAuth()
+        token = auth.get_token()
+        renewed = auth.renew(token)
+        assert auth.renew(token) == renewed
+        assert len(auth.signed) == 2
+
+
+class TestAuthMiddleware:
+    """Tests for AuthMiddleware."""
+
+    def test_replays_request_with_renewed_token(self) -> None:
+        """Test a 401 renews the token and the replay succeeds."""
+        auth = CountingJWTAuth()
+        server = RevokingServer()
+        server.revoked.add(auth.get_token())
+        middleware = make_middleware(server, auth)
+
+        data = middleware.get_json(f"{BASE_URL}/apps/1")
+
+        assert data["data"]["id"] == "/v1/apps/1"
+        assert len(server.seen) == 2
+        assert server.seen[1] == auth.get_token()
+        assert middleware.renewals == 1
+
+    def test_concurrent_401s_sign_once(self) -> None:
+        """Test many requests rejected with the same token share one new signature."""
+        auth = CountingJWTAuth()
+        server = RevokingServer()
+        server.revoked.add(auth.get_token())
+        middleware = make_middleware(server, auth)
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(
+                pool.map(lambda i: middleware.get_json(f"{BASE_URL}/apps/{i}"), range(50))
+            )
+
+        assert len(results) == 50
+        assert len(auth.signed) == 2  # The original token and one renewal
+        # Every rejected request was counted, none lost to a racing update
+        assert middleware.renewals == sum(token in server.revoked for token in server.seen)
+
+    def test_replays_only_once(self) -> None:
+        """Test a renewed token that is also rejected surfaces the error."""
+        auth = CountingJWTAuth()
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(401)
+
+        http = AppleHTTPClient(config=HttpConfig(max_retries=0))
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))
+        middleware = AuthMiddleware(http, auth)
+
+        with pytest.raises(AuthExpiredError):
+            middleware.get(f"{BASE_URL}/apps/1")
+        assert len(sent) == 2
+
+    def test_forbidden_is_not_retried(self) -> None:
+        """Test a 403 is a permissions problem and is raised as-is."""
+        auth = CountingJWTAuth()
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(403, json={"errors": [{"detail": "Forbidden"}]})
+
+        http = AppleHTTPClient(config=HttpConfig(max_retries=0))
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))
+        middleware = AuthMiddleware(http, auth)
+
+        with pytest.raises(AuthExpiredError):
+            middleware.get(f"{BASE_URL}/apps/1")
+        assert len(sent) == 1
+        assert len(auth.signed) == 1
+
+    def test_session_auth_passes_through(self) -> None:
+        """Test 401s are not retried without a JWT to renew."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(401)
+
+        http = AppleHTTPClient(config=HttpConfig(max_retries=0))
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))
+        middleware = AuthMiddleware(http)
+
+        with pytest.raises(AuthExpiredError):
+            middleware.get(f"{BASE_URL}/apps/1")
+        assert len(sent) == 1
+
+
+class TestAsyncAuthMiddleware:
+    """Tests for AsyncAuthMiddleware."""
+
+    async def test_replays_request_with_renewed_token(self) -> None:
+        """Test a 401 renews the token and the replay succeeds."""
+        auth = CountingJWTAuth()
+        server = RevokingServer()
+        server.revoked.add(auth.get_token())
+        http = AsyncAppleHTTPClient(config=HttpConfig(max_retries=0))
+        http._client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+        middleware = AsyncAuthMiddleware(http, auth)
+
+        data = await middleware.get_json(f"{BASE_URL}/apps/1")
+
+        assert data["data"]["id"] == "/v1/apps/1"
+        assert len(server.seen) == 2
+        assert len(auth.signed) == 2
+        await http.close()
@@ -0,0 +1,140 @@
+"""Tests for batch mode."""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any
+
+import pytest
+
+from slowlane.cli import batch
+from slowlane.cli.batch import parse_record, run_batch
+from slowlane.cli.context import CLIContext
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import ExitCode
+
+
+@pytest.fixture
+def context() -> CLIContext:
+    config = SlowlaneConfig()
+    config.auth.key_id = "KEY123"
+    return CLIContext(config=config)
+
+
+def run(lines: list[str], context: CLIContext, jobs: int = 4) -> tuple[int, list[dict[str, Any]]]:
+    results: list[dict[str, Any]] = []
+    exit_code = run_batch([f"{line}\n" for line in lines], context, jobs, results.append)
+    return exit_code, results
+
+
+class TestParseRecord:
+    """Tests for parse_record."""
+
+    def test_argv_and_command(self) -> None:
+        """Test both record shapes parse to the same arguments."""
+        by_argv = parse_record(1, '{"id": "x", "argv": ["asc", "apps", "list"]}', [])
+        by_command = parse_record(2, '{"command": "asc apps list"}', [])
+        assert by_argv.argv == by_command.argv == ["asc", "apps", "list"]
+        assert (by_argv.id, by_command.id) == ("x", "2")
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("not json", "Invalid JSON"),
+            ("[1]", "JSON object"),
+            ('{"argv": "asc"}', "list of strings"),
+            ('{"command": "spaceauth login"}', "can run in a batch"),
+            ('{"command": "signing profiles delete P1"}', "need --force"),
+            ('{"command": "env print", "after": ["later"]}', "unknown"),
+            ('{"id": "a", "command": "env print"}', "Duplicate"),
+        ],
+    )
+    def test_invalid(self, text: str, message: str) -> None:
+        """Test malformed records are rejected with a reason."""
+        with pytest.raises(ValueError, match=message):
+            parse_record(1, text, ["a"])
+
+
+class TestRunBatch:
+    """Tests for run_batch."""
+
+    def test_results_and_exit_codes(self, context: CLIContext) -> None:
+        """Test each record reports its status, exit code and JSON output."""
+        exit_code, results = run(
+            [
+                '{"id": "ok", "command": "env print --platform generic"}',
+                "",
+                "garbage",
+                '{"id": "bad", "argv": ["env", "print", "--bogus"]}',
+            ],
+            context,
+        )
+        by_id = {result["id"]: result for result in results}
+
+        assert by_id["ok"]["status"] == "ok"
+        assert by_id["ok"]["output"] == {"ASC_KEY_ID": "KEY123"}
+        assert by_id["3"]["exit_code"] == ExitCode.INVALID_ARGUMENTS
+        assert by_id["bad"]["status"] == "failed"
+        assert by_id["bad"]["exit_code"] == 2
+        assert "No such option" in by_id["bad"]["stderr"]
+        # The first failure in input order decides the batch's exit code
+        assert exit_code == ExitCode.INVALID_ARGUMENTS
+        assert not hasattr(sys.stdout, "buffer_for_thread")
+
+    def test_after_waits_and_skips(self, context: CLIContext) -> None:
+        """Test dependent records run after, or are skipped when a dependency fails."""
+        exit_code, results = run(
+            [
+                '{"id": "first", "command": "env print"}',
+                '{"id": "second", "command": "env print", "after": ["first"]}',
+                '{"id": "broken", "command": "env print --bogus"}',
+                '{"id": "never", "command": "env print", "after": "broken"}',
+            ],
+            context,
+        )
+        order = [result["id"] for result in results]
+        by_id = {result["id"]: result for result in results}
+
+        assert order.index("first") < order.index("second")
+        assert by_id["second"]["status"] == "ok"
+        assert by_id["never"]["status"] == "skipped"
+        assert exit_code == 2
+
+    def test_shares_context(self, context: CLIContext, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test every command uses the batch's context for auth lookups."""
+        lookups: list[str | None] = []
+        monkeypatch.setattr(context, "session_auth", lambda email=None: lookups.append(email))
+
+        lines = [json.dumps({"command": "env print --include-session"})] * 5
+        exit_code, results = run(lines, context, jobs=3)
+
+        assert exit_code == 0
+        assert [result["status"] for result in results] == ["ok"] * 5
+        assert len(lookups) == 5
+
+    def test_record_that_raises(self, context: CLIContext, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a record whose execution raises is reported failed instead of hanging."""
+        run_command = batch.run_command
+
+        def crash(argv: list[str], *args: Any, **kwargs: Any) -> Any:
+            if "--include-session" in argv:
+                raise SystemExit("worker died")
+            return run_command(argv, *args, **kwargs)
+
+        monkeypatch.setattr(batch, "run_command", crash)
+        exit_code, results = run(
+            [
+                '{"id": "crash", "command": "env print --include-session"}',
+                '{"id": "after", "command": "env print", "after": "crash"}',
+                '{"id": "other", "command": "env print"}',
+            ],
+            context,
+        )
+        by_id = {result["id"]: result for result in results}
+
+        assert by_id["crash"]["status"] == "failed"
+        assert by_id["crash"]["stderr"] == "SystemExit: worker died"
+        assert by_id["after"]["status"] == "skipped"
+        assert by_id["other"]["status"] == "ok"
+        assert exit_code == ExitCode.GENERAL_ERROR
@@ -0,0 +1,117 @@
+"""Tests for the shared CLI context."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from slowlane.cli.context import CLIContext, get_context
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import AuthExpiredError
+from tests.unit.test_jwt_auth import TEST_PRIVATE_KEY
+
+
+@pytest.fixture
+def no_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("ASC_KEY_ID", "ASC_ISSUER_ID", "ASC_PRIVATE_KEY", "FASTLANE_SESSION"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("ASC_KEY_ID", "KEY123")
+    monkeypatch.setenv("ASC_ISSUER_ID", "issuer-uuid")
+    monkeypatch.setenv("ASC_PRIVATE_KEY", TEST_PRIVATE_KEY)
+
+
+class TestCLIContext:
+    """Tests for CLIContext."""
+
+    def test_config_loaded_once(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+        """Test the config file is read on first use only, with CLI overrides applied."""
+        loads: list[Path | None] = []
+        original = SlowlaneConfig.load
+
+        def counting_load(path: Path | None = None) -> SlowlaneConfig:
+            loads.append(path)
+            return original(path)
+
+        monkeypatch.setattr(SlowlaneConfig, "load", counting_load)
+        context = CLIContext(config_path=tmp_path / "config.toml", json_output=True)
+        assert loads == []
+
+        assert context.config is context.config
+        assert context.config.output.format == "json"
+        assert loads == [tmp_path / "config.toml"]
+
+    def test_clients_shared(self, api_key: None) -> None:
+        """Test auth and clients are built once and closed with the context."""
+        context = CLIContext(config=SlowlaneConfig())
+
+        assert context.jwt_auth is not None
+        assert context.jwt_auth is context.jwt_auth
+        client = context.asc_client
+        assert client is context.asc_client
+        assert context.signing_client is context.signing_client
+
+        context.close()
+        assert client._http._http._client.is_closed
+
+    def test_prefetch_pages_from_config(self, api_key: None) -> None:
+        """Test the ASC client reads ahead as many pages as configured."""
+        config = SlowlaneConfig()
+        config.http.prefetch_pages = 2
+        context = CLIContext(config=config)
+
+        assert context.asc_client._prefetch_pages == 2
+        context.close()
+
+    def test_no_auth(self, no_credentials: None) -> None:
+        """Test the ASC client needs an API key or a session."""
+        context = CLIContext(config=SlowlaneConfig())
+        with pytest.raises(AuthExpiredError, match="No authentication configured"):
+            _ = context.asc_client
+        assert context.signing_client is None
+
+    def test_session_auth_memoized_per_email(self, no_credentials: None) -> None:
+        """Test session lookups hit the secret store once per email."""
+        lookups: list[str] = []
+
+        class FakeStore:
+            def retrieve_session(self, email: str) -> None:
+                lookups.append(email)
+
+        context = CLIContext(config=SlowlaneConfig())
+        context.__dict__["secret_store"] = FakeStore()
+
+        assert context.session_auth("a@example.com") is None
+        assert context.session_auth("a@example.com") is None
+        assert context.session_auth("b@example.com") is None
+        assert lookups == ["a@example.com", "b@example.com"]
+
+
+class TestGetContext:
+    """Tests for get_context."""
+
+    def test_created_once_per_invocation(self) -> None:
+        """Test nested commands share the root context."""
+        seen: list[CLIContext] = []
+        app = typer.Typer()
+        sub = typer.Typer()
+        app.add_typer(sub, name="sub")
+
+        @app.callback()
+        def main(ctx: typer.Context) -> None:
+            seen.append(get_context(ctx))
+
+        @sub.command()
+        def run(ctx: typer.Context) -> None:
+            seen.append(get_context(ctx))
+
+        result = CliRunner().invoke(app, ["sub", "run"])
+        assert result.exit_code == 0
+        assert len(seen) == 2
+        assert seen[0] is seen[1]
@@ -0,0 +1,124 @@
+"""Tests for streaming list output."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+import typer
+
+from slowlane.cli.context import CLIContext
+from slowlane.cli.output import Column, RowWriter, attribute, parse_output_format, resource_id
+from slowlane.cli.runner import run_command
+from slowlane.core.config import SlowlaneConfig
+
+COLUMNS = [Column("ID", resource_id), Column("Name", attribute("name"))]
+
+APPS = [
+    {"type": "apps", "id": str(i), "attributes": {"name": f"App\t{i}", "bundleId": f"com.x.{i}"}}
+    for i in range(5)
+]
+
+
+class FlushCountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.flushes: list[int] = []
+
+    def flush(self) -> None:
+        self.flushes.append(self.getvalue().count("\n"))
+        super().flush()
+
+
+class TestRowWriter:
+    """Tests for RowWriter."""
+
+    def test_ndjson(self) -> None:
+        """Test each resource is written whole on its own line."""
+        stream = io.StringIO()
+        assert RowWriter(stream, "ndjson", COLUMNS).write_all(APPS) == 5
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == APPS
+
+    def test_tsv(self) -> None:
+        """Test TSV has a header and keeps tabs inside values from splitting cells."""
+        stream = io.StringIO()
+        RowWriter(stream, "tsv", COLUMNS).write_all(APPS[:2])
+        assert stream.getvalue() == "ID\tName\n0\tApp 0\n1\tApp 1\n"
+
+    def test_csv(self) -> None:
+        """Test CSV rows round-trip through the csv module."""
+        stream = io.StringIO()
+        RowWriter(stream, "csv", COLUMNS).write_all(APPS)
+        rows = list(csv.reader(io.StringIO(stream.getvalue())))
+        assert rows[0] == ["ID", "Name"]
+        assert rows[3] == ["2", "App\t2"]
+
+    def test_flushes_per_page(self) -> None:
+        """Test output is flushed after every page of rows and at the end."""
+        stream = FlushCountingStream()
+        RowWriter(stream, "ndjson", COLUMNS, flush_every=2).write_all(APPS)
+        assert stream.flushes == [2, 4, 5]
+
+    def test_parse_output_format(self) -> None:
+        """Test --output values are normalized and unknown ones rejected."""
+        assert parse_output_format("NDJSON") == "ndjson"
+        assert parse_output_format(None) is None
+        with pytest.raises(typer.BadParameter):
+            parse_output_format("xml")
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def iter_apps(self, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        self.calls.append(kwargs)
+        yield from APPS
+
+    def list_apps(self, limit: int | None = None, **kwargs: Any) -> list[dict[str, Any]]:
+        return APPS[:limit]
+
+
+class TestListCommands:
+    """Tests for --output on list commands."""
+
+    @pytest.fixture
+    def client(self) -> FakeClient:
+        return FakeClient()
+
+    @pytest.fixture
+    def context(self, client: FakeClient) -> CLIContext:
+        context = CLIContext(config=SlowlaneConfig())
+        context.asc_client = client  # type: ignore[assignment]
+        return context
+
+    def test_streams_tsv(self, context: CLIContext, client: FakeClient) -> None:
+        """Test rows are written as TSV up to the limit, without a table."""
+        result = run_command(["asc", "apps", "list", "--output", "tsv", "-l", "3"], context)
+        assert result.exit_code == 0
+        assert result.stdout.splitlines() == ["ID\tName\tBundle ID\tSKU"] + [
+            f"{i}\tApp {i}\tcom.x.{i}\t" for i in range(3)
+        ]
+        assert client.calls[0]["page_size"] == 3
+
+    def test_limit_zero_streams_everything(self, context: CLIContext) -> None:
+        """Test --limit 0 streams every resource."""
+        result = run_command(["asc", "apps", "list", "-o", "ndjson", "-l", "0"], context)
+        assert len(result.stdout.splitlines()) == len(APPS)
+
+    def test_color_without_spinner(self, context: CLIContext) -> None:
+        """Test colored capture renders styles but never draws the status spinner."""
+        result = run_command(["asc", "apps", "list", "-l", "3"], context, color=True)
+        assert result.exit_code == 0
+        assert "\x1b[" in result.stdout
+        assert "Fetching" not in result.stdout
+
+    def test_invalid_format(self, context: CLIContext) -> None:
+        """Test an unknown --output is a usage error."""
+        result = run_command(["asc", "apps", "list", "--output", "xml"], context)
+        assert result.exit_code == 2
+        assert "ndjson, tsv, csv" in result.stderr
@@ -0,0 +1,208 @@
+"""Tests for AIMD adaptive concurrency limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+
+import httpx
+import pytest
+
+from slowlane.core.concurrency import (
+    AdaptiveLimiter,
+    AsyncAdaptiveLimiter,
+    async_bulk_map,
+    bulk_map,
+)
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import ConfigError, NetworkError
+from slowlane.core.http import AppleHTTPClient
+from tests.unit.clock import FakeClock
+
+
+def complete(limiter: AdaptiveLimiter, latency: float, clock: FakeClock) -> None:
+    """Run one request of the given latency through the limiter."""
+    started = limiter.acquire()
+    clock.now += latency
+    limiter.release(started)
+
+
+class TestAdaptiveLimiter:
+    """Tests for the AIMD window."""
+
+    def test_additive_increase(self) -> None:
+        """Test a full window of successes grows the limit by about one."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial=4, max_limit=16, clock=clock)
+
+        for _ in range(5):
+            complete(limiter, 0.1, clock)
+
+        assert limiter.limit == 5
+
+    def test_multiplicative_decrease_once_per_burst(self) -> None:
+        """Test concurrent failures from one burst halve the window once."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial=8, max_limit=16, clock=clock)
+
+        started = [limiter.acquire() for _ in range(4)]
+        clock.now += 0.1
+        for s in started:
+            limiter.release(s, overloaded=True)
+
+        assert limiter.limit == 4
+
+    def test_latency_spike_shrinks_window(self) -> None:
+        """Test responses far slower than the baseline back the window off."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial=10, max_limit=16, clock=clock)
+        complete(limiter, 0.1, clock)
+        before = limiter.limit
+
+        complete(limiter, 1.0, clock)
+
+        assert limiter.limit < before
+
+    def test_bounds(self) -> None:
+        """Test the window never leaves [min_limit, max_limit]."""
+        clock = FakeClock()
+        limiter = AdaptiveLimiter(initial=2, min_limit=1, max_limit=3, clock=clock)
+        for _ in range(50):
+            complete(limiter, 0.1, clock)
+        assert limiter.limit == 3
+
+        for _ in range(10):
+            started = limiter.acquire()
+            clock.now += 1
+            limiter.release(started, overloaded=True)
+        assert limiter.limit == 1
+
+    def test_invalid_limits(self) -> None:
+        """Test inconsistent limits are rejected."""
+        with pytest.raises(ConfigError):
+            AdaptiveLimiter(initial=8, max_limit=4)
+
+    def test_acquire_blocks_at_limit(self) -> None:
+        """Test callers wait for a free slot once the window is full."""
+        limiter = AdaptiveLimiter(initial=1, max_limit=1)
+        started = limiter.acquire()
+        acquired = threading.Event()
+
+        def second() -> None:
+            limiter.release(limiter.acquire())
+            acquired.set()
+
+        worker = threading.Thread(target=second)
+        worker.start()
+        assert not acquired.wait(timeout=0.05)
+
+        limiter.release(started)
+        assert acquired.wait(timeout=2)
+        worker.join()
+
+    def test_slot_counts_exceptions_as_overload(self) -> None:
+        """Test exceptions inside a slot shrink the window."""
+        limiter = AdaptiveLimiter(initial=4, max_limit=8)
+        with pytest.raises(RuntimeError), limiter.slot():
+            raise RuntimeError
+
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
+
+
+class TestAsyncAdaptiveLimiter:
+    """Tests for AsyncAdaptiveLimiter."""
+
+    async def test_limits_tasks_in_flight(self) -> None:
+        """Test no more than the window's worth of tasks run at once."""
+        limiter = AsyncAdaptiveLimiter(initial=2, max_limit=2)
+        peak = 0
+
+        async def work() -> None:
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+
+
+class TestBulkMap:
+    """Tests for bulk_map helpers."""
+
+    def test_bulk_map_preserves_order(self) -> None:
+        """Test results come back in input order."""
+
+        def slow_square(i: int) -> int:
+            time.sleep(0.001 * (5 - i))
+            return i * i
+
+        assert list(bulk_map(slow_square, range(5), workers=4)) == [0, 1, 4, 9, 16]
+
+    def test_bulk_map_consumes_lazily(self) -> None:
+        """Test inputs are pulled only a bounded window ahead of the results."""
+        pulled = 0
+
+        def items() -> Iterator[int]:
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield i
+
+        results = bulk_map(lambda i: i, items(), workers=2, window=3)
+        assert next(results) == 0
+        assert pulled == 3
+        assert list(results) == list(range(1, 100))
+
+    async def test_async_bulk_map_bounds_workers(self) -> None:
+        """Test at most ``workers`` coroutines run at once."""
+        running = peak = 0
+
+        async def work(i: int) -> int:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return i
+
+        assert await async_bulk_map(work, range(6), workers=3) == list(range(6))
+        assert peak == 3
+
+
+class TestHTTPClientConcurrency:
+    """Tests for the adaptive limiter in AppleHTTPClient."""
+
+    def test_server_errors_shrink_window(self) -> None:
+        """Test 5xx responses are reported as overload."""
+        limiter = AdaptiveLimiter(initial=8, max_limit=16)
+        http = AppleHTTPClient(config=HttpConfig(max_retries=0), concurrency=limiter)
+        http._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(503))
+        )
+
+        with pytest.raises(NetworkError):
+            http.get("https://example.com")
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_transport_errors_release_slot(self) -> None:
+        """Test connection failures free their slot and shrink the window."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        limiter = AdaptiveLimiter(initial=8, max_limit=16)
+        http = AppleHTTPClient(config=HttpConfig(max_retries=0), concurrency=limiter)
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(NetworkError):
+            http.get("https://example.com")
+
+        assert limiter.in_flight == 0
+        assert limiter.limit == 4
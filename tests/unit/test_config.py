@@ -60,6 +60,26 @@ def test_load_and_save(self) -> None:
             assert loaded.auth.key_id == "TEST123"
             assert loaded.http.timeout == 60
 
+    def test_http_settings_round_trip(self) -> None:
+        """Test connection pool and caching settings survive save/load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "config.toml"
+
+            config = SlowlaneConfig()
+            config.http.http2 = True
+            config.http.max_connections = 8
+            config.http.keepalive_expiry = 30.0
+            config.http.memory_cache_ttls = {"apps": 600}
+            config.http.prefetch_pages = 2
+            config.save(path)
+
+            loaded = SlowlaneConfig.load(path)
+            assert loaded.http.http2 is True
+            assert loaded.http.max_connections == 8
+            assert loaded.http.keepalive_expiry == 30.0
+            assert loaded.http.memory_cache_ttls == {"apps": 600}
+            assert loaded.http.prefetch_pages == 2
+
     def test_to_dict(self) -> None:
         """Test converting to dictionary."""
         config = SlowlaneConfig()
@@ -0,0 +1,120 @@
+"""Tests for the local daemon and command forwarding."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from slowlane.cli.context import CLIContext
+from slowlane.cli.daemon import DaemonServer
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.daemon import (
+    environment_fingerprint,
+    forward_command,
+    forwarded_command,
+    send_request,
+)
+from slowlane.core.errors import SlowlaneError
+
+
+@pytest.fixture
+def daemon(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[DaemonServer]:
+    socket_path = tmp_path / "d.sock"
+    monkeypatch.setenv("SLOWLANE_DAEMON_SOCKET", str(socket_path))
+    monkeypatch.delenv("SLOWLANE_DAEMON", raising=False)
+
+    config = SlowlaneConfig()
+    config.auth.key_id = "KEY123"
+    server = DaemonServer(socket_path, idle_timeout=None, context=CLIContext(config=config))
+    server.bind()
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    send_request({"op": "stop"}, socket_path)
+    thread.join(timeout=5)
+    assert not socket_path.exists()
+
+
+class TestForwarding:
+    """Tests for the client side."""
+
+    @pytest.mark.parametrize(
+        ("argv", "command"),
+        [
+            (["asc", "apps", "list"], "asc"),
+            (["--json", "-v", "env", "print"], "env"),
+            (["spaceauth", "login"], None),
+            (["-c", "other.toml", "asc", "apps", "list"], None),
+            (["version"], None),
+            (["signing", "certs", "revoke", "C1"], None),
+            (["signing", "certs", "revoke", "C1", "--force"], "signing"),
+            (["signing", "profiles", "delete", "-f", "P1"], "signing"),
+            (["signing", "profiles", "delete", "P1"], None),
+        ],
+    )
+    def test_forwarded_command(self, argv: list[str], command: str | None) -> None:
+        """Test only non-interactive commands with the default config are forwarded."""
+        assert forwarded_command(argv) == command
+
+    def test_fingerprint(self) -> None:
+        """Test the fingerprint tracks credentials but not unrelated variables."""
+        base = {"ASC_KEY_ID": "KEY123", "PATH": "/bin"}
+        assert environment_fingerprint(base) == environment_fingerprint(
+            {**base, "PATH": "/usr/bin", "SLOWLANE_DAEMON_SOCKET": "/tmp/x"}
+        )
+        assert environment_fingerprint(base) != environment_fingerprint(
+            {**base, "ASC_KEY_ID": "OTHER"}
+        )
+
+    def test_no_daemon(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test commands run locally when no daemon is listening."""
+        monkeypatch.setenv("SLOWLANE_DAEMON_SOCKET", str(tmp_path / "missing.sock"))
+        assert forward_command(["asc", "apps", "list"]) is None
+
+
+class TestDaemonServer:
+    """Tests for running commands in the daemon."""
+
+    def test_runs_commands_warm(
+        self,
+        daemon: DaemonServer,
+        capsys: pytest.CaptureFixture[str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test forwarded commands run in the daemon and share its context."""
+        lookups: list[str | None] = []
+
+        def session_auth(email: str | None = None) -> None:
+            lookups.append(email)
+
+        monkeypatch.setattr(daemon.context, "session_auth", session_auth)
+
+        assert forward_command(["env", "print", "--include-session"]) == 0
+        assert forward_command(["--json", "env", "print", "--include-session"]) == 0
+
+        out = capsys.readouterr().out
+        assert "ASC_KEY_ID" in out
+        assert "KEY123" in out
+        assert send_request({"op": "ping"})["requests"] == 2
+        assert lookups == [None, None]
+
+    def test_exit_codes(self, daemon: DaemonServer, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test usage errors come back with click's exit code."""
+        assert forward_command(["env", "print", "--bogus"]) == 2
+        assert "No such option" in capsys.readouterr().err
+
+    def test_environment_mismatch(
+        self, daemon: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a caller with different credentials runs locally instead."""
+        monkeypatch.setenv("ASC_KEY_ID", "SOMEONE-ELSE")
+        assert forward_command(["env", "print"]) is None
+        assert send_request({"op": "ping"})["requests"] == 0
+
+    def test_already_running(self, daemon: DaemonServer) -> None:
+        """Test a second daemon refuses to take over a live socket."""
+        with pytest.raises(SlowlaneError, match="already running"):
+            DaemonServer(daemon.socket_path).bind()
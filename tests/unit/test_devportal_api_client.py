@@ -0,0 +1,138 @@
+"""Unit tests for the API key signing client."""
+
+from __future__ import annotations
+
+import base64
+import json
+
+import httpx
+import pytest
+
+from slowlane.auth.jwt_auth import JWTAuth, JWTCredentials
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import DeveloperPortalError
+from slowlane.devportal.api_client import DeveloperPortalAPIClient
+from tests.unit.test_jwt_auth import TEST_PRIVATE_KEY
+
+
+class FakeAPI:
+    """Records requests and answers from a path -> response-body map."""
+
+    def __init__(self, responses: dict[str, dict[str, object]]) -> None:
+        self.responses = responses
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, json=self.responses.get(request.url.path, {"data": []}))
+
+
+def make_client(api: FakeAPI) -> DeveloperPortalAPIClient:
+    jwt_auth = JWTAuth(
+        JWTCredentials(key_id="SIGNKEY", issuer_id="issuer", private_key=TEST_PRIVATE_KEY)
+    )
+    client = DeveloperPortalAPIClient(jwt_auth=jwt_auth, config=SlowlaneConfig())
+    client._http._http._client = httpx.Client(transport=httpx.MockTransport(api))
+    return client
+
+
+class TestDeveloperPortalAPIClient:
+    """Tests for DeveloperPortalAPIClient."""
+
+    def test_requests_are_signed_with_jwt(self) -> None:
+        """Test requests carry the API key token rather than session cookies."""
+        api = FakeAPI({})
+        with make_client(api) as client:
+            client.list_certificates()
+
+        assert api.requests[0].headers["Authorization"].startswith("Bearer ")
+        assert api.requests[0].url.path == "/v1/certificates"
+
+    def test_list_certificates_maps_type_filter(self) -> None:
+        """Test friendly certificate types map to API values."""
+        api = FakeAPI({"/v1/certificates": {"data": [{"id": "cert-1", "type": "certificates"}]}})
+        with make_client(api) as client:
+            certs = client.list_certificates("distribution")
+
+        assert [cert["id"] for cert in certs] == ["cert-1"]
+        assert api.requests[0].url.params["filter[certificateType]"] == "IOS_DISTRIBUTION"
+
+    def test_download_profile_decodes_content(self) -> None:
+        """Test profile content is base64-decoded."""
+        content = b"<plist>profile</plist>"
+        api = FakeAPI(
+            {
+                "/v1/profiles/prof-1": {
+                    "data": {
+                        "id": "prof-1",
+                        "type": "profiles",
+                        "attributes": {"profileContent": base64.b64encode(content).decode()},
+                    }
+                }
+            }
+        )
+        with make_client(api) as client:
+            assert client.download_profile("prof-1") == content
+
+    def test_download_profile_without_content(self) -> None:
+        """Test a profile without content raises DeveloperPortalError."""
+        api = FakeAPI({"/v1/profiles/prof-1": {"data": {"id": "prof-1", "attributes": {}}}})
+        with make_client(api) as client, pytest.raises(DeveloperPortalError):
+            client.download_profile("prof-1")
+
+    def test_register_device(self) -> None:
+        """Test device registration posts a JSON:API document."""
+        api = FakeAPI({"/v1/devices": {"data": {"id": "dev-1", "type": "devices"}}})
+        with make_client(api) as client:
+            device = client.register_device("CI iPhone", "00008030-0001", platform="ios")
+
+        assert device["id"] == "dev-1"
+        body = json.loads(api.requests[0].content)
+        assert body["data"]["type"] == "devices"
+        assert body["data"]["attributes"] == {
+            "name": "CI iPhone",
+            "udid": "00008030-0001",
+            "platform": "IOS",
+        }
+
+    def test_create_profile_relationships(self) -> None:
+        """Test profile creation links bundle ID, certificates and devices."""
+        api = FakeAPI({"/v1/profiles": {"data": {"id": "prof-2", "type": "profiles"}}})
+        with make_client(api) as client:
+            client.create_profile("CI Dev", "bid-1", "development", ["cert-1"], ["dev-1"])
+
+        body = json.loads(api.requests[0].content)
+        relationships = body["data"]["relationships"]
+        assert body["data"]["attributes"]["profileType"] == "IOS_APP_DEVELOPMENT"
+        assert relationships["bundleId"]["data"]["id"] == "bid-1"
+        assert relationships["certificates"]["data"] == [{"type": "certificates", "id": "cert-1"}]
+        assert relationships["devices"]["data"] == [{"type": "devices", "id": "dev-1"}]
+
+    def test_revoke_certificate_deletes(self) -> None:
+        """Test revoking a certificate sends DELETE."""
+        api = FakeAPI({})
+        with make_client(api) as client:
+            client.revoke_certificate("cert-1")
+
+        assert api.requests[0].method == "DELETE"
+        assert api.requests[0].url.path == "/v1/certificates/cert-1"
+
+    def test_find_bundle_id_exact_match(self) -> None:
+        """Test prefix matches from the identifier filter are discarded."""
+        api = FakeAPI(
+            {
+                "/v1/bundleIds": {
+                    "data": [
+                        {"id": "1", "attributes": {"identifier": "com.example.app.widget"}},
+                        {"id": "2", "attributes": {"identifier": "com.example.app"}},
+                    ]
+                }
+            }
+        )
+        with make_client(api) as client:
+            bundle_id = client.find_bundle_id("com.example.app")
+
+        assert bundle_id is not None
+        assert bundle_id["id"] == "2"
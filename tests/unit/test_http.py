@@ -0,0 +1,41 @@
+"""Tests for HTTP client connection settings."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import ConfigError
+from slowlane.core.http import AppleHTTPClient, AsyncAppleHTTPClient
+
+
+class TestConnectionPool:
+    """Tests for pool sizing and HTTP/2 options."""
+
+    def test_pool_limits_from_config(self) -> None:
+        """Test pool knobs are passed to the httpx client."""
+        config = HttpConfig(max_connections=4, max_keepalive_connections=2, keepalive_expiry=30)
+        options = AppleHTTPClient(config=config)._client_options()
+
+        limits = options["limits"]
+        assert limits.max_connections == 4
+        assert limits.max_keepalive_connections == 2
+        assert limits.keepalive_expiry == 30
+        assert options["http2"] is False
+
+    def test_http2_enabled(self) -> None:
+        """Test HTTP/2 mode builds sync and async clients when h2 is installed."""
+        pytest.importorskip("h2")
+        config = HttpConfig(http2=True)
+
+        assert AppleHTTPClient(config=config)._client_options()["http2"] is True
+        AsyncAppleHTTPClient(config=config)
+
+    def test_http2_without_h2_is_a_config_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a missing h2 package is reported with an install hint."""
+        monkeypatch.setitem(sys.modules, "h2", None)
+
+        with pytest.raises(ConfigError, match="httpx\\[http2\\]"):
+            AppleHTTPClient(config=HttpConfig(http2=True))
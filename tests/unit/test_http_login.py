@@ -0,0 +1,283 @@
+"""Tests for the browser-free Apple ID login against a fake idmsa."""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import secrets
+
+import httpx
+import pytest
+
+from slowlane.auth.http_login import (
+    SRP_G,
+    SRP_N,
+    HttpLoginFlow,
+    derive_password_key,
+    http_login,
+    totp_code,
+)
+from slowlane.core.errors import SessionError
+
+EMAIL = "dev@example.com"
+PASSWORD = "correct horse"
+CODE = "123456"
+
+
+def h(*parts: bytes) -> bytes:
+    return hashlib.sha256(b"".join(parts)).digest()
+
+
+def to_bytes(value: int) -> bytes:
+    return value.to_bytes((value.bit_length() + 7) // 8, "big")
+
+
+def pad(value: int) -> bytes:
+    return value.to_bytes(256, "big")
+
+
+class FakeIdmsa:
+    """Server side of the idmsa SRP exchange and 2FA endpoints."""
+
+    def __init__(
+        self,
+        protocol: str = "s2k",
+        two_factor: bool = True,
+        trusted_devices: bool = True,
+    ) -> None:
+        self.protocol = protocol
+        self.two_factor = two_factor
+        self.trusted_devices = trusted_devices
+        self.salt = secrets.token_bytes(16).lstrip(b"\0") or b"salt"
+        self.iterations = 1000
+        key = derive_password_key(PASSWORD, self.salt, self.iterations, protocol)
+        x = int.from_bytes(h(self.salt, h(b":", key)), "big")
+        self.verifier = pow(SRP_G, x, SRP_N)
+        self.k = int.from_bytes(h(to_bytes(SRP_N), pad(SRP_G)), "big")
+        self.b = secrets.randbits(256)
+        self.client_public = 0
+        self.paths: list[str] = []
+        self.verified = False
+
+    def server_public(self) -> int:
+        return (self.k * self.verifier + pow(SRP_G, self.b, SRP_N)) % SRP_N
+
+    def expected_m1(self) -> bytes:
+        server_public = self.server_public()
+        u = int.from_bytes(h(pad(self.client_public), pad(server_public)), "big")
+        shared = pow(self.client_public * pow(self.verifier, u, SRP_N), self.b, SRP_N)
+        n_xor_g = bytes(a ^ b for a, b in zip(h(to_bytes(SRP_N)), h(pad(SRP_G)), strict=True))
+        return h(
+            n_xor_g,
+            h(EMAIL.encode()),
+            self.salt,
+            to_bytes(self.client_public),
+            to_bytes(server_public),
+            h(to_bytes(shared)),
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.paths.append(f"{request.method} {path}")
+        session = {"X-Apple-ID-Session-Id": "session-1", "scnt": "scnt-1"}
+
+        if path == "/olympus/v1/app/config":
+            return httpx.Response(200, json={"authServiceKey": "widget-key"})
+        if path == "/olympus/v1/session":
+            return httpx.Response(200, json={}, headers={"Set-Cookie": "itctx=ctx; Path=/"})
+
+        assert request.headers["X-Apple-Widget-Key"] == "widget-key"
+        body = json.loads(request.content) if request.content else {}
+
+        if path.endswith("/signin/init"):
+            self.client_public = int.from_bytes(base64.b64decode(body["a"]), "big")
+            return httpx.Response(
+                200,
+                headers=session,
+                json={
+                    "iteration": self.iterations,
+                    "salt": base64.b64encode(self.salt).decode(),
+                    "protocol": self.protocol,
+                    "b": base64.b64encode(to_bytes(self.server_public())).decode(),
+                    "c": "challenge",
+                },
+            )
+
+        # Every later request must echo the session headers
+        assert request.headers["scnt"] == "scnt-1"
+
+        if path.endswith("/signin/complete"):
+            assert body["rememberMe"] is True
+            assert request.url.params["isRememberMeEnabled"] == "true"
+            if base64.b64decode(body["m1"]) != self.expected_m1():
+                return httpx.Response(401, json={"serviceErrors": [{"code": "-20101"}]})
+            if self.two_factor:
+                return httpx.Response(409, json={"authType": "hsa2"})
+            return httpx.Response(200, headers={"Set-Cookie": "myacinfo=signed-in; Path=/"})
+        if path == "/appleauth/auth" and request.method == "GET":
+            return httpx.Response(
+                200,
+                json={
+                    "noTrustedDevices": not self.trusted_devices,
+                    "trustedPhoneNumbers": [{"id": 1, "numberWithDialCode": "+1 (•••) •••-••12"}],
+                },
+            )
+        if path.endswith("/securitycode"):
+            self.verified = body["securityCode"]["code"] == CODE
+            return httpx.Response(204 if self.verified else 400)
+        if path.endswith("/verify/phone"):
+            return httpx.Response(200, json={})
+        if path.endswith("/2sv/trust"):
+            assert self.verified
+            return httpx.Response(204, headers={"Set-Cookie": "myacinfo=trusted; Path=/"})
+        return httpx.Response(404)
+
+
+class TestHttpLogin:
+    """Tests for http_login."""
+
+    def test_login_with_trusted_device_code(self) -> None:
+        """Test SRP sign-in plus a trusted-device code yields session cookies."""
+        server = FakeIdmsa()
+        prompts: list[str] = []
+
+        def code_provider(prompt: str) -> str:
+            prompts.append(prompt)
+            return CODE
+
+        session = http_login(EMAIL, PASSWORD, code_provider, transport=httpx.MockTransport(server))
+
+        assert session.cookies == {"myacinfo": "trusted", "itctx": "ctx"}
+        assert session.target_service == "appstoreconnect"
+        assert prompts == ["Code shown on your trusted device"]
+        assert "POST /appleauth/auth/verify/trusteddevice/securitycode" in server.paths
+
+    def test_s2k_fo_protocol(self) -> None:
+        """Test the s2k_fo password derivation also signs in."""
+        server = FakeIdmsa(protocol="s2k_fo", two_factor=False)
+        session = http_login(EMAIL, PASSWORD, lambda _: CODE, transport=httpx.MockTransport(server))
+        assert session.cookies["myacinfo"] == "signed-in"
+
+    def test_sms_code_when_no_trusted_devices(self) -> None:
+        """Test the code is requested by SMS when no device is trusted."""
+        server = FakeIdmsa(trusted_devices=False)
+        session = http_login(EMAIL, PASSWORD, lambda _: CODE, transport=httpx.MockTransport(server))
+
+        assert session.cookies["myacinfo"] == "trusted"
+        assert "PUT /appleauth/auth/verify/phone" in server.paths
+        assert "POST /appleauth/auth/verify/phone/securitycode" in server.paths
+
+    def test_wrong_password(self) -> None:
+        """Test a bad password fails before any 2FA prompt."""
+        server = FakeIdmsa()
+        flow = HttpLoginFlow(
+            EMAIL, "wrong", lambda _: pytest.fail("prompted"), transport=httpx.MockTransport(server)
+        )
+        with pytest.raises(SessionError, match="Invalid Apple ID or password"):
+            flow.run()
+
+    def test_wrong_code(self) -> None:
+        """Test a rejected 2FA code raises SessionError."""
+        server = FakeIdmsa()
+        with pytest.raises(SessionError, match="rejected"):
+            http_login(EMAIL, PASSWORD, lambda _: "000000", transport=httpx.MockTransport(server))
+
+    def test_non_json_challenge(self) -> None:
+        """Test an HTML page instead of the SRP challenge raises SessionError."""
+        server = FakeIdmsa()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/signin/init"):
+                return httpx.Response(200, html="<html>Maintenance</html>")
+            return server(request)
+
+        with pytest.raises(SessionError, match="unexpected response"):
+            http_login(EMAIL, PASSWORD, lambda _: CODE, transport=httpx.MockTransport(handler))
+
+    def test_non_json_config(self) -> None:
+        """Test an HTML page instead of the auth config raises SessionError."""
+        server = FakeIdmsa()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/olympus/v1/app/config":
+                return httpx.Response(200, html="<html>Maintenance</html>")
+            return server(request)
+
+        with pytest.raises(SessionError, match="auth config returned an unexpected response"):
+            http_login(EMAIL, PASSWORD, lambda _: CODE, transport=httpx.MockTransport(handler))
+
+    def test_incomplete_challenge(self) -> None:
+        """Test a challenge missing SRP fields raises SessionError."""
+        server = FakeIdmsa()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/signin/init"):
+                return httpx.Response(200, json={"iteration": 1000, "protocol": "s2k"})
+            return server(request)
+
+        with pytest.raises(SessionError, match="incomplete SRP challenge"):
+            http_login(EMAIL, PASSWORD, lambda _: CODE, transport=httpx.MockTransport(handler))
+
+    def test_two_factor_options_error(self) -> None:
+        """Test a failed 2FA options request raises before prompting."""
+        server = FakeIdmsa()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/appleauth/auth" and request.method == "GET":
+                return httpx.Response(503, text="Service Unavailable")
+            return server(request)
+
+        with pytest.raises(SessionError, match="two-factor options failed"):
+            http_login(
+                EMAIL,
+                PASSWORD,
+                lambda _: pytest.fail("prompted"),
+                transport=httpx.MockTransport(handler),
+            )
+
+    def test_trusted_phone_without_id(self) -> None:
+        """Test a trusted phone number without an id raises before prompting."""
+        server = FakeIdmsa(trusted_devices=False)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/appleauth/auth" and request.method == "GET":
+                return httpx.Response(
+                    200, json={"noTrustedDevices": True, "trustedPhoneNumbers": [{}]}
+                )
+            return server(request)
+
+        with pytest.raises(SessionError, match="without an id"):
+            http_login(
+                EMAIL,
+                PASSWORD,
+                lambda _: pytest.fail("prompted"),
+                transport=httpx.MockTransport(handler),
+            )
+
+    def test_sms_send_error(self) -> None:
+        """Test a failed SMS send raises before prompting."""
+        server = FakeIdmsa(trusted_devices=False)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/verify/phone"):
+                return httpx.Response(423, json={})
+            return server(request)
+
+        with pytest.raises(SessionError, match=r"Could not send the two-factor code \(HTTP 423\)"):
+            http_login(
+                EMAIL,
+                PASSWORD,
+                lambda _: pytest.fail("prompted"),
+                transport=httpx.MockTransport(handler),
+            )
+
+
+class TestTotpCode:
+    """Tests for totp_code."""
+
+    def test_rfc6238_vector(self) -> None:
+        """Test against the RFC 6238 SHA-1 test vector."""
+        secret = base64.b32encode(b"12345678901234567890").decode()
+        assert totp_code(secret, at=59, digits=8) == "94287082"
+        assert totp_code(secret, at=59) == "287082"
@@ -0,0 +1,155 @@
+"""Tests for the on-disk conditional-request cache."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import httpx
+import pytest
+
+from slowlane.core.config import HttpConfig
+from slowlane.core.http import AppleHTTPClient, AsyncAppleHTTPClient
+from slowlane.core.httpcache import CacheEntry, HttpCache
+
+URL = "https://api.appstoreconnect.apple.com/v1/apps"
+
+
+class FakeServer:
+    """Server that answers conditional requests for one representation."""
+
+    def __init__(self, etag: str = '"v1"', body: bytes = b'{"data": []}') -> None:
+        self.etag = etag
+        self.body = body
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(
+            200,
+            headers={"ETag": self.etag, "Content-Type": "application/json"},
+            content=self.body,
+        )
+
+
+def make_http(server: FakeServer, cache_dir: Path, **config: object) -> AppleHTTPClient:
+    """Create a cached HTTP client backed by a mock transport."""
+    http = AppleHTTPClient(
+        config=HttpConfig(backoff_factor=0, **config),  # type: ignore[arg-type]
+        jwt_token="token",
+        cache=HttpCache(cache_dir),
+    )
+    http._client = httpx.Client(transport=httpx.MockTransport(server))
+    return http
+
+
+class TestHttpCache:
+    """Tests for cached GETs in AppleHTTPClient."""
+
+    def test_revalidates_and_serves_304_from_disk(self, tmp_path: Path) -> None:
+        """Test the second GET sends If-None-Match and replays the cached body."""
+        server = FakeServer()
+        http = make_http(server, tmp_path)
+
+        first = http.get_json(URL, params={"limit": 10})
+        second = http.get_json(URL, params={"limit": 10})
+
+        assert first == second == {"data": []}
+        assert "If-None-Match" not in server.requests[0].headers
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
+
+    def test_changed_resource_replaces_entry(self, tmp_path: Path) -> None:
+        """Test a new representation is returned and stored."""
+        server = FakeServer()
+        http = make_http(server, tmp_path)
+        http.get(URL)
+
+        server.etag, server.body = '"v2"', b'{"data": [1]}'
+        assert http.get_json(URL) == {"data": [1]}
+        assert http.get_json(URL) == {"data": [1]}
+        assert server.requests[-1].headers["If-None-Match"] == '"v2"'
+
+    def test_max_stale_skips_request(self, tmp_path: Path) -> None:
+        """Test entries younger than max_stale are served without a request."""
+        server = FakeServer()
+        http = make_http(server, tmp_path, cache_max_stale=300)
+
+        http.get(URL)
+        response = http.get(URL)
+
+        assert len(server.requests) == 1
+        assert response.headers["X-Slowlane-Cache"] == "hit"
+        assert http.get(URL, max_stale=0).status_code == 200
+        assert len(server.requests) == 2
+
+    def test_keyed_by_query_and_identity(self, tmp_path: Path) -> None:
+        """Test different parameters or credentials never share entries."""
+        server = FakeServer()
+        http = make_http(server, tmp_path, cache_max_stale=300)
+
+        http.get(URL, params={"limit": 1})
+        http.get(URL, params={"limit": 2})
+        http.set_jwt_token("other-token")
+        http.get(URL, params={"limit": 1})
+
+        assert len(server.requests) == 3
+
+    def test_responses_without_validators_are_not_stored(self, tmp_path: Path) -> None:
+        """Test only revalidatable responses are written to disk."""
+        http = make_http(FakeServer(), tmp_path)
+        http._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        )
+
+        http.get(URL)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """Test unreadable cache files are discarded instead of failing the request."""
+        server = FakeServer()
+        http = make_http(server, tmp_path)
+        http.get(URL)
+        [path] = tmp_path.glob("*.json")
+        path.write_text("{not json")
+
+        assert http.get_json(URL) == {"data": []}
+        assert "If-None-Match" not in server.requests[1].headers
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_entries_are_private(self, tmp_path: Path) -> None:
+        """Test cached bodies are readable by the owner only."""
+        make_http(FakeServer(), tmp_path).get(URL)
+        [path] = tmp_path.glob("*.json")
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_entries_are_created_private(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test entries are private from creation, even over a readable stale temp file."""
+        cache = HttpCache(tmp_path)
+        key = cache.key(URL, "identity")
+        stale = tmp_path / f"{key}.{os.getpid()}.tmp"
+        stale.write_text("stale")
+        stale.chmod(0o644)
+
+        def no_chmod(*args: object) -> None:
+            raise PermissionError("chmod not permitted")
+
+        monkeypatch.setattr(os, "chmod", no_chmod)
+        cache.store(key, CacheEntry(URL, 200, b"{}", stored_at=0.0, etag='"v1"'))
+
+        assert (tmp_path / f"{key}.json").stat().st_mode & 0o777 == 0o600
+
+    async def test_async_client_uses_cache(self, tmp_path: Path) -> None:
+        """Test the async transport revalidates through the same cache."""
+        server = FakeServer()
+        http = AsyncAppleHTTPClient(config=HttpConfig(), cache=HttpCache(tmp_path))
+        http._client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+
+        await http.get(URL)
+        assert await http.get_json(URL) == {"data": []}
+        assert server.requests[1].headers["If-None-Match"] == '"v1"'
@@ -0,0 +1,108 @@
+"""Tests for JSON:API query building and included-resource resolution."""
+
+from __future__ import annotations
+
+import json
+
+from slowlane.asc.jsonapi import IncludedResolver, query_params, resolve_document
+
+
+class TestQueryParams:
+    """Tests for query_params."""
+
+    def test_empty(self) -> None:
+        """Test no options produce no parameters."""
+        assert query_params() == {}
+
+    def test_all_options(self) -> None:
+        """Test fields, include and relationship limits use bracket notation."""
+        params = query_params(
+            fields={"builds": ["version", "uploadedDate"], "apps": ["name"]},
+            include=["app", "betaGroups"],
+            include_limits={"betaGroups": 5},
+        )
+
+        assert params == {
+            "fields[builds]": "version,uploadedDate",
+            "fields[apps]": "name",
+            "include": "app,betaGroups",
+            "limit[betaGroups]": 5,
+        }
+
+
+class TestIncludedResolver:
+    """Tests for attaching included resources."""
+
+    def test_resolves_to_one_and_to_many(self) -> None:
+        """Test linkage objects are replaced by included resources."""
+        document = {
+            "data": [
+                {
+                    "type": "builds",
+                    "id": "b1",
+                    "relationships": {
+                        "app": {"data": {"type": "apps", "id": "a1"}},
+                        "betaGroups": {
+                            "data": [
+                                {"type": "betaGroups", "id": "g1"},
+                                {"type": "betaGroups", "id": "missing"},
+                            ]
+                        },
+                        "preReleaseVersion": {"links": {"related": "https://example.com"}},
+                    },
+                }
+            ],
+            "included": [
+                {"type": "apps", "id": "a1", "attributes": {"name": "App"}},
+                {"type": "betaGroups", "id": "g1", "attributes": {"name": "QA"}},
+            ],
+        }
+
+        [build] = resolve_document(document)
+        relationships = build["relationships"]
+
+        assert relationships["app"]["data"]["attributes"]["name"] == "App"
+        assert relationships["betaGroups"]["data"][0]["attributes"]["name"] == "QA"
+        assert relationships["betaGroups"]["data"][1] == {"type": "betaGroups", "id": "missing"}
+        assert "links" in relationships["preReleaseVersion"]
+        # Input is not mutated
+        original = document["data"][0]["relationships"]["app"]["data"]  # type: ignore[index]
+        assert original == {"type": "apps", "id": "a1"}
+
+    def test_cycles_are_bounded(self) -> None:
+        """Test cyclic relationships terminate and stay serializable."""
+        app = {
+            "type": "apps",
+            "id": "a1",
+            "relationships": {"builds": {"data": [{"type": "builds", "id": "b1"}]}},
+        }
+        build = {
+            "type": "builds",
+            "id": "b1",
+            "relationships": {"app": {"data": {"type": "apps", "id": "a1"}}},
+        }
+
+        resolved = IncludedResolver([app, build]).resolve(build)
+
+        json.dumps(resolved)
+        assert resolved["relationships"]["app"]["data"]["id"] == "a1"
+
+    def test_single_resource_document(self) -> None:
+        """Test documents with a single primary resource."""
+        document = {
+            "data": {
+                "type": "apps",
+                "id": "a1",
+                "relationships": {"builds": {"data": [{"type": "builds", "id": "b1"}]}},
+            },
+            "included": [{"type": "builds", "id": "b1", "attributes": {"version": "7"}}],
+        }
+
+        app = resolve_document(document)
+
+        assert app["relationships"]["builds"]["data"][0]["attributes"]["version"] == "7"
+
+    def test_without_included_returns_data(self) -> None:
+        """Test documents without included resources are returned untouched."""
+        data = [{"type": "apps", "id": "a1"}]
+        assert resolve_document({"data": data}) is data
@@ -1,11 +1,15 @@
 """Tests for JWT authentication."""
 
+import threading
 import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from slowlane.auth.jwt_auth import JWTAuth, JWTCredentials, get_jwt_auth
+from slowlane.auth.jwt_auth import JWTAuth, JWTCredentials, get_jwt_auth, load_signing_key
+from slowlane.auth.token_cache import CachedToken, JWTTokenCache, key_fingerprint
+from slowlane.core.errors import JWTError
 
 
 # Sample test key (DO NOT USE IN PRODUCTION - this is for testing only)
@@ -105,6 +109,140 @@ def test_token_invalidation(self) -> None:
         assert token2 is not None
 
 
+class TestJWTCaching:
+    """Tests for the parsed-key and on-disk token caches."""
+
+    def make_creds(self) -> JWTCredentials:
+        return JWTCredentials(
+            key_id="TEST123",
+            issuer_id="issuer-456",
+            private_key=TEST_PRIVATE_KEY,
+        )
+
+    def test_signing_key_parsed_once(self) -> None:
+        """Test the PEM key is parsed once per process."""
+        load_signing_key.cache_clear()
+        JWTAuth(self.make_creds()).get_token()
+        JWTAuth(self.make_creds()).get_token()
+
+        assert load_signing_key.cache_info().misses == 1
+
+    def test_invalid_key_raises_jwt_error(self) -> None:
+        """Test a malformed key is reported as a JWTError."""
+        with pytest.raises(JWTError):
+            load_signing_key("not a key")
+
+    def test_token_reused_across_instances(self, tmp_path: Path) -> None:
+        """Test a second process-like instance adopts the cached token."""
+        first = JWTAuth(self.make_creds(), token_cache=JWTTokenCache(tmp_path))
+        token = first.get_token()
+
+        with patch.object(JWTAuth, "_generate_token", side_effect=AssertionError):
+            second = JWTAuth(self.make_creds(), token_cache=JWTTokenCache(tmp_path))
+            assert second.get_token() == token
+
+    def test_cached_token_near_expiry_is_replaced(self, tmp_path: Path) -> None:
+        """Test tokens inside REFRESH_THRESHOLD are not reused."""
+        cache = JWTTokenCache(tmp_path)
+        creds = self.make_creds()
+        cache.store(
+            creds.key_id,
+            creds.issuer_id,
+            key_fingerprint(creds.private_key),
+            CachedToken(token="stale", expires_at=time.time() + 60),
+        )
+
+        assert JWTAuth(creds, token_cache=cache).get_token() != "stale"
+
+    def test_rotated_key_ignores_cached_token(self, tmp_path: Path) -> None:
+        """Test cached tokens are bound to the private key that signed them."""
+        cache = JWTTokenCache(tmp_path)
+        creds = self.make_creds()
+        cache.store(
+            creds.key_id,
+            creds.issuer_id,
+            key_fingerprint("old key"),
+            CachedToken(token="old", expires_at=time.time() + 3600),
+        )
+
+        assert JWTAuth(creds, token_cache=cache).get_token() != "old"
+
+    def test_token_is_encrypted_at_rest(self, tmp_path: Path) -> None:
+        """Test the token never appears in plain text on disk."""
+        token = JWTAuth(self.make_creds(), token_cache=JWTTokenCache(tmp_path)).get_token()
+
+        for path in tmp_path.iterdir():
+            assert token.encode() not in path.read_bytes()
+
+
+class TestJWTAuthConcurrency:
+    """Tests for thread-safe token access and background refresh."""
+
+    def make_creds(self) -> JWTCredentials:
+        return JWTCredentials(
+            key_id="TEST123",
+            issuer_id="issuer-456",
+            private_key=TEST_PRIVATE_KEY,
+        )
+
+    def test_concurrent_callers_sign_once(self) -> None:
+        """Test threads racing on an empty token share one signature."""
+        auth = JWTAuth(self.make_creds())
+        original = auth._generate_token
+        calls: list[int] = []
+
+        def slow_generate() -> str:
+            calls.append(1)
+            time.sleep(0.05)
+            return original()
+
+        barrier = threading.Barrier(8)
+        tokens: list[str] = []
+
+        def worker() -> None:
+            barrier.wait()
+            tokens.append(auth.get_token())
+
+        with patch.object(auth, "_generate_token", side_effect=slow_generate):
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(calls) == 1
+        assert len(set(tokens)) == 1
+
+    def test_background_refresh_mints_next_token(self) -> None:
+        """Test the refresher replaces the token before callers need to."""
+
+        class ShortLivedJWTAuth(JWTAuth):
+            TOKEN_LIFETIME = 3
+            REFRESH_THRESHOLD = 1
+            BACKGROUND_REFRESH_LEAD = 1
+
+        auth = ShortLivedJWTAuth(self.make_creds())
+        first = auth.get_token()
+        auth.start_background_refresh()
+        try:
+            deadline = time.monotonic() + 5
+            while auth.get_token() == first and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert auth.get_token() != first
+        finally:
+            auth.stop_background_refresh()
+
+    def test_stop_background_refresh(self) -> None:
+        """Test the refresher thread exits when stopped."""
+        auth = JWTAuth(self.make_creds())
+        auth.start_background_refresh()
+        refresher = auth._refresher
+        auth.stop_background_refresh()
+
+        assert refresher is not None
+        assert not refresher.is_alive()
+
+
 class TestGetJWTAuth:
     """Tests for get_jwt_auth helper."""
 
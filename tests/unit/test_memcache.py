@@ -0,0 +1,155 @@
+"""Tests for the in-memory LRU/TTL response cache."""
+
+from __future__ import annotations
+
+import httpx
+
+from slowlane.asc.client import response_cache_for
+from slowlane.core.config import HttpConfig
+from slowlane.core.http import AppleHTTPClient
+from slowlane.core.memcache import ResponseCache, resource_types
+from tests.unit.clock import FakeClock
+
+BASE = "https://api.appstoreconnect.apple.com/v1"
+
+
+def ok(body: object = None) -> httpx.Response:
+    """Build a 200 JSON response."""
+    return httpx.Response(200, json=body or {})
+
+
+class TestResourceTypes:
+    """Tests for resource_types."""
+
+    def test_skips_ids_versions_and_relationships(self) -> None:
+        """Test only type segments are returned."""
+        assert resource_types(f"{BASE}/apps/1234567890") == ("apps",)
+        assert resource_types(f"{BASE}/betaGroups/a1b2-c3/relationships/betaTesters") == (
+            "betaGroups",
+            "betaTesters",
+        )
+        assert resource_types(f"{BASE}/bundleIds/ABCDE12345?include=app") == ("bundleIds",)
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_ttl_policies(self) -> None:
+        """Test entries expire per resource type and unlisted types are skipped."""
+        clock = FakeClock()
+        cache = ResponseCache(ttls={"apps": 300, "builds": 10}, clock=clock)
+        cache.put("id", f"{BASE}/apps/1", ok())
+        cache.put("id", f"{BASE}/builds/1", ok())
+        cache.put("id", f"{BASE}/betaTesters/1", ok())
+
+        clock.now = 11
+        assert cache.get("id", f"{BASE}/apps/1") is not None
+        assert cache.get("id", f"{BASE}/builds/1") is None
+        assert cache.get("id", f"{BASE}/betaTesters/1") is None
+        assert cache.stats.expirations == 1
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted at capacity."""
+        cache = ResponseCache(default_ttl=60, max_entries=2)
+        cache.put("id", f"{BASE}/apps/1", ok())
+        cache.put("id", f"{BASE}/apps/2", ok())
+        cache.get("id", f"{BASE}/apps/1")
+        cache.put("id", f"{BASE}/apps/3", ok())
+
+        assert cache.get("id", f"{BASE}/apps/2") is None
+        assert cache.get("id", f"{BASE}/apps/1") is not None
+        assert cache.stats.evictions == 1
+
+    def test_identities_are_isolated(self) -> None:
+        """Test one credential never sees another's responses."""
+        cache = ResponseCache(default_ttl=60)
+        cache.put("key-a", f"{BASE}/apps/1", ok())
+        assert cache.get("key-b", f"{BASE}/apps/1") is None
+
+    def test_invalidate_by_resource_type(self) -> None:
+        """Test a write drops entries sharing any of its resource types."""
+        cache = ResponseCache(default_ttl=60)
+        cache.put("id", f"{BASE}/betaGroups/1", ok())
+        cache.put("id", f"{BASE}/betaGroups/1/betaTesters", ok())
+        cache.put("id", f"{BASE}/apps/1", ok())
+
+        assert cache.invalidate(f"{BASE}/betaTesters") == 1
+        assert cache.get("id", f"{BASE}/betaGroups/1") is not None
+        assert cache.get("id", f"{BASE}/apps/1") is not None
+
+    def test_put_after_invalidation_is_dropped(self) -> None:
+        """Test responses fetched before a write do not repopulate the cache."""
+        cache = ResponseCache(default_ttl=60)
+        generation = cache.generation
+        cache.invalidate(f"{BASE}/apps/1")
+        cache.put("id", f"{BASE}/apps/1", ok(), generation)
+
+        assert len(cache) == 0
+
+
+class TestHTTPClientMemoryCache:
+    """Tests for the in-memory cache in AppleHTTPClient."""
+
+    def make_http(self, sent: list[httpx.Request]) -> AppleHTTPClient:
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return ok({"data": {"id": "1"}})
+
+        http = AppleHTTPClient(
+            config=HttpConfig(),
+            jwt_token="token",
+            memory_cache=ResponseCache(default_ttl=60),
+        )
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return http
+
+    def test_repeated_gets_are_served_from_memory(self) -> None:
+        """Test repeated reads of one resource send one request."""
+        sent: list[httpx.Request] = []
+        http = self.make_http(sent)
+
+        assert http.get_json(f"{BASE}/apps/1") == http.get_json(f"{BASE}/apps/1")
+        assert len(sent) == 1
+        assert http.memory_cache_stats is not None
+        assert http.memory_cache_stats.hits == 1
+
+    def test_writes_invalidate(self) -> None:
+        """Test a POST to a resource type forces the next GET to the network."""
+        sent: list[httpx.Request] = []
+        http = self.make_http(sent)
+
+        http.get(f"{BASE}/betaGroups/1")
+        http.post(f"{BASE}/betaGroups/1/relationships/betaTesters", json={})
+        http.get(f"{BASE}/betaGroups/1")
+
+        assert [r.method for r in sent] == ["GET", "POST", "GET"]
+
+    def test_custom_headers_bypass_cache(self) -> None:
+        """Test GETs with extra headers are not answered from memory."""
+        sent: list[httpx.Request] = []
+        http = self.make_http(sent)
+
+        http.get(f"{BASE}/apps/1", headers={"Accept": "text/csv"})
+        http.get(f"{BASE}/apps/1", headers={"Accept": "text/csv"})
+
+        assert len(sent) == 2
+
+
+class TestResponseCacheFor:
+    """Tests for the ASC cache configuration."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test no cache is built unless enabled."""
+        assert response_cache_for(HttpConfig()) is None
+
+    def test_config_overrides_default_ttls(self) -> None:
+        """Test configured TTLs override the built-in policies."""
+        cache = response_cache_for(
+            HttpConfig(memory_cache=True, memory_cache_ttls={"apps": 5, "devices": 30})
+        )
+
+        assert cache is not None
+        assert cache.ttl_for(f"{BASE}/apps/1") == 5
+        assert cache.ttl_for(f"{BASE}/devices") == 30
+        assert cache.ttl_for(f"{BASE}/bundleIds/1") == 300
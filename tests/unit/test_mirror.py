@@ -0,0 +1,198 @@
+"""Tests for the local App Store Connect mirror."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slowlane.asc.mirror import ResourceMirror, get_mirror_path
+from slowlane.cli.context import CLIContext
+from slowlane.cli.runner import run_command
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import ExitCode
+from tests.unit.clock import WALL_CLOCK_START, FakeClock
+
+
+def build(build_id: str, app_id: str, uploaded: str, state: str = "VALID") -> dict[str, Any]:
+    return {
+        "type": "builds",
+        "id": build_id,
+        "attributes": {"version": build_id, "uploadedDate": uploaded, "processingState": state},
+        "relationships": {"app": {"data": {"type": "apps", "id": app_id}}},
+    }
+
+
+def beta_tester(tester_id: str, email: str, app_ids: list[str]) -> dict[str, Any]:
+    return {
+        "type": "betaTesters",
+        "id": tester_id,
+        "attributes": {"email": email},
+        "relationships": {
+            "apps": {"data": [{"type": "apps", "id": app_id} for app_id in app_ids]},
+            "betaGroups": {"links": {"self": "..."}},
+        },
+    }
+
+
+class FakeClient:
+    """Serves canned listings and records how far each one was read."""
+
+    def __init__(self) -> None:
+        self.builds: list[dict[str, Any]] = []
+        self.testers: list[dict[str, Any]] = []
+        self.read: dict[str, int] = {}
+
+    def _serve(self, name: str, items: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        self.read[name] = 0
+        for item in items:
+            self.read[name] += 1
+            yield item
+
+    def iter_builds(self, app_id: str | None = None, **kwargs: Any) -> Iterator[dict[str, Any]]:
+        assert kwargs["sort"] == "-uploadedDate"
+        items = sorted(self.builds, key=lambda b: b["attributes"]["uploadedDate"], reverse=True)
+        return self._serve("builds", items)
+
+    def iter_beta_testers(
+        self, app_id: str | None = None, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        return self._serve("betaTesters", self.testers)
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    return FakeClient()
+
+
+@pytest.fixture
+def mirror(tmp_path: Path) -> ResourceMirror:
+    return ResourceMirror(tmp_path / "mirror.db", clock=FakeClock(WALL_CLOCK_START, step=1))
+
+
+class TestResourceMirror:
+    """Tests for ResourceMirror."""
+
+    def test_path_env_override(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test SLOWLANE_MIRROR_DB relocates the mirror."""
+        monkeypatch.setenv("SLOWLANE_MIRROR_DB", str(tmp_path / "m.db"))
+        assert get_mirror_path() == tmp_path / "m.db"
+
+    def test_builds_sync_incrementally(self, mirror: ResourceMirror, client: FakeClient) -> None:
+        """Test later syncs stop at the high-water mark but revisit processing builds."""
+        client.builds = [
+            build("1", "A", "2026-01-01T10:00:00-08:00"),
+            build("2", "A", "2026-01-02T10:00:00-08:00", state="PROCESSING"),
+            build("3", "B", "2026-01-03T10:00:00-08:00"),
+        ]
+        first = mirror.sync(client, "builds")  # type: ignore[arg-type]
+        assert (first.fetched, first.incremental) == (3, False)
+        assert first.high_water == "2026-01-02T18:00:00+00:00"
+
+        client.builds[1] = build("2", "A", "2026-01-02T10:00:00-08:00")
+        # Same instant in another UTC offset still sorts as the newest build
+        client.builds.append(build("4", "A", "2026-01-04T03:00:00+09:00"))
+        second = mirror.sync(client, "builds")  # type: ignore[arg-type]
+
+        assert (second.fetched, second.incremental) == (3, True)
+        assert client.read["builds"] == 4  # stopped at the first build below the mark
+        assert second.high_water == "2026-01-03T18:00:00+00:00"
+        builds = mirror.list_resources("builds", app_id="A")
+        assert [b["id"] for b in builds] == ["4", "2", "1"]
+        assert builds[1]["attributes"]["processingState"] == "VALID"
+
+        full = mirror.sync(client, "builds", full=True)  # type: ignore[arg-type]
+        assert (full.fetched, full.incremental) == (4, False)
+
+    def test_full_sync_sweeps_and_links(self, mirror: ResourceMirror, client: FakeClient) -> None:
+        """Test full listings drop vanished rows and scoped sweeps only unlink."""
+        client.testers = [
+            beta_tester("t1", "b@example.com", ["A"]),
+            beta_tester("t2", "a@example.com", ["A", "B"]),
+        ]
+        mirror.sync(client, "betaTesters")  # type: ignore[arg-type]
+        assert [t["id"] for t in mirror.list_resources("betaTesters")] == ["t2", "t1"]
+        stored = mirror.list_resources("betaTesters", app_id="B")[0]
+        assert stored["relationships"] == {
+            "apps": {"data": [{"type": "apps", "id": "A"}, {"type": "apps", "id": "B"}]}
+        }
+
+        # t2 left app B: a sync scoped to B unlinks it but keeps the tester
+        client.testers = []
+        assert mirror.sync(client, "betaTesters", app_id="B").removed == 1  # type: ignore[arg-type]
+        assert mirror.list_resources("betaTesters", app_id="B") == []
+        assert len(mirror.list_resources("betaTesters", app_id="A")) == 2
+
+        client.testers = [beta_tester("t1", "b@example.com", ["A"])]
+        assert mirror.sync(client, "betaTesters").removed == 1  # type: ignore[arg-type]
+        assert [t["id"] for t in mirror.list_resources("betaTesters", app_id="A")] == ["t1"]
+
+    def test_synced_at(self, mirror: ResourceMirror, client: FakeClient) -> None:
+        """Test unsynced types report None without creating the database."""
+        assert mirror.synced_at("builds") is None
+        assert not mirror.path.exists()
+        mirror.sync(client, "builds")  # type: ignore[arg-type]
+        assert mirror.synced_at("builds") is not None
+
+    def test_synced_at_is_scoped(self, mirror: ResourceMirror, client: FakeClient) -> None:
+        """Test an app-scoped sync only covers reads of that app."""
+        mirror.sync(client, "builds", app_id="A")  # type: ignore[arg-type]
+        assert mirror.synced_at("builds", "A") is not None
+        assert mirror.synced_at("builds", "B") is None
+        assert mirror.synced_at("builds") is None
+
+        mirror.sync(client, "builds")  # type: ignore[arg-type]
+        assert mirror.synced_at("builds", "B") is not None
+        assert mirror.synced_at("builds") is not None
+
+
+class TestCachedListing:
+    """Tests for --cached on list commands."""
+
+    @pytest.fixture
+    def context(self, mirror: ResourceMirror, monkeypatch: pytest.MonkeyPatch) -> CLIContext:
+        monkeypatch.setenv("SLOWLANE_MIRROR_DB", str(mirror.path))
+        return CLIContext(config=SlowlaneConfig())
+
+    def test_reads_mirror(
+        self, context: CLIContext, mirror: ResourceMirror, client: FakeClient
+    ) -> None:
+        """Test --cached answers from the mirror without any API client."""
+        client.builds = [
+            build("1", "A", "2026-01-01T00:00:00Z"),
+            build("2", "B", "2026-01-02T00:00:00Z"),
+        ]
+        mirror.sync(client, "builds")  # type: ignore[arg-type]
+
+        result = run_command(
+            ["asc", "builds", "list", "--cached", "--app", "A", "-o", "tsv"], context
+        )
+        assert result.exit_code == 0
+        assert result.stdout.splitlines()[1].split("\t")[:2] == ["1", "1"]
+        assert len(result.stdout.splitlines()) == 2
+
+    def test_app_sync_does_not_cover_unscoped_reads(
+        self, context: CLIContext, mirror: ResourceMirror, client: FakeClient
+    ) -> None:
+        """Test --cached without --app refuses a mirror synced for one app only."""
+        client.builds = [build("1", "A", "2026-01-01T00:00:00Z")]
+        mirror.sync(client, "builds", app_id="A")  # type: ignore[arg-type]
+
+        result = run_command(["asc", "builds", "list", "--cached"], context)
+        assert result.exit_code == ExitCode.GENERAL_ERROR
+        assert "run `slowlane asc sync` first" in result.stdout
+
+        result = run_command(["asc", "builds", "list", "--cached", "--app", "B"], context)
+        assert result.exit_code == ExitCode.GENERAL_ERROR
+        assert "asc sync --app B" in result.stdout
+
+        result = run_command(["asc", "builds", "list", "--cached", "--app", "A"], context)
+        assert result.exit_code == 0
+
+    def test_requires_sync(self, context: CLIContext) -> None:
+        """Test --cached fails with a hint before the first sync."""
+        result = run_command(["asc", "apps", "list", "--cached"], context)
+        assert result.exit_code == ExitCode.GENERAL_ERROR
+        assert "asc sync" in result.stdout
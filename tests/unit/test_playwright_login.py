@@ -0,0 +1,170 @@
+"""Tests for the Playwright login flow, driven by fake page events."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import stat
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slowlane.auth.playwright_login import PlaywrightLoginFlow
+from slowlane.core.errors import SessionError
+
+
+class FakeFrame:
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+
+class FakePage:
+    """Records listeners and lets tests fire page events."""
+
+    def __init__(self, url: str = "https://idmsa.apple.com/appleauth/auth/signin") -> None:
+        self.main_frame = FakeFrame(url)
+        self.listeners: dict[str, list[Any]] = {}
+
+    @property
+    def url(self) -> str:
+        return self.main_frame.url
+
+    def on(self, event: str, handler: Any) -> None:
+        self.listeners.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event: str, handler: Any) -> None:
+        self.listeners[event].remove(handler)
+
+    async def emit(self, event: str, arg: Any) -> None:
+        for handler in list(self.listeners.get(event, [])):
+            result = handler(arg)
+            if asyncio.iscoroutine(result):
+                await result
+
+    async def wait_for_load_state(self, state: str, timeout: float) -> None:
+        return None
+
+
+class FakeResponse:
+    def __init__(self, set_cookie: str | None) -> None:
+        self._set_cookie = set_cookie
+
+    async def header_value(self, name: str) -> str | None:
+        return self._set_cookie if name == "set-cookie" else None
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str) -> None:
+        self.request = type("Request", (), {"url": url, "resource_type": resource_type})()
+        self.outcome = ""
+
+    async def abort(self) -> None:
+        self.outcome = "aborted"
+
+    async def continue_(self) -> None:
+        self.outcome = "continued"
+
+
+async def wait_in_background(flow: PlaywrightLoginFlow, page: FakePage) -> asyncio.Task[None]:
+    task = asyncio.create_task(flow._wait_for_login_completion(page, None))
+    await asyncio.sleep(0)
+    return task
+
+
+class TestLoginCompletion:
+    """Tests for event-driven login detection."""
+
+    async def test_completes_on_navigation(self) -> None:
+        """Test reaching App Store Connect completes the login."""
+        page = FakePage()
+        task = await wait_in_background(PlaywrightLoginFlow(), page)
+
+        page.main_frame.url = "https://appstoreconnect.apple.com/apps"
+        await page.emit("framenavigated", page.main_frame)
+
+        await asyncio.wait_for(task, timeout=1)
+        assert page.listeners == {"framenavigated": [], "response": []}
+
+    async def test_session_cookie_waits_for_navigation(self) -> None:
+        """Test the myacinfo cookie mid-redirect waits for the landing page."""
+        page = FakePage()
+        task = await wait_in_background(PlaywrightLoginFlow(), page)
+
+        await page.emit("response", FakeResponse("dslang=US; Path=/"))
+        await page.emit("response", FakeResponse("myacinfo=abc; Domain=apple.com"))
+        await asyncio.sleep(0.01)
+        assert not task.done()
+
+        page.main_frame.url = "https://appstoreconnect.apple.com/apps"
+        await page.emit("framenavigated", page.main_frame)
+
+        await asyncio.wait_for(task, timeout=1)
+        assert page.listeners == {"framenavigated": [], "response": []}
+
+    async def test_session_cookie_without_navigation(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the login still completes when no navigation follows the cookie."""
+        monkeypatch.setattr(PlaywrightLoginFlow, "SETTLE_TIMEOUT_MS", 10)
+        page = FakePage()
+        task = await wait_in_background(PlaywrightLoginFlow(), page)
+
+        await page.emit("response", FakeResponse("myacinfo=abc; Domain=apple.com"))
+
+        await asyncio.wait_for(task, timeout=1)
+
+    async def test_already_signed_in(self) -> None:
+        """Test a restored profile that lands on the target completes at once."""
+        page = FakePage("https://appstoreconnect.apple.com/")
+        await asyncio.wait_for(PlaywrightLoginFlow()._wait_for_login_completion(page, None), 1)
+
+    async def test_timeout(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a login that never completes raises SessionError."""
+        monkeypatch.setattr(PlaywrightLoginFlow, "LOGIN_TIMEOUT_MS", 10)
+        with pytest.raises(SessionError, match="timed out"):
+            await PlaywrightLoginFlow()._wait_for_login_completion(FakePage(), None)
+
+
+class TestResourceBlocking:
+    """Tests for request interception."""
+
+    @pytest.mark.parametrize(
+        ("url", "resource_type", "outcome"),
+        [
+            ("https://idmsa.apple.com/appleauth/auth/signin", "document", "continued"),
+            ("https://idmsa.apple.com/app.js", "script", "continued"),
+            ("https://www.apple.com/logo.png", "image", "aborted"),
+            ("https://www.apple.com/sf-pro.woff2", "font", "aborted"),
+            ("https://xp.apple.com/report", "xhr", "aborted"),
+        ],
+    )
+    async def test_route(self, url: str, resource_type: str, outcome: str) -> None:
+        """Test non-essential requests are aborted."""
+        route = FakeRoute(url, resource_type)
+        await PlaywrightLoginFlow()._route_request(route)
+        assert route.outcome == outcome
+
+
+class TestBrowserProfile:
+    """Tests for the persisted storage state."""
+
+    async def test_saved_privately_and_reloaded(self, tmp_path: Path) -> None:
+        """Test the state is written with owner-only permissions and read back."""
+        path = tmp_path / "browser" / "appstoreconnect.json"
+        flow = PlaywrightLoginFlow(storage_state_path=path)
+
+        class FakeContext:
+            async def storage_state(self) -> dict[str, Any]:
+                return {"cookies": [{"name": "myacinfo", "value": "abc"}], "origins": []}
+
+        assert flow._load_storage_state() is None
+        await flow._save_storage_state(FakeContext())
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert flow._load_storage_state() == str(path)
+        assert json.loads(path.read_text())["cookies"][0]["name"] == "myacinfo"
+
+    def test_corrupt_state_ignored(self, tmp_path: Path) -> None:
+        """Test an unreadable state file starts a fresh context."""
+        path = tmp_path / "state.json"
+        path.write_text("{not json")
+        assert PlaywrightLoginFlow(storage_state_path=path)._load_storage_state() is None
@@ -0,0 +1,104 @@
+"""Tests for read-ahead iteration helpers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from slowlane.core.prefetch import async_read_ahead, read_ahead
+
+
+class TestReadAhead:
+    """Tests for the threaded read_ahead helper."""
+
+    def test_preserves_order(self) -> None:
+        """Test items arrive in order with read-ahead enabled."""
+        assert list(read_ahead(iter(range(10)), depth=2)) == list(range(10))
+
+    def test_depth_zero_is_passthrough(self) -> None:
+        """Test depth 0 consumes the source on the caller's thread."""
+        threads: list[str] = []
+
+        def source() -> Iterator[int]:
+            threads.append(threading.current_thread().name)
+            yield 1
+
+        assert list(read_ahead(source(), depth=0)) == [1]
+        assert threads == [threading.current_thread().name]
+
+    def test_fetches_ahead_of_consumer(self) -> None:
+        """Test the next item is produced while the current one is processed."""
+        produced: list[int] = []
+
+        def source() -> Iterator[int]:
+            for i in range(3):
+                produced.append(i)
+                yield i
+
+        items = read_ahead(source(), depth=1)
+        assert next(items) == 0
+
+        deadline = time.monotonic() + 2
+        while len(produced) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert produced[:2] == [0, 1]
+        assert list(items) == [1, 2]
+
+    def test_propagates_errors(self) -> None:
+        """Test producer exceptions are re-raised to the consumer."""
+
+        def source() -> Iterator[int]:
+            yield 1
+            raise ValueError("boom")
+
+        items = read_ahead(source(), depth=2)
+        assert next(items) == 1
+        with pytest.raises(ValueError, match="boom"):
+            next(items)
+
+    def test_early_close_stops_producer(self) -> None:
+        """Test closing the consumer stops the background producer."""
+        closed = threading.Event()
+
+        def source() -> Iterator[int]:
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        items = read_ahead(source(), depth=2)
+        assert next(items) == 0
+        items.close()  # type: ignore[attr-defined]
+
+        assert closed.wait(timeout=2)
+
+
+class TestAsyncReadAhead:
+    """Tests for the asyncio read-ahead helper."""
+
+    async def test_preserves_order(self) -> None:
+        """Test items arrive in order with read-ahead enabled."""
+
+        async def source() -> AsyncIterator[int]:
+            for i in range(5):
+                yield i
+
+        assert [i async for i in async_read_ahead(source(), depth=2)] == list(range(5))
+
+    async def test_propagates_errors(self) -> None:
+        """Test producer exceptions are re-raised to the consumer."""
+
+        async def source() -> AsyncIterator[int]:
+            yield 1
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            async for _ in async_read_ahead(source(), depth=1):
+                pass
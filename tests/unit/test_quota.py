@@ -0,0 +1,145 @@
+"""Tests for the cross-process quota ledger."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import QuotaLedgerError
+from slowlane.core.http import AsyncAppleHTTPClient
+from slowlane.core.quota import QuotaLedger, get_ledger_path, read_ledger
+from slowlane.core.ratelimit import RateLimitStatus
+from tests.unit.clock import WALL_CLOCK_START, FakeClock
+
+
+def headers(limit: int, remaining: int) -> dict[str, str]:
+    """Build an X-Rate-Limit header mapping."""
+    return {"X-Rate-Limit": f"user-hour-lim:{limit};user-hour-rem:{remaining};"}
+
+
+class TestQuotaLedger:
+    """Tests for QuotaLedger."""
+
+    def test_ledger_path_env_override(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test SLOWLANE_QUOTA_DB points the ledger at a shared volume."""
+        monkeypatch.setenv("SLOWLANE_QUOTA_DB", str(tmp_path / "shared.db"))
+        assert get_ledger_path() == tmp_path / "shared.db"
+
+    def test_instances_share_budget(self, tmp_path: Path) -> None:
+        """Test separate ledgers on one file see each other's reservations."""
+        clock = FakeClock(WALL_CLOCK_START)
+        path = tmp_path / "quota.db"
+        runner_a = QuotaLedger("KEY", path=path, clock=clock)
+        runner_b = QuotaLedger("KEY", path=path, clock=clock)
+
+        runner_a.update(headers(3600, 2))
+
+        assert runner_a.acquire() == 0
+        assert runner_b.acquire() == 0
+        assert runner_a.acquire() == pytest.approx(1.0)
+        assert runner_b.status == RateLimitStatus(limit=3600, remaining=0)
+
+    def test_keys_are_independent(self, tmp_path: Path) -> None:
+        """Test budgets are tracked per API key."""
+        clock = FakeClock(WALL_CLOCK_START)
+        path = tmp_path / "quota.db"
+        QuotaLedger("KEY-A", path=path, clock=clock).update(headers(3600, 0))
+
+        assert QuotaLedger("KEY-B", path=path, clock=clock).acquire() == 0
+
+    def test_concurrent_reservations_are_serialized(self, tmp_path: Path) -> None:
+        """Test concurrent writers never hand out the same token twice."""
+        clock = FakeClock(WALL_CLOCK_START)
+        path = tmp_path / "quota.db"
+        QuotaLedger("KEY", path=path, clock=clock).update(headers(3600, 10))
+        delays: list[float] = []
+
+        def reserve() -> None:
+            ledger = QuotaLedger("KEY", path=path, clock=clock)
+            for _ in range(5):
+                delays.append(ledger.acquire())
+
+        workers = [threading.Thread(target=reserve) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert sorted(delays)[:10] == [0.0] * 10
+        assert sorted(delays)[10:] == pytest.approx([float(i) for i in range(1, 11)])
+
+    def test_failed_update_rolls_back(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a SQLite failure is wrapped and leaves the ledger usable."""
+        ledger = QuotaLedger("KEY", path=tmp_path / "quota.db", clock=FakeClock(WALL_CLOCK_START))
+        ledger.update(headers(3600, 5))
+
+        def fail(bucket: object) -> None:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(ledger, "_save", fail)
+        with pytest.raises(QuotaLedgerError, match="disk I/O error"):
+            ledger.acquire()
+
+        monkeypatch.undo()
+        assert ledger.status == RateLimitStatus(limit=3600, remaining=5)
+        assert ledger.acquire() == 0
+
+    def test_unreadable_ledger(self, tmp_path: Path) -> None:
+        """Test a file that is not a database raises QuotaLedgerError."""
+        path = tmp_path / "quota.db"
+        path.write_bytes(b"not a database" * 100)
+
+        with pytest.raises(QuotaLedgerError):
+            QuotaLedger("KEY", path=path)
+
+    async def test_async_client_waits_for_ledger_off_loop(self, tmp_path: Path) -> None:
+        """Test a ledger locked by another process does not stall the event loop."""
+        path = tmp_path / "quota.db"
+        ledger = QuotaLedger("KEY", path=path, clock=FakeClock(WALL_CLOCK_START))
+        http = AsyncAppleHTTPClient(config=HttpConfig(), rate_limiter=ledger)
+        http._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200))
+        )
+        other_process = sqlite3.connect(path, isolation_level=None)
+        other_process.execute("BEGIN IMMEDIATE")
+        ticks = 0
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+            other_process.execute("COMMIT")
+
+        response, _ = await asyncio.gather(http.get("https://example.com"), heartbeat())
+
+        assert response.status_code == 200
+        assert ticks == 5
+        other_process.close()
+        await http.close()
+
+    def test_read_ledger(self, tmp_path: Path) -> None:
+        """Test the ledger can be listed for reporting."""
+        clock = FakeClock(WALL_CLOCK_START)
+        path = tmp_path / "quota.db"
+        QuotaLedger("KEY", path=path, clock=clock).update(headers(3600, 100))
+
+        [entry] = read_ledger(path, now=clock.now + 30)
+
+        assert entry.identity == "KEY"
+        assert entry.limit == 3600
+        assert entry.remaining == 130
+
+    def test_read_missing_ledger(self, tmp_path: Path) -> None:
+        """Test a missing ledger is reported as empty."""
+        assert read_ledger(tmp_path / "missing.db") == []
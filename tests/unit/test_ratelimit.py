@@ -0,0 +1,143 @@
+"""Tests for X-Rate-Limit parsing and token-bucket pacing."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import RateLimitError
+from slowlane.core.http import AppleHTTPClient
+from slowlane.core.ratelimit import (
+    RateLimiter,
+    RateLimitStatus,
+    get_rate_limiter,
+    parse_rate_limit_header,
+)
+from tests.unit.clock import FakeClock
+
+
+def headers(limit: int, remaining: int) -> dict[str, str]:
+    """Build an X-Rate-Limit header mapping."""
+    return {"X-Rate-Limit": f"user-hour-lim:{limit};user-hour-rem:{remaining};"}
+
+
+class TestParseRateLimitHeader:
+    """Tests for parse_rate_limit_header."""
+
+    def test_parses_apple_format(self) -> None:
+        """Test the documented header format."""
+        status = parse_rate_limit_header("user-hour-lim:3500;user-hour-rem:3499;")
+        assert status == RateLimitStatus(limit=3500, remaining=3499)
+
+    @pytest.mark.parametrize("value", [None, "", "garbage", "user-hour-lim:3500;"])
+    def test_incomplete_header(self, value: str | None) -> None:
+        """Test missing or partial headers are ignored."""
+        assert parse_rate_limit_header(value) is None
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_inactive_until_first_header(self) -> None:
+        """Test requests are not paced before the budget is known."""
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        assert limiter.acquire() == 0
+        assert limiter.status is None
+
+    def test_paces_when_budget_runs_out(self) -> None:
+        """Test callers queue at the refill rate once tokens are exhausted."""
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        limiter.update(headers(3600, 1))  # refills one token per second
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == pytest.approx(1.0)
+        assert limiter.acquire() == pytest.approx(2.0)
+
+    def test_refills_over_time(self) -> None:
+        """Test tokens are earned back as time passes."""
+        clock = FakeClock(1000.0)
+        limiter = RateLimiter(clock=clock)
+        limiter.update(headers(3600, 0))
+
+        clock.now += 10
+        assert limiter.status == RateLimitStatus(limit=3600, remaining=10)
+
+    def test_server_remaining_caps_local_estimate(self) -> None:
+        """Test the server's remaining count wins when it is lower."""
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        limiter.update(headers(3600, 100))
+        limiter.update(headers(3600, 5))
+
+        assert limiter.status == RateLimitStatus(limit=3600, remaining=5)
+
+    def test_on_rate_limited_exhausts_budget(self) -> None:
+        """Test a 429 drops the balance so the next request waits."""
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        limiter.update(headers(3600, 50))
+        limiter.on_rate_limited()
+
+        assert limiter.acquire() == pytest.approx(1.0)
+
+    def test_registry_shares_per_identity(self) -> None:
+        """Test clients using the same key share one limiter."""
+        assert get_rate_limiter("KEY-A") is get_rate_limiter("KEY-A")
+        assert get_rate_limiter("KEY-A") is not get_rate_limiter("KEY-B")
+
+
+class TestHTTPClientRateLimiting:
+    """Tests for rate limiting in AppleHTTPClient."""
+
+    def make_http(self, handler: object, limiter: RateLimiter, **config: object) -> AppleHTTPClient:
+        http = AppleHTTPClient(
+            config=HttpConfig(backoff_factor=0, **config),  # type: ignore[arg-type]
+            rate_limiter=limiter,
+        )
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+        return http
+
+    def test_updates_limiter_from_responses(self) -> None:
+        """Test response headers feed the shared limiter."""
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        http = self.make_http(
+            lambda request: httpx.Response(200, headers=headers(3500, 42)), limiter
+        )
+
+        http.get("https://example.com")
+
+        assert limiter.status == RateLimitStatus(limit=3500, remaining=42)
+
+    def test_sleeps_before_request_when_paced(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the client waits out the limiter's delay before sending."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("slowlane.core.http.time.sleep", sleeps.append)
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        limiter.update(headers(3600, 0))
+        http = self.make_http(lambda request: httpx.Response(200), limiter)
+
+        http.get("https://example.com")
+
+        assert sleeps == [pytest.approx(1.0)]
+
+    def test_429_without_retry_after_uses_limiter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a bare 429 is retried on the limiter's schedule, not a flat minute."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("slowlane.core.http.time.sleep", sleeps.append)
+        responses = iter([httpx.Response(429, headers=headers(3600, 0)), httpx.Response(200)])
+        http = self.make_http(lambda request: next(responses), RateLimiter(clock=FakeClock(1000.0)))
+
+        assert http.get("https://example.com").status_code == 200
+        assert 60 not in sleeps
+        assert sleeps[-1] == pytest.approx(1.0)
+
+    def test_disabled_by_config(self) -> None:
+        """Test http.rate_limit = false bypasses the limiter."""
+        limiter = RateLimiter(clock=FakeClock(1000.0))
+        http = self.make_http(
+            lambda request: httpx.Response(429), limiter, rate_limit=False, max_retries=0
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            http.get("https://example.com")
+
+        assert exc_info.value.retry_after == 60
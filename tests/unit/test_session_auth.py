@@ -0,0 +1,104 @@
+"""Tests for session authentication and keep-alive."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from slowlane.auth.session_auth import KEEPALIVE_URL, SessionAuth, refresh_session
+from slowlane.core.config import HttpConfig
+from slowlane.core.errors import AuthExpiredError
+from slowlane.core.http import AppleHTTPClient
+from slowlane.core.secrets import SessionData
+
+
+def make_session(**overrides: object) -> SessionData:
+    data = SessionData(
+        cookies={"myacinfo": "old", "DES": "des", "other": "keep"},
+        email_hash="abc123",
+        created_at=datetime.now(UTC) - timedelta(days=10),
+    )
+    for name, value in overrides.items():
+        setattr(data, name, value)
+    return data
+
+
+def make_http(handler: object) -> AppleHTTPClient:
+    http = AppleHTTPClient(config=HttpConfig(max_retries=0))
+    http._client = httpx.Client(transport=httpx.MockTransport(handler))  # type: ignore[arg-type]
+    return http
+
+
+class TestIsStale:
+    """Tests for SessionAuth.is_stale."""
+
+    def test_old_unverified_session_is_stale(self) -> None:
+        """Test age counts from creation when never verified."""
+        assert SessionAuth(make_session()).is_stale
+
+    def test_recent_keepalive_keeps_session_fresh(self) -> None:
+        """Test a recent verification resets the staleness clock."""
+        session = make_session(verified_at=datetime.now(UTC) - timedelta(hours=1))
+        assert not SessionAuth(session).is_stale
+
+
+class TestRefreshSession:
+    """Tests for refresh_session."""
+
+    def test_rotated_cookies_are_kept(self) -> None:
+        """Test rotated cookies replace stored ones and verified_at is set."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200,
+                json={},
+                headers=[
+                    ("Set-Cookie", "myacinfo=new; Path=/"),
+                    ("Set-Cookie", "itctx=ctx; Path=/"),
+                    ("Set-Cookie", "tracking=ignored; Path=/"),
+                ],
+            )
+
+        before = datetime.now(UTC)
+        refreshed = refresh_session(make_session(), http=make_http(handler))
+
+        assert str(seen[0].url) == KEEPALIVE_URL
+        assert "myacinfo=old" in seen[0].headers["Cookie"]
+        assert refreshed.cookies == {
+            "myacinfo": "new",
+            "DES": "des",
+            "other": "keep",
+            "itctx": "ctx",
+        }
+        assert refreshed.verified_at is not None and refreshed.verified_at >= before
+        assert refreshed.email_hash == "abc123"
+
+    def test_cookies_rotated_on_redirect_are_kept(self) -> None:
+        """Test cookies set by a redirect before the final response are saved."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == KEEPALIVE_URL:
+                return httpx.Response(
+                    302,
+                    headers=[
+                        ("Location", KEEPALIVE_URL + "?renewed=1"),
+                        ("Set-Cookie", "myacinfo=new; Path=/"),
+                    ],
+                )
+            return httpx.Response(200, json={})
+
+        http = AppleHTTPClient(config=HttpConfig(max_retries=0))
+        http._client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+        refreshed = refresh_session(make_session(), http=http)
+
+        assert refreshed.cookies["myacinfo"] == "new"
+
+    def test_expired_session_raises(self) -> None:
+        """Test a rejected session raises AuthExpiredError."""
+        http = make_http(lambda request: httpx.Response(401))
+        with pytest.raises(AuthExpiredError):
+            refresh_session(make_session(), http=http)
@@ -0,0 +1,173 @@
+"""Tests for single-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from slowlane.core.config import HttpConfig
+from slowlane.core.http import AppleHTTPClient, AsyncAppleHTTPClient
+from slowlane.core.singleflight import AsyncSingleFlight, SingleFlight
+
+URL = "https://api.appstoreconnect.apple.com/v1/apps/123"
+
+
+def wait_for(condition: object, timeout: float = 2.0) -> None:
+    """Poll until ``condition()`` is true."""
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:  # type: ignore[operator]
+        time.sleep(0.005)
+
+
+class TestSingleFlight:
+    """Tests for the threaded SingleFlight group."""
+
+    def test_concurrent_callers_share_one_call(self) -> None:
+        """Test callers arriving while a call is in flight get its result."""
+        group: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+        runs: list[int] = []
+
+        def fn() -> int:
+            runs.append(1)
+            release.wait(timeout=2)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(group.do, "key", fn) for _ in range(5)]
+            wait_for(lambda: group.stats.calls == 5)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert results == [42] * 5
+        assert len(runs) == 1
+        assert group.stats.shared == 4
+
+    def test_errors_are_shared(self) -> None:
+        """Test followers receive the leader's exception."""
+        group: SingleFlight[int] = SingleFlight()
+        release = threading.Event()
+
+        def fn() -> int:
+            release.wait(timeout=2)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(group.do, "key", fn) for _ in range(2)]
+            wait_for(lambda: group.stats.calls == 2)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="boom"):
+                    future.result()
+
+    def test_sequential_calls_run_again(self) -> None:
+        """Test results are not cached once the call has finished."""
+        group: SingleFlight[int] = SingleFlight()
+        assert group.do("key", lambda: 1) == 1
+        assert group.do("key", lambda: 2) == 2
+        assert group.stats.shared == 0
+
+
+class TestAsyncSingleFlight:
+    """Tests for AsyncSingleFlight."""
+
+    async def test_gathered_callers_share_one_call(self) -> None:
+        """Test concurrent tasks await the same call."""
+        group: AsyncSingleFlight[int] = AsyncSingleFlight()
+        runs: list[int] = []
+
+        async def fn() -> int:
+            runs.append(1)
+            await asyncio.sleep(0.01)
+            return 7
+
+        results = await asyncio.gather(*(group.do("key", fn) for _ in range(4)))
+
+        assert results == [7] * 4
+        assert len(runs) == 1
+        assert group.stats.shared == 3
+
+    async def test_leader_cancellation_does_not_cancel_followers(self) -> None:
+        """Test the shared call survives its starter being cancelled."""
+        group: AsyncSingleFlight[int] = AsyncSingleFlight()
+
+        async def fn() -> int:
+            await asyncio.sleep(0.02)
+            return 7
+
+        leader = asyncio.create_task(group.do("key", fn))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(group.do("key", fn))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == 7
+
+
+class TestHTTPClientCoalescing:
+    """Tests for coalesced GETs in the HTTP clients."""
+
+    def test_identical_gets_share_a_request(self) -> None:
+        """Test concurrent identical GETs from threads send one request."""
+        http = AppleHTTPClient(config=HttpConfig())
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            wait_for(lambda: http.coalescing_stats.calls == 4)
+            return httpx.Response(200, json={"data": {"id": "123"}})
+
+        http._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: http.get_json(URL), range(4)))
+
+        assert results == [{"data": {"id": "123"}}] * 4
+        assert len(sent) == 1
+        assert http.coalescing_stats.shared == 3
+
+    def test_different_params_are_not_coalesced(self) -> None:
+        """Test GETs for different queries each send a request."""
+        http = AppleHTTPClient(config=HttpConfig())
+        http._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        )
+
+        http.get(URL, params={"include": "builds"})
+        http.get(URL)
+
+        assert http.coalescing_stats.executed == 2
+
+    def test_disabled_by_config(self) -> None:
+        """Test http.coalesce_requests = false bypasses the group."""
+        http = AppleHTTPClient(config=HttpConfig(coalesce_requests=False))
+        http._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={}))
+        )
+
+        http.get(URL)
+
+        assert http.coalescing_stats.calls == 0
+
+    async def test_async_gather_shares_a_request(self) -> None:
+        """Test asyncio.gather-ed identical GETs send one request."""
+        sent: list[httpx.Request] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"ok": True})
+
+        http = AsyncAppleHTTPClient(config=HttpConfig())
+        http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await asyncio.gather(*(http.get_json(URL) for _ in range(3)))
+
+        assert results == [{"ok": True}] * 3
+        assert len(sent) == 1
+        assert http.coalescing_stats.shared == 2
@@ -0,0 +1,187 @@
+"""Tests for bulk TestFlight tester import."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from slowlane.asc.tester_import import (
+    ImportProgress,
+    InviteOutcome,
+    import_testers,
+    read_tester_rows,
+)
+from slowlane.cli.context import CLIContext
+from slowlane.cli.runner import run_command
+from slowlane.core.config import SlowlaneConfig
+from slowlane.core.errors import AuthExpiredError, SlowlaneError
+
+
+class FakeClient:
+    """A beta group that invites succeed into, with scripted failures."""
+
+    def __init__(self, members: list[str]) -> None:
+        self.members = list(members)
+        self.invited: list[str] = []
+        self.listings = 0
+        self.fail = {"bad@example.com"}
+        self.expire: set[str] = set()
+        self._lock = threading.Lock()
+
+    def iter_beta_testers(
+        self, group_id: str | None = None, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        assert group_id == "G"
+        self.listings += 1
+        for email in list(self.members):
+            yield {"type": "betaTesters", "id": email, "attributes": {"email": email}}
+
+    def invite_beta_tester(self, email: str, group_id: str, **kwargs: Any) -> dict[str, Any]:
+        if email in self.expire:
+            self.expire.discard(email)
+            raise AuthExpiredError()
+        if email in self.fail:
+            raise SlowlaneError("Rejected", email=email)
+        with self._lock:
+            self.invited.append(email)
+            self.members.append(email)
+        return {"id": f"id-{email}"}
+
+
+def ndjson(emails: list[str]) -> list[str]:
+    return [json.dumps({"email": email}) + "\n" for email in emails]
+
+
+class TestReadImportRows:
+    """Tests for read_tester_rows."""
+
+    def test_csv_headers(self) -> None:
+        """Test common header spellings map to tester fields."""
+        text = "Email,First Name,last_name\na@example.com,Ann,Lee\nnot-an-email,,\n"
+        rows = list(read_tester_rows(io.StringIO(text), "csv"))
+        assert (rows[0].email, rows[0].first_name, rows[0].last_name) == (
+            "a@example.com",
+            "Ann",
+            "Lee",
+        )
+        assert rows[1].index == 2
+        assert rows[1].error is not None
+
+    def test_ndjson(self) -> None:
+        """Test NDJSON records, blank lines and bad records."""
+        lines = ['{"email": "a@example.com", "firstName": "Ann"}\n', "\n", "oops\n", "[1]\n"]
+        rows = list(read_tester_rows(lines, "ndjson"))
+        assert [row.index for row in rows] == [1, 2, 3]
+        assert rows[0].first_name == "Ann"
+        assert "Invalid JSON" in (rows[1].error or "")
+        assert "JSON object" in (rows[2].error or "")
+
+
+class TestImportTesters:
+    """Tests for import_testers."""
+
+    @pytest.fixture
+    def progress(self, tmp_path: Path) -> ImportProgress:
+        source = tmp_path / "testers.ndjson"
+        source.write_text("x")
+        return ImportProgress.for_source(source, "G", directory=tmp_path / "imports")
+
+    def test_dedupes_and_reports(self, progress: ImportProgress) -> None:
+        """Test existing, repeated, invalid and failed rows are told apart."""
+        client = FakeClient(members=["Old@Example.com"])
+        emails = ["new@example.com", "old@example.com", "NEW@example.com", "bad@example.com"]
+        outcomes: list[InviteOutcome] = []
+
+        summary = import_testers(
+            client,  # type: ignore[arg-type]
+            read_tester_rows([*ndjson(emails), "{}\n"], "ndjson"),
+            "G",
+            progress,
+            workers=4,
+            emit=outcomes.append,
+        )
+
+        assert [outcome.status for outcome in outcomes] == [
+            "invited",
+            "existing",
+            "duplicate",
+            "failed",
+            "invalid",
+        ]
+        assert client.invited == ["new@example.com"]
+        assert client.listings == 1
+        assert summary.counts["invited"] == 1
+        assert [failure.index for failure in summary.failures] == [4, 5]
+        assert progress.row == 5
+
+    def test_dry_run(self, progress: ImportProgress) -> None:
+        """Test a dry run invites nobody and saves no progress."""
+        client = FakeClient(members=[])
+        summary = import_testers(
+            client,  # type: ignore[arg-type]
+            read_tester_rows(ndjson(["a@example.com"]), "ndjson"),
+            "G",
+            progress,
+            workers=2,
+            dry_run=True,
+        )
+        assert summary.counts == {"pending": 1}
+        assert client.invited == []
+        assert not progress.path.exists()
+
+    def test_resumes_after_interruption(self, progress: ImportProgress, tmp_path: Path) -> None:
+        """Test an import stopped by expired auth picks up where it left off."""
+        client = FakeClient(members=[])
+        client.expire = {"t60@example.com"}
+        emails = [f"t{i}@example.com" for i in range(1, 101)]
+
+        with pytest.raises(AuthExpiredError):
+            import_testers(
+                client,  # type: ignore[arg-type]
+                read_tester_rows(ndjson(emails), "ndjson"),
+                "G",
+                progress,
+                workers=1,
+            )
+        checkpoint = ImportProgress.for_source(
+            tmp_path / "testers.ndjson", "G", directory=tmp_path / "imports"
+        )
+        assert checkpoint.row == 59
+
+        summary = import_testers(
+            client,  # type: ignore[arg-type]
+            read_tester_rows(ndjson(emails), "ndjson"),
+            "G",
+            checkpoint,
+            workers=4,
+        )
+        assert summary.resumed_after == 59
+        assert sorted(client.invited) == sorted(emails)
+        assert len(client.invited) == len(set(client.invited))
+
+
+class TestImportCommand:
+    """Tests for `asc testflight import`."""
+
+    def test_import_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the command imports a CSV and clears its progress when done."""
+        monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+        source = tmp_path / "testers.csv"
+        source.write_text("email,first_name\na@example.com,Ann\nbad@example.com,\n")
+        client = FakeClient(members=[])
+        context = CLIContext(config=SlowlaneConfig())
+        context.asc_client = client  # type: ignore[assignment]
+
+        result = run_command(["asc", "testflight", "import", str(source), "--group", "G"], context)
+
+        assert result.exit_code == 1
+        assert "Invited 1 tester(s)" in result.stdout
+        assert "Row 2 bad@example.com" in result.stdout
+        assert client.invited == ["a@example.com"]
+        assert not list((tmp_path / "data").rglob("testers-*.json"))